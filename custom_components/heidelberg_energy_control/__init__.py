@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import PLATFORMS
+from .const import CONF_PIPELINED, PLATFORMS
 from .coordinator import HeidelbergEnergyControlCoordinator
 from .core.api import HeidelbergEnergyControlAPI
 from .core.exceptions import (
     HeidelbergEnergyControlConnectionError,
     HeidelbergEnergyControlReadError,
 )
+from .device_cache import DeviceCache
+from .energy_ledger import EnergyLedger, async_adopt_legacy_attributes
+from .last_data import LastDataStore
+from .setup_handoff import async_claim
 
 # _LOGGER = logging.getLogger(__name__)
 
@@ -30,12 +35,69 @@ async def async_setup_entry(
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
-    api = HeidelbergEnergyControlAPI(
-        host=entry.data["host"],
-        port=entry.data["port"],
-        device_id=entry.data["device_id"],
+    # Static data and probe results from an earlier start are trusted
+    # as is: entities are added right away, showing the last run's data
+    # (or unavailable) until the first poll succeeds in the background,
+    # which also revalidates them.
+    device_cache = DeviceCache(hass, entry.entry_id)
+    await device_cache.async_load()
+    cached = device_cache.static_data
+
+    # Right after the config flow, take over the API it connected and
+    # probed with instead of doing both again.
+    if (
+        handoff := async_claim(
+            hass, (entry.data["host"], entry.data["port"], entry.data["device_id"])
+        )
+    ) is not None:
+        api, static_data = handoff
+        cached = None
+    else:
+        api = HeidelbergEnergyControlAPI(
+            host=entry.data["host"],
+            port=entry.data["port"],
+            device_id=entry.data["device_id"],
+            pipelined=entry.options.get(CONF_PIPELINED, False),
+        )
+        if cached is not None:
+            static_data = api.restore_static_data(cached, device_cache.capabilities)
+        else:
+            static_data = await _async_read_static_data(api)
+    if cached is None:
+        device_cache.async_set_static_data(
+            static_data, [cap.key for cap in api.capabilities]
+        )
+
+    coordinator = HeidelbergEnergyControlCoordinator(
+        hass=hass,
+        api=api,
+        static_data=static_data,
+        entry=entry,
+        device_cache=device_cache,
     )
+    await coordinator.energy_ledger.async_load()
+    async_adopt_legacy_attributes(hass, coordinator.energy_ledger, entry.entry_id)
+    await coordinator.last_data.async_load()
+    coordinator.async_restore_last_data()
+
+    try:
+        if cached is not None:
+            await coordinator.async_start_deferred()
+        else:
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Release our reference on the shared gateway connection; the
+        # retry builds a new API.
+        await api.disconnect()
+        raise
+    entry.runtime_data = coordinator
 
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+async def _async_read_static_data(api: HeidelbergEnergyControlAPI) -> dict[str, Any]:
+    """Read static data and probe capabilities; not ready if that fails."""
     try:
         static_data = await api.async_get_static_data()
         if static_data is None:
@@ -45,32 +107,40 @@ async def async_setup_entry(
             )
 
     except HeidelbergEnergyControlConnectionError as err:
+        # Release our reference on the shared gateway connection.
+        await api.disconnect()
         raise ConfigEntryNotReady(f"Unable to connect to wallbox: {err}") from err
     except HeidelbergEnergyControlReadError as err:
         await api.disconnect()
         raise ConfigEntryNotReady(f"Failed to read static data: {err}") from err
     except Exception as err:
+        await api.disconnect()
         raise ConfigEntryNotReady(f"Error communicating with wallbox: {err}") from err
-
-    coordinator = HeidelbergEnergyControlCoordinator(
-        hass=hass, api=api, static_data=static_data, entry=entry
-    )
-
-    await coordinator.async_config_entry_first_refresh()
-    entry.runtime_data = coordinator
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    return True
+    return static_data
 
 
 async def async_unload_entry(
     hass: HomeAssistant, entry: HeidelbergEnergyControlConfigEntry
 ) -> bool:
     """Unload a config entry."""
+    await entry.runtime_data.energy_ledger.async_flush()
+    await entry.runtime_data.device_cache.async_flush()
+    await entry.runtime_data.last_data.async_flush()
     await entry.runtime_data.api.disconnect()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
-async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+async def async_remove_entry(
+    hass: HomeAssistant, entry: HeidelbergEnergyControlConfigEntry
+) -> None:
+    """Delete the entry's energy ledger, device cache and last data."""
+    await EnergyLedger(hass, entry.entry_id).async_remove()
+    await DeviceCache(hass, entry.entry_id).async_remove()
+    await LastDataStore(hass, entry.entry_id).async_remove()
+
+
+async def update_listener(
+    hass: HomeAssistant, entry: HeidelbergEnergyControlConfigEntry
+) -> None:
+    """Apply an options update to the running coordinator, without a reload."""
+    entry.runtime_data.async_apply_options(entry.options)
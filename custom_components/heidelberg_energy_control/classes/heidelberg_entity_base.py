@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .. import HeidelbergEnergyControlConfigEntry
-from ..const import DATA_HW_VERSION, DATA_REG_LAYOUT_VER, DATA_SW_VERSION, DEVICE_MANUFACTURER, DEVICE_MODEL, DOMAIN
+from ..const import ATTR_RESTORED_AT, DATA_HW_VERSION, DATA_REG_LAYOUT_VER, DATA_SW_VERSION, DEVICE_MANUFACTURER, DEVICE_MODEL, DOMAIN
 from ..coordinator import HeidelbergEnergyControlCoordinator
 
 
@@ -24,7 +25,9 @@ class HeidelbergEntityBase(CoordinatorEntity[HeidelbergEnergyControlCoordinator]
         description: Any,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        # Derived values are computed by the coordinator, so an entity's
+        # state depends on its own key only; it is woken when that changes.
+        super().__init__(coordinator, context=frozenset((description.key,)))
         self.entity_description = description
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
@@ -34,10 +37,21 @@ class HeidelbergEntityBase(CoordinatorEntity[HeidelbergEnergyControlCoordinator]
             name=entry.title,
             manufacturer=DEVICE_MANUFACTURER,
             model=DEVICE_MODEL,
-            model_id="Register Layout v"
-            + self.coordinator.static_data.get(DATA_REG_LAYOUT_VER),
-            hw_version="v" + self.coordinator.static_data.get(DATA_HW_VERSION),
-            sw_version= "v" + self.coordinator.static_data.get(DATA_SW_VERSION),
+            model_id=self._version("Register Layout v", DATA_REG_LAYOUT_VER),
+            hw_version=self._version("v", DATA_HW_VERSION),
+            sw_version=self._version("v", DATA_SW_VERSION),
         )
 
+    def _version(self, prefix: str, key: str) -> str | None:
+        """Format a version from static data; None if it isn't known (yet)."""
+        value = self.coordinator.static_data.get(key)
+        return None if value is None else f"{prefix}{value}"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark a value restored from the last run until a poll replaces it."""
+        if not isinstance(restored_at := self.coordinator.restored_at, datetime):
+            return None
+        return {ATTR_RESTORED_AT: restored_at.isoformat()}
+
 
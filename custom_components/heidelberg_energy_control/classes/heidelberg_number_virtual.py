@@ -16,8 +16,8 @@ class HeidelbergNumberVirtual(HeidelbergEntityBase, NumberEntity, RestoreEntity)
         await super().async_added_to_hass()
         if (state := await self.async_get_last_state()) is not None:
             if state.state not in ("unknown", "unavailable"):
-                # Pass the restored value to the coordinator dispatcher
-                await self.coordinator.async_handle_number_set(
+                # The coordinator sends it to the wallbox on the next poll.
+                self.coordinator.async_restore_virtual_state(
                     self.entity_description.key, float(state.state)
                 )
 
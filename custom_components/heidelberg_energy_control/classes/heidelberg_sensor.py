@@ -1,19 +1,63 @@
 """Heidelberg Sensor class."""
 
+from dataclasses import dataclass
+from datetime import timedelta
+import time
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.core import callback
 
 from .heidelberg_entity_base import HeidelbergEntityBase
 
+
+@dataclass(frozen=True)
+class Deadband:
+    """Changes smaller than the band are not written to the state machine.
+
+    The band is the larger of `absolute` (display units) and `relative`
+    (fraction of the last written value). A suppressed change is still
+    written by the first update after `heartbeat` of silence, so slow
+    drift inside the band eventually shows up.
+    """
+
+    absolute: float = 0.0
+    relative: float = 0.0
+    heartbeat: timedelta = timedelta(minutes=15)
+
+    def suppresses(self, written: float, value: float) -> bool:
+        """Return True if `value` is inside the band around `written`."""
+        return abs(value - written) < max(self.absolute, self.relative * abs(written))
+
+
+# An explicit "write every change" for descriptions whose device class has
+# a default band.
+NO_DEADBAND = Deadband()
+
+# One raw count of jitter is 1 V, 0.1 °C or 0.1 A; the bands sit above it.
+DEFAULT_DEADBANDS: dict[SensorDeviceClass, Deadband] = {
+    SensorDeviceClass.VOLTAGE: Deadband(absolute=2.0),
+    SensorDeviceClass.TEMPERATURE: Deadband(absolute=0.5),
+    SensorDeviceClass.CURRENT: Deadband(absolute=0.2),
+}
+
+
 class HeidelbergSensor(HeidelbergEntityBase, SensorEntity):
     """Base class for standard Heidelberg sensors.
 
     Coordinator data holds raw wire values (e.g. deci-amps, milliseconds).
     The entity's `multiplier` converts to display units on read. A `None`
     multiplier means the wire value is already the display value.
+
+    Coordinator updates go through the description's `deadband` (or the
+    device-class default from `DEFAULT_DEADBANDS`), so jitter doesn't
+    become a state change and a recorder row on every poll.
     """
 
+    _written_value: Any = None
+    _written_at: float | None = None
+    _written_available: bool | None = None
+
     @property
     def native_value(self) -> Any:
         """Return the display value, converted from the raw coordinator data."""
@@ -24,4 +68,37 @@ class HeidelbergSensor(HeidelbergEntityBase, SensorEntity):
             return None
         if self.entity_description.multiplier is None:
             return raw
-        return raw / self.entity_description.multiplier
\ No newline at end of file
+        return raw / self.entity_description.multiplier
+
+    @property
+    def deadband(self) -> Deadband | None:
+        """Return the band applied to this sensor's updates, if any."""
+        if self.entity_description.deadband is not None:
+            return self.entity_description.deadband
+        return DEFAULT_DEADBANDS.get(self.entity_description.device_class)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state unless the change stays inside the deadband."""
+        value = self.native_value
+        now = time.monotonic()
+        if self._inside_deadband(value, now):
+            return
+        self._written_value = value
+        self._written_at = now
+        self._written_available = self.available
+        super()._handle_coordinator_update()
+
+    def _inside_deadband(self, value: Any, now: float) -> bool:
+        deadband = self.deadband
+        written = self._written_value
+        if (
+            deadband is None
+            or self._written_at is None
+            or self.available != self._written_available
+            or now - self._written_at >= deadband.heartbeat.total_seconds()
+            or not isinstance(value, int | float)
+            or not isinstance(written, int | float)
+        ):
+            return False
+        return deadband.suppresses(written, value)
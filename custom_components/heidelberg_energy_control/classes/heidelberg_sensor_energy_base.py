@@ -12,7 +12,12 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class HeidelbergSensorEnergyBase(HeidelbergEntityBase, RestoreEntity, SensorEntity):
-    """Base for energy sensors with jump protection and state restoration."""
+    """Base for energy sensors with jump protection and state restoration.
+
+    The correction state (offset, last raw counter value) lives in the
+    coordinator's energy ledger, not in state attributes. Only the value
+    itself is restored from the last state.
+    """
 
     def __init__(self, coordinator, entry, description):
         """Initialize energy base sensor."""
@@ -22,23 +27,29 @@ class HeidelbergSensorEnergyBase(HeidelbergEntityBase, RestoreEntity, SensorEnti
         self._attr_native_value: float | None = None
 
     async def async_added_to_hass(self) -> None:
-        """Restore internal tracking values on startup."""
+        """Restore the value and load tracking values from the ledger."""
         await super().async_added_to_hass()
-        if (last_state := await self.async_get_last_state()) is not None:
-            offset_val = last_state.attributes.get("_total_offset")
-            self._total_offset = float(offset_val) if offset_val is not None else 0.0
-
-            raw_val = last_state.attributes.get("_last_raw_value")
-            self._last_raw_value = float(raw_val) if raw_val is not None else None
-
+        last_state = await self.async_get_last_state()
+        if last_state is not None:
             try:
                 self._attr_native_value = float(last_state.state)
             except (ValueError, TypeError) as _:
                 self._attr_native_value = 0.0
 
+        self._load_record(
+            self.coordinator.energy_ledger.record(self.entity_description.key)
+        )
+
+    def _load_record(self, record: dict[str, Any]) -> None:
+        """Take over the tracking values from a ledger record."""
+        self._total_offset = float(record.get("total_offset") or 0.0)
+        raw_val = record.get("last_raw_value")
+        self._last_raw_value = float(raw_val) if raw_val is not None else None
+
     def _get_corrected_total(self, raw_total: float) -> float:
         """Handle hardware jumps by maintaining a virtual offset."""
-        if self._last_raw_value is not None and raw_total < self._last_raw_value:
+        jumped = self._last_raw_value is not None and raw_total < self._last_raw_value
+        if jumped:
             jump = self._last_raw_value - raw_total
             self._total_offset += jump
             _LOGGER.warning(
@@ -48,12 +59,11 @@ class HeidelbergSensorEnergyBase(HeidelbergEntityBase, RestoreEntity, SensorEnti
             )
 
         self._last_raw_value = raw_total
+        # A new offset must survive a crash; the raw value can wait.
+        self.coordinator.energy_ledger.async_update(
+            self.entity_description.key,
+            urgent=jumped,
+            total_offset=self._total_offset,
+            last_raw_value=raw_total,
+        )
         return raw_total + self._total_offset
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return internal values as hidden attributes for restoration."""
-        return {
-            "_total_offset": self._total_offset,
-            "_last_raw_value": self._last_raw_value,
-        }
@@ -17,10 +17,9 @@ class HeidelbergSwitchVirtual(HeidelbergEntityBase, SwitchEntity, RestoreEntity)
         """Restore state and sync with coordinator."""
         await super().async_added_to_hass()
         if (state := await self.async_get_last_state()) is not None:
-            is_on = state.state == "on"
-            # Update coordinator state immediately for logic processing
-            await self.coordinator.async_handle_switch_state_change(
-                self.entity_description.key, is_on
+            # The coordinator sends it to the wallbox on the next poll.
+            self.coordinator.async_restore_virtual_state(
+                self.entity_description.key, state.state == "on"
             )
 
     @property
@@ -14,16 +14,28 @@ from homeassistant.config_entries import (
     OptionsFlow,
 )
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
 
-from .const import CONF_DEVICE_ID, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_DEVICE_ID,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MEDIUM_TIER_INTERVAL,
+    CONF_PIPELINED,
+    CONF_SLOW_TIER_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MEDIUM_TIER_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_TIER_INTERVAL,
+    DOMAIN,
+)
 from .core.api import HeidelbergEnergyControlAPI
 from .core.exceptions import (
     HeidelbergEnergyControlConnectionError,
     HeidelbergEnergyControlReadError,
     HeidelbergEnergyControlAPIError,
 )
+from .setup_handoff import async_offer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,23 +50,35 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Validate the user input allows us to connect.
+
+    On success the still connected API is handed over to the entry setup
+    (see `setup_handoff`) so it doesn't connect and probe all over again.
+    """
     api = HeidelbergEnergyControlAPI(
         host=data[CONF_HOST],
         port=data[CONF_PORT],
         device_id=data[CONF_DEVICE_ID],
     )
 
+    handed_over = False
     try:
         static_data = await api.async_get_static_data()
-        await api.disconnect()
 
         if static_data is None:
             raise HeidelbergEnergyControlReadError(
                 "Wallbox connected but did not respond to requests"
             )
 
+        async_offer(
+            hass,
+            (data[CONF_HOST], data[CONF_PORT], data[CONF_DEVICE_ID]),
+            api,
+            static_data,
+        )
+        handed_over = True
+
     except HeidelbergEnergyControlConnectionError:
         raise
     except HeidelbergEnergyControlReadError:
@@ -62,6 +86,9 @@ async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
     except Exception as err:
         _LOGGER.error("Unexpected validation error: %s", err)
         raise HeidelbergEnergyControlAPIError(f"Validation failed: {err}") from err
+    finally:
+        if not handed_over:
+            await api.disconnect()
 
     return {"title": data[CONF_NAME]}
 
@@ -84,7 +111,7 @@ class HeidelbergEnergyControlConfigFlow(ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
 
             try:
-                info = await validate_input(user_input)
+                info = await validate_input(self.hass, user_input)
                 return self.async_create_entry(title=info["title"], data=user_input)
             except HeidelbergEnergyControlConnectionError:
                 errors["base"] = "cannot_connect"
@@ -137,6 +164,52 @@ class HeidelbergOptionsFlowHandler(OptionsFlow):
                             mode=selector.NumberSelectorMode.BOX,
                         ),
                     ),
+                    vol.Required(
+                        CONF_IDLE_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=3,
+                            max=600,
+                            step=1,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_MEDIUM_TIER_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MEDIUM_TIER_INTERVAL, DEFAULT_MEDIUM_TIER_INTERVAL
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=3,
+                            max=300,
+                            step=1,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_SLOW_TIER_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_SLOW_TIER_INTERVAL, DEFAULT_SLOW_TIER_INTERVAL
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=3,
+                            max=3600,
+                            step=1,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_PIPELINED,
+                        default=self.config_entry.options.get(CONF_PIPELINED, False),
+                    ): selector.BooleanSelector(),
                 }
             ),
         )
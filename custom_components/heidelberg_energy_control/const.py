@@ -10,8 +10,24 @@ DEVICE_MODEL = "Energy Control"
 # ##### Configuration #####
 # Configuration keys
 CONF_DEVICE_ID = "device_id"
+CONF_PIPELINED = "pipelined_reads"
 # Update interval for coordinator
 DEFAULT_SCAN_INTERVAL = 10
+# Update interval while no car is plugged in
+CONF_IDLE_SCAN_INTERVAL = "idle_scan_interval"
+DEFAULT_IDLE_SCAN_INTERVAL = 60
+# Polling tier cadences in seconds (the fast tier runs every scan interval)
+CONF_MEDIUM_TIER_INTERVAL = "medium_tier_interval"
+CONF_SLOW_TIER_INTERVAL = "slow_tier_interval"
+DEFAULT_MEDIUM_TIER_INTERVAL = 30
+DEFAULT_SLOW_TIER_INTERVAL = 300
+# Largest run of unrequested registers a merged block read may bridge
+DEFAULT_MAX_REGISTER_GAP = 2
+# Longest wait (s) between connection attempts after a deferred start
+MAX_CONNECT_BACKOFF = 300
+
+# State attribute marking values restored from the last run
+ATTR_RESTORED_AT = "restored_at"
 
 # Platforms
 PLATFORMS: list[Platform] = [
@@ -44,6 +60,14 @@ DATA_EXTERNAL_LOCK_STATE = "external_lock_state"
 DATA_ENERGY_SINCE_POWER_ON = "energy_since_power_on"
 DATA_TOTAL_ENERGY = "total_energy"
 DATA_SESSION_ENERGY = "session_energy"
+# Derived (computed by the coordinator from the values above)
+DATA_SESSION_START = "session_start"
+DATA_APPARENT_POWER = "apparent_power"
+DATA_APPARENT_POWER_L1 = "apparent_power_l1"
+DATA_APPARENT_POWER_L2 = "apparent_power_l2"
+DATA_APPARENT_POWER_L3 = "apparent_power_l3"
+DATA_PHASE_IMBALANCE = "phase_imbalance"
+DATA_POWER_FACTOR = "power_factor"
 # Binary Sensors
 DATA_IS_PLUGGED = "is_plugged"
 DATA_IS_CHARGING = "is_charging"
@@ -2,36 +2,90 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any
 
 from packaging import version
+from pymodbus.exceptions import ModbusException
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 
 from .const import (
     COMMAND_TARGET_CURRENT,
     COMMAND_WATCHDOG_TIMEOUT,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MEDIUM_TIER_INTERVAL,
+    CONF_PIPELINED,
+    CONF_SLOW_TIER_INTERVAL,
+    DATA_CHARGING_STATE,
     DATA_HW_MAX_CURR,
+    DATA_IS_CHARGING,
+    DATA_IS_PLUGGED,
     DATA_REG_LAYOUT_VER,
+    DATA_SESSION_ENERGY,
+    DATA_SESSION_START,
+    DATA_SW_VERSION,
+    DATA_TOTAL_ENERGY,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MEDIUM_TIER_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_TIER_INTERVAL,
     DOMAIN,
+    MAX_CONNECT_BACKOFF,
     VIRTUAL_ENABLE,
     VIRTUAL_TARGET_CURRENT,
 )
 from .core.exceptions import (
+    HeidelbergEnergyControlAPIError,
     HeidelbergEnergyControlConnectionError,
     HeidelbergEnergyControlReadError,
     HeidelbergEnergyControlWriteError,
 )
+from .core.derived import CORE_METRICS, DerivedGraph, DerivedMetric
+from .core.keepalive import (
+    KEEPALIVE_IDLE_CHECK,
+    KeepaliveStats,
+    keepalive_due_in,
+    keepalive_retry_in,
+)
+from .core.poll_schedule import WATCHDOG_HEADROOM, AdaptivePollInterval
+from .core.registers import PollTier, RegisterType
+from .device_cache import DeviceCache
+from .energy_ledger import EnergyLedger, SessionEnergyTracker
+from .last_data import LastDataStore, serialize
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Polled whether or not an entity shows them: the virtual enable layer
+# syncs on the target current, the headroom check and the poll interval
+# read the watchdog, the poll interval follows the charging state.
+_INTERNAL_KEYS = frozenset(
+    (
+        COMMAND_TARGET_CURRENT,
+        COMMAND_WATCHDOG_TIMEOUT,
+        DATA_CHARGING_STATE,
+        DATA_IS_CHARGING,
+    )
+)
+# Charging state with no car plugged in.
+_IDLE_STATE = "A"
+# Keys the coordinator sets or edits itself, outside the API's diff.
+_COORDINATOR_KEYS = frozenset(
+    (COMMAND_TARGET_CURRENT, VIRTUAL_ENABLE, VIRTUAL_TARGET_CURRENT)
+)
+
 
 class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
     """Coordinator to manage data fetching and proxy logic."""
@@ -42,6 +96,7 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
         api: Any,
         static_data: dict[str, str],
         entry: ConfigEntry,
+        device_cache: DeviceCache | None = None,
     ) -> None:
         """Initialize the coordinator."""
         scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
@@ -55,6 +110,35 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
         self.api = api
         self.static_data = static_data
         self.entry = entry
+        self.energy_ledger = EnergyLedger(hass, entry.entry_id)
+        self.session_tracker = SessionEnergyTracker(self.energy_ledger)
+        # Static data, capabilities and registers the device rejects,
+        # kept across restarts.
+        self.device_cache = device_cache or DeviceCache(hass, entry.entry_id)
+        self._known_unreadable: frozenset[tuple[RegisterType, int]] = frozenset()
+        # The last run's data, served until the first poll; see
+        # async_restore_last_data.
+        self.last_data = LastDataStore(hass, entry.entry_id)
+        self.restored_at: datetime | None = None
+        self._last_polled_at: datetime | None = None
+
+        # Post-decode stage: every derived key is computed once per poll,
+        # and only when its inputs changed.
+        self.derived = DerivedGraph(
+            (
+                *CORE_METRICS,
+                DerivedMetric(
+                    DATA_SESSION_ENERGY,
+                    (DATA_TOTAL_ENERGY, DATA_IS_PLUGGED),
+                    self.session_tracker.update,
+                ),
+                DerivedMetric(
+                    DATA_SESSION_START,
+                    (DATA_SESSION_ENERGY, DATA_IS_PLUGGED),
+                    lambda *_: self.session_tracker.started,
+                ),
+            )
+        )
 
         # The virtual enable/target-current UI depends on writing register 261
         # to 0 as "off"; below firmware 1.0.7 there's no way to turn it back on
@@ -70,9 +154,39 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
         self.target_current: float = default_current
         self.logic_enabled: bool = False
         self._initial_fetch_done: bool = False
+        # Set when virtual entities restore their state; the next
+        # successful poll sends it to the wallbox.
+        self._restore_pending: bool = False
         self._consecutive_empty_responses: int = 0
         self._scan_interval_seconds: int = scan_interval
         self._watchdog_warning_logged: bool = False
+        self.keepalive_stats = KeepaliveStats()
+
+        # Each register tier runs on its own cadence; the fast tier on
+        # every poll. Tiers that fall due together share one merged read.
+        self._tier_intervals = self._tier_intervals_from(entry.options)
+        self._tier_last_poll: dict[PollTier, float] = {}
+        # Slow while no car is plugged in, fast around state changes.
+        self._poll_interval = AdaptivePollInterval(
+            scan_interval,
+            entry.options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL),
+        )
+        # Options in effect; see async_apply_options.
+        self._options: dict[str, Any] = dict(entry.options)
+
+        # Set by a deferred start until the first poll succeeds; failed
+        # polls meanwhile back off exponentially.
+        self._awaiting_connection: bool = False
+        self._connect_attempts: int = 0
+
+        # What listeners last saw; see async_update_listeners.
+        self._dispatched_data: dict[str, Any] | None = None
+        self._dispatched_success: bool | None = None
+        self._dispatched_restored: bool | None = None
+        # Keys polls changed since the last dispatch, from the API's
+        # register diff and the derived graph; None if nothing was polled.
+        self._polled_changes: set[str] | None = None
+        self.changed_keys: frozenset[str] = frozenset()
 
         # Initialize data dictionary
         self.data: dict[str, Any] = {
@@ -81,11 +195,255 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
             COMMAND_TARGET_CURRENT: 0.0,
         }
 
+    async def _async_setup(self) -> None:
+        """Plan reads around known bad registers and from the entity registry.
+
+        Follows entity registry changes from then on.
+        """
+        await self.device_cache.async_load()
+        for register_type, address in self.device_cache.unreadable(
+            self.static_data.get(DATA_SW_VERSION)
+        ):
+            self.api.mark_unreadable(register_type, address)
+        self._known_unreadable = self.api.unreadable_addresses
+        self.async_update_demand()
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+            )
+        )
+        if COMMAND_WATCHDOG_TIMEOUT in self.api.available_keys:
+            self.entry.async_create_background_task(
+                self.hass, self._async_keepalive_loop(), f"{DOMAIN} keep-alive"
+            )
+
+    async def async_start_deferred(self) -> None:
+        """Start from cached static data without waiting for the wallbox.
+
+        Replaces `async_config_entry_first_refresh`: entities can be
+        added at once and stay unavailable until a poll succeeds. Polls
+        run in the background, backing off while the wallbox can't be
+        reached; the first successful one revalidates the static data.
+        """
+        await self._async_setup()
+        # Restored data counts as a success until the first poll says otherwise.
+        self.last_update_success = self.restored_at is not None
+        self._awaiting_connection = True
+        self.entry.async_create_background_task(
+            self.hass, self.async_refresh(), f"{DOMAIN} connect"
+        )
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Pick the next poll interval from the poll that just finished.
+
+        A deferred start backs off while it can't reach the wallbox;
+        after that the interval follows the wallbox state.
+        """
+        super()._async_refresh_finished()
+        if self._awaiting_connection:
+            if not self.last_update_success:
+                self._connect_attempts += 1
+                self._set_update_interval(
+                    min(
+                        self._scan_interval_seconds * 2**self._connect_attempts,
+                        MAX_CONNECT_BACKOFF,
+                    )
+                )
+                return
+            self._awaiting_connection = False
+            self._connect_attempts = 0
+            self.entry.async_create_background_task(
+                self.hass,
+                self.async_revalidate_static_data(),
+                f"{DOMAIN} revalidate static data",
+            )
+        if not self.last_update_success:
+            return
+        data = self.data or {}
+        charging_state = data.get(DATA_CHARGING_STATE)
+        timeout_ms = data.get(COMMAND_WATCHDOG_TIMEOUT)
+        self._set_update_interval(
+            self._poll_interval.next_interval(
+                (charging_state, data.get(DATA_IS_CHARGING)),
+                charging_state == _IDLE_STATE,
+                timeout_ms / 1000.0 if timeout_ms else None,
+            )
+        )
+
+    @callback
+    def _set_update_interval(self, seconds: float) -> None:
+        """Change the poll interval, rescheduling the poll already planned."""
+        interval = timedelta(seconds=seconds)
+        if interval == self.update_interval:
+            return
+        self.update_interval = interval
+        # The next poll was scheduled with the previous interval.
+        if self._listeners:
+            self._schedule_refresh()
+
+    async def _async_keepalive_loop(self) -> None:
+        """Feed the watchdog whenever polls leave it without a transaction.
+
+        Runs until the entry unloads, also before the first poll and
+        while polls fail: the watchdog counts down either way. Uses the
+        last known watchdog timeout, restored from the last run until a
+        poll reads it. Sends a keep-alive only once no transaction
+        reached the wallbox for a share of that timeout (see
+        `core.keepalive`), so regular polls keep it quiet. Failed
+        keep-alives are retried with exponential backoff.
+        """
+        failures = 0
+        while True:
+            timeout_ms = (self.data or {}).get(COMMAND_WATCHDOG_TIMEOUT)
+            if not timeout_ms:
+                await asyncio.sleep(KEEPALIVE_IDLE_CHECK)
+                continue
+            timeout = timeout_ms / 1000.0
+            silence = self.api.seconds_since_transaction
+            if (due_in := keepalive_due_in(timeout, silence)) > 0:
+                failures = 0
+                await asyncio.sleep(due_in)
+                continue
+            start = time.monotonic()
+            try:
+                await self.api.async_keepalive()
+            except HeidelbergEnergyControlAPIError as err:
+                _LOGGER.debug("Watchdog keep-alive failed: %s", err)
+                self.keepalive_stats.record_failure(err)
+                failures += 1
+                await asyncio.sleep(keepalive_retry_in(timeout, failures))
+                continue
+            failures = 0
+            self.keepalive_stats.record_sent(time.monotonic() - start, silence)
+
+    @callback
+    def async_restore_last_data(self) -> None:
+        """Serve the last run's data and virtual state until a poll replaces it.
+
+        Entities show the restored values from the start; `restored_at`
+        marks them as such (and says when they were polled) until live
+        data arrives. Call after `last_data` is loaded.
+        """
+        if (data := self.last_data.data) is None:
+            return
+        self.data = dict(data)
+        self.restored_at = self.last_data.saved_at or dt_util.utcnow()
+        if not self.supports_virtual_logic:
+            return
+        hw_max_current = float(self.static_data.get(DATA_HW_MAX_CURR, 16))
+        self.target_current = min(
+            float(
+                self.last_data.virtual_state(
+                    VIRTUAL_TARGET_CURRENT, self.target_current
+                )
+            ),
+            hw_max_current,
+        )
+        self.logic_enabled = bool(
+            self.last_data.virtual_state(VIRTUAL_ENABLE, self.logic_enabled)
+        )
+        # The first poll reconciles with the hardware like any later one,
+        # so a target set while the hardware was at 0 A is kept.
+        self._initial_fetch_done = True
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options to the running coordinator and API.
+
+        No option changes which entities exist, so nothing is reloaded:
+        the connection, loaded capabilities and virtual state all stay.
+        """
+        scan_interval = options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self._poll_interval.idle_interval = options.get(
+            CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+        )
+        if scan_interval != self._scan_interval_seconds:
+            self._scan_interval_seconds = scan_interval
+            self._poll_interval.scan_interval = scan_interval
+            self._watchdog_warning_logged = False
+            # A deferred start keeps backing off; it picks the new
+            # interval up once connected. Otherwise the next poll adapts it.
+            if not self._awaiting_connection:
+                self._set_update_interval(scan_interval)
+        self._tier_intervals = self._tier_intervals_from(options)
+
+        pipelined = options.get(CONF_PIPELINED, False)
+        if pipelined != self._options.get(CONF_PIPELINED, False):
+            self.api.set_pipelined(pipelined)
+        self._options = dict(options)
+
+    async def async_revalidate_static_data(self) -> None:
+        """Check static data restored from the device cache against the device.
+
+        Only a different layout or firmware version can change which
+        capabilities load, so only that reloads the entry (which then
+        reads and probes from scratch). Otherwise the cache is refreshed
+        with the values just read.
+        """
+        try:
+            fresh = await self.api.async_read_core_static_data()
+        except HeidelbergEnergyControlAPIError as err:
+            _LOGGER.debug("Could not revalidate cached static data: %s", err)
+            return
+        if any(
+            fresh.get(key) != self.static_data.get(key)
+            for key in (DATA_REG_LAYOUT_VER, DATA_SW_VERSION)
+        ):
+            _LOGGER.info(
+                "Wallbox reports firmware %s (cached: %s); reloading to probe it again",
+                fresh.get(DATA_SW_VERSION),
+                self.static_data.get(DATA_SW_VERSION),
+            )
+            self.device_cache.async_clear_static_data()
+            self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
+            return
+        self.device_cache.async_set_static_data(
+            {**self.static_data, **fresh}, [cap.key for cap in self.api.capabilities]
+        )
+
+    @callback
+    def async_update_demand(self) -> None:
+        """Poll only the registers enabled entities and internal logic need.
+
+        Every key is wanted unless its entity is disabled in the entity
+        registry; keys whose entity isn't registered yet count as wanted.
+        Derived keys pull in the keys they are computed from.
+        """
+        prefix = f"{self.entry.entry_id}_"
+        disabled = {
+            entity.unique_id.removeprefix(prefix)
+            for entity in er.async_entries_for_config_entry(
+                er.async_get(self.hass), self.entry.entry_id
+            )
+            if entity.disabled_by is not None
+        }
+        available = self.api.available_keys
+        wanted = (available | self.derived.keys) - disabled | _INTERNAL_KEYS
+        self.api.set_polled_keys(self.derived.requirements(wanted) & available)
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Replan when an entity is added, removed, enabled or disabled."""
+        if event.data["action"] == "update" and "disabled_by" not in event.data.get(
+            "changes", {}
+        ):
+            return
+        entity = er.async_get(self.hass).async_get(event.data["entity_id"])
+        if entity is not None and entity.config_entry_id != self.entry.entry_id:
+            return
+        self.async_update_demand()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from hardware and sync virtual states."""
         try:
-            # Fetch all registers from the wallbox via Modbus API
-            data = await self.api.async_get_data()
+            # Fetch the registers of every tier that is due via Modbus API
+            poll_start = time.monotonic()
+            due_tiers = self._due_tiers(poll_start)
+            data = await self.api.async_get_data(tiers=due_tiers)
+            self._remember_unreadable()
             if not data:
                 self._consecutive_empty_responses += 1
                 _LOGGER.warning(
@@ -98,7 +456,17 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
                     )
                 return self.data
 
+            for tier in due_tiers:
+                self._tier_last_poll[tier] = poll_start
+
             self._check_watchdog_headroom(data)
+            polled_changes = self.api.changed_keys | self.derived.apply(data)
+            if self._polled_changes is None:
+                self._polled_changes = set(polled_changes)
+            else:
+                self._polled_changes |= polled_changes
+            self.restored_at = None
+            self._last_polled_at = dt_util.utcnow()
 
             # If virtual logic is not supported, just return raw data (Legacy Mode)
             if not self.supports_virtual_logic:
@@ -108,6 +476,15 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
             # Raw value is deci-amps; convert to amps for the virtual entities.
             hw_current = float(data.get(COMMAND_TARGET_CURRENT, 0)) / 10.0
 
+            # Restored virtual state wins over what the wallbox reports
+            # until it has been sent; a failed write keeps it pending.
+            if self._restore_pending:
+                if not await self._async_send_restored_state(data):
+                    data[VIRTUAL_ENABLE] = self.logic_enabled
+                    data[VIRTUAL_TARGET_CURRENT] = self.target_current
+                    return data
+                hw_current = float(data[COMMAND_TARGET_CURRENT]) / 10.0
+
             # Initial sync on startup: Read wallbox current state
             if not self._initial_fetch_done:
                 if hw_current > 0:
@@ -142,18 +519,62 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
             return data
 
         except HeidelbergEnergyControlConnectionError as err:
-            raise UpdateFailed(
-                f"Connection to Modbus gateway failed: {err}",
-                retry_after=30,
-            ) from err
+            raise UpdateFailed(f"Connection to Modbus gateway failed: {err}") from err
 
         except HeidelbergEnergyControlReadError as err:
             raise UpdateFailed(f"Failed to read from Wallbox: {err}") from err
 
-        except Exception as err:
-            # Catch unexpected errors and log full traceback
-            _LOGGER.exception("Unexpected error in coordinator update")
-            raise UpdateFailed(f"Unexpected error: {err}") from err
+        # Other API errors and transport errors the API didn't wrap. Anything
+        # else is a bug; the base coordinator logs it with its traceback.
+        except (HeidelbergEnergyControlAPIError, ModbusException, OSError) as err:
+            raise UpdateFailed(f"Wallbox communication failed: {err}") from err
+
+    async def _async_send_restored_state(self, data: dict[str, Any]) -> bool:
+        """Write the restored virtual state to the wallbox if it differs.
+
+        Called from a poll, so it writes directly rather than through
+        `_write_current_to_wallbox`, which refreshes on failure. Returns
+        False if the write failed; the state then stays pending.
+        """
+        modbus_value = int((self.target_current if self.logic_enabled else 0.0) * 10)
+        if data.get(COMMAND_TARGET_CURRENT) != modbus_value:
+            try:
+                await self.api.async_write_command(
+                    COMMAND_TARGET_CURRENT, modbus_value
+                )
+            except (
+                HeidelbergEnergyControlWriteError,
+                HeidelbergEnergyControlConnectionError,
+            ) as err:
+                _LOGGER.warning("Could not send restored target current: %s", err)
+                return False
+            data[COMMAND_TARGET_CURRENT] = modbus_value
+        self._restore_pending = False
+        return True
+
+    @callback
+    def async_restore_virtual_state(self, key: str, value: float | bool) -> None:
+        """Take a virtual entity's restored state without writing it yet.
+
+        Entities restore while the platform is set up; writing then would
+        hold up setup for as long as the wallbox can't be reached. The
+        next successful poll sends the state instead.
+        """
+        if not self.supports_virtual_logic:
+            return
+
+        if key == VIRTUAL_ENABLE:
+            self.logic_enabled = bool(value)
+        elif key == VIRTUAL_TARGET_CURRENT:
+            self.target_current = float(value)
+        else:
+            _LOGGER.warning("Unknown key '%s' in virtual state restore", key)
+            return
+        self.data[key] = value
+        # Restored state replaces the initial sync from the hardware.
+        self._initial_fetch_done = True
+        self._restore_pending = True
+        self.async_update_listeners()
 
     async def _write_current_to_wallbox(self, value: float) -> None:
         """Internal helper to write a specific Ampere value."""
@@ -180,7 +601,7 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
             # This ensures entities reflect the broken state immediately
             self.last_update_success = False
 
-            # Trigger refresh (which will then hit the 30s throttle in _async_update_data if connection is dead)
+            # Trigger refresh (which will then fail fast if the connection is dead)
             await self.async_refresh()
 
         except Exception as err:
@@ -227,13 +648,103 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
         else:
             _LOGGER.warning("Unknown key '%s' in number set handler", key)
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose data keys changed.
+
+        Entities register with the set of data keys they read as their
+        listener context. After a poll, the changed keys come from the
+        API's register diff and the derived graph; only the keys the
+        coordinator edits itself and the key set are compared. Any other
+        dispatch diffs the data against what was last dispatched, which
+        catches in-place edits from the write handlers. Either way a poll
+        that changes nothing writes no states. The first dispatch, any
+        availability flip and live data replacing restored data notify
+        everyone, as does a listener registered without a context.
+
+        Live data is also handed to `last_data` to be written eventually.
+        """
+        data = self.data or {}
+        previous = self._dispatched_data
+        restored = self.restored_at is not None
+        notify_all = (
+            previous is None
+            or self.last_update_success != self._dispatched_success
+            or restored != self._dispatched_restored
+        )
+        polled, self._polled_changes = self._polled_changes, None
+        if previous is None:
+            changed: frozenset[str] = frozenset()
+        elif polled is not None:
+            polled.update(
+                key
+                for key in _COORDINATOR_KEYS
+                if data.get(key, _MISSING) != previous.get(key, _MISSING)
+            )
+            if data.keys() != previous.keys():
+                polled.update(data.keys() ^ previous.keys())
+            changed = frozenset(polled)
+        else:
+            changed = frozenset(
+                key
+                for key in data.keys() | previous.keys()
+                if data.get(key, _MISSING) != previous.get(key, _MISSING)
+            )
+        self._dispatched_data = dict(data)
+        self._dispatched_success = self.last_update_success
+        self._dispatched_restored = restored
+        self.changed_keys = changed
+        if self.last_update_success and not restored and self._last_polled_at:
+            self.last_data.async_schedule_save(self._last_data_record)
+
+        for update_callback, context in list(self._listeners.values()):
+            if notify_all or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    def _last_data_record(self) -> dict[str, Any]:
+        """Return what `last_data` writes: data and virtual state as of now."""
+        return serialize(
+            self.data or {},
+            {
+                VIRTUAL_TARGET_CURRENT: self.target_current,
+                VIRTUAL_ENABLE: self.logic_enabled,
+            },
+            self._last_polled_at or dt_util.utcnow(),
+        )
+
+    def _remember_unreadable(self) -> None:
+        """Persist the API's bad-address map when a poll learned more."""
+        unreadable = self.api.unreadable_addresses
+        if unreadable != self._known_unreadable:
+            self._known_unreadable = unreadable
+            self.device_cache.async_set_unreadable(
+                self.static_data.get(DATA_SW_VERSION), unreadable
+            )
+
+    def _due_tiers(self, now: float) -> set[PollTier]:
+        """Return the polling tiers whose cadence has elapsed.
+
+        A tier counts as due when it would otherwise be more than half a
+        scan interval late by the next poll, so a 30 s tier on a 10 s
+        scan interval runs on every third poll rather than every fourth.
+        """
+        slack = self._scan_interval_seconds / 2
+        return {
+            tier
+            for tier, interval in self._tier_intervals.items()
+            if tier not in self._tier_last_poll
+            or now - self._tier_last_poll[tier] + slack >= interval
+        }
+
     def _check_watchdog_headroom(self, data: dict[str, Any]) -> None:
-        """Warn once if the poll interval is too slow to keep the watchdog fed.
+        """Warn once if polls alone are too slow to keep the watchdog fed.
 
         The wallbox falls back to the FailSafe current if it doesn't see a
-        successful transaction within the watchdog window. A poll interval
-        near the timeout gives no room for a single missed poll; warn the
-        user once when scan_interval * 1.5 > timeout so they can retune.
+        successful transaction within the watchdog window. With a poll
+        interval near the timeout, the keep-alive loop has to feed the
+        watchdog between polls, and a keep-alive lost on a slow or busy
+        gateway is all it takes. Warn the user once when
+        scan_interval * 1.5 > timeout so they can retune.
 
         Watchdog timeout is stored in the coordinator data as raw ms (wire
         format); convert to seconds here for a like-for-like comparison
@@ -245,17 +756,31 @@ class HeidelbergEnergyControlCoordinator(DataUpdateCoordinator):
         if not timeout_ms:  # None or 0 (watchdog disabled)
             return
         timeout_seconds = timeout_ms / 1000.0
-        headroom_seconds = self._scan_interval_seconds * 1.5
+        headroom_seconds = self._scan_interval_seconds * WATCHDOG_HEADROOM
         if headroom_seconds > timeout_seconds:
             _LOGGER.warning(
                 "Poll interval %ss leaves no headroom for the wallbox watchdog "
-                "(timeout %ss). A single missed poll may trigger the FailSafe "
-                "current. Consider a shorter poll interval or a longer watchdog.",
+                "(timeout %ss); keep-alive reads between polls have to feed it, "
+                "and a single lost one may trigger the FailSafe current. "
+                "Consider a shorter poll interval or a longer watchdog.",
                 self._scan_interval_seconds,
                 timeout_seconds,
             )
             self._watchdog_warning_logged = True
 
+    @staticmethod
+    def _tier_intervals_from(options: Mapping[str, Any]) -> dict[PollTier, float]:
+        """Return each polling tier's cadence (s); the fast tier every poll."""
+        return {
+            PollTier.FAST: 0,
+            PollTier.MEDIUM: options.get(
+                CONF_MEDIUM_TIER_INTERVAL, DEFAULT_MEDIUM_TIER_INTERVAL
+            ),
+            PollTier.SLOW: options.get(
+                CONF_SLOW_TIER_INTERVAL, DEFAULT_SLOW_TIER_INTERVAL
+            ),
+        }
+
     @staticmethod
     def _parse_supports_virtual_logic(static_data: dict[str, str]) -> bool:
         """Return True iff the layout version supports the virtual enable layer.
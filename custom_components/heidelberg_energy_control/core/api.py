@@ -1,6 +1,6 @@
 """API for Heidelberg Energy Control wallbox via Modbus.
 
-Owns the Modbus client and connection lifecycle, then delegates all
+Owns the connection lifecycle, then delegates all
 register access to a set of `Capability` modules. Each capability
 contributes static and polled data and declares the writes it owns;
 the API aggregates their results into the flat dicts the coordinator
@@ -8,147 +8,487 @@ expects.
 
 Adding a new register group means adding a capability module under
 `capabilities/`, not editing this file.
+
+The Modbus client itself belongs to a `ModbusConnection` from
+`CONNECTION_POOL`, shared with every other API on the same gateway
+host:port. Each transaction waits for a slot from the connection's
+priority scheduler, so control writes go first and wallboxes behind
+one gateway take turns instead of fighting over sockets.
+
+A failing optional capability doesn't fail the poll: it is quarantined
+and re-probed with backoff (see `health`), while the core data keeps
+publishing.
 """
 
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable
 import logging
 import time
 from typing import Any
 
 from packaging import version
-from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
-from ..const import DATA_REG_LAYOUT_VER
+from ..const import DATA_REG_LAYOUT_VER, DEFAULT_MAX_REGISTER_GAP
 from .capabilities import CAPABILITIES, Capability
-from .capabilities.core import register_to_version, to_32bit
+from .capabilities.core import REG_COMMAND_TARGET_CURRENT, register_to_version, to_32bit
+from .connection import CONNECTION_POOL
 from .exceptions import (
     HeidelbergEnergyControlAPIError,
     HeidelbergEnergyControlConnectionError,
     HeidelbergEnergyControlReadError,
     HeidelbergEnergyControlWriteError,
 )
-from .registers import RegisterDefinition, RegisterType
+from .health import CapabilityHealth
+from .pipeline import PipelineError
+from .read_plan import ALL_TIERS, ReadPlan
+from .registers import (
+    PollTier,
+    RegisterBlock,
+    RegisterDefinition,
+    RegisterType,
+    plan_blocks,
+)
+from .scheduler import TransactionPriority
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Modbus exception code for "address not supported by this device".
+_ILLEGAL_DATA_ADDRESS = 0x02
+# Register the keep-alive reads: the target current, present on every
+# layout.
+_KEEPALIVE_REGISTER = REG_COMMAND_TARGET_CURRENT
+
+
+class _BlockRejectedError(HeidelbergEnergyControlReadError):
+    """The device answered a block read with a Modbus exception response."""
+
+    def __init__(self, message: str, illegal_address: bool = False) -> None:
+        """Initialize; `illegal_address` if the device named the address bad."""
+        super().__init__(message)
+        self.illegal_address = illegal_address
+
+
 class HeidelbergEnergyControlAPI:
     """API class for Heidelberg Energy Control wallbox."""
 
-    def __init__(self, host: str, port: int, device_id: int) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        device_id: int,
+        max_gap: int = DEFAULT_MAX_REGISTER_GAP,
+        pipelined: bool = False,
+    ) -> None:
         """Initialize the API."""
         self._host = host
         self._port = port
         self._device_id = device_id
-        self._client = AsyncModbusTcpClient(
-            host,
-            port=port,
-            timeout=5,
-        )
+        # Largest hole (in registers) a merged block read may bridge.
+        self._max_gap = max_gap
+        # (type, address) pairs the device rejects; merged blocks never
+        # cross them and capabilities stop polling fields behind them.
+        # Learned at runtime when the device answers a read with
+        # "illegal data address" (see `_async_bisect`); the caller may
+        # persist and restore them.
+        self._unreadable: set[tuple[RegisterType, int]] = set()
+        self._connection = CONNECTION_POOL.acquire(host, port)
+        self._connection_held = True
+        self._client = self._connection.client
+        # Opt-in: keep all block reads of a poll in flight at once on the
+        # gateway's second socket. Dropped if the gateway can't handle it.
+        # The socket belongs to the connection, so dropping it there
+        # reaches every API on the gateway.
+        self._pipelined = pipelined
+        if pipelined:
+            self._connection.get_pipeline()
         # Core capability is always present (no version floor). Additional
         # capabilities are gated by min_layout_version + runtime probe and
         # added during async_get_static_data().
         self._capabilities: list[Capability] = [CAPABILITIES[0]()]
+        # Failure counters per capability; quarantined ones aren't polled.
+        self._health: dict[str, CapabilityHealth] = {
+            self._capabilities[0].key: CapabilityHealth()
+        }
         self._loaded: bool = False
+        # Compiled poll plans, one per combination of due tiers.
+        self._read_plans: dict[frozenset[PollTier], ReadPlan] = {}
+        # Last value of every polled register; tiers not due this poll
+        # decode from here. Block reads land in it directly.
+        self._register_image: dict[int, int] = {}
+        self._unread_tiers: set[PollTier] = set(ALL_TIERS)
+        # Addresses whose word in the register image changed since the
+        # last completed decode, plus each capability's last decode: a
+        # capability none of whose addresses changed skips decoding.
+        # Tracked per address, not per block, because every tier
+        # combination plans its own blocks.
+        self._changed_addresses: set[int] = set()
+        self._decoded: dict[str, dict[str, Any]] = {}
+        self._changed_keys: frozenset[str] = frozenset()
+        # Keys the caller still needs; capabilities poll only their
+        # registers. None: poll everything.
+        self._demand: frozenset[str] | None = None
+        # time.monotonic() of the last transaction the wallbox answered;
+        # the keep-alive loop only speaks up when this gets too old.
+        self._last_transaction: float | None = None
 
     async def connect(self) -> None:
         """Connect to the wallbox (no-op if already connected)."""
+        if not self._connection_held:
+            self._connection = CONNECTION_POOL.acquire(self._host, self._port)
+            self._connection_held = True
+            self._client = self._connection.client
         if self._client.connected:
             return
-        try:
-            result = await self._client.connect()
-            if not result:
+        async with self._connection.transaction(TransactionPriority.CONTROL):
+            # Another API on the same gateway may have connected meanwhile.
+            if self._client.connected:
+                return
+            try:
+                result = await self._client.connect()
+                if not result:
+                    raise HeidelbergEnergyControlConnectionError(
+                        "Failed to connect to the wallbox"
+                    )
+            except (ModbusException, OSError) as err:
+                _LOGGER.error("Modbus connection error: %s", err)
                 raise HeidelbergEnergyControlConnectionError(
-                    "Failed to connect to the wallbox"
-                )
-        except (ModbusException, OSError) as err:
-            _LOGGER.error("Modbus connection error: %s", err)
-            raise HeidelbergEnergyControlConnectionError(
-                f"Failed to connect to the wallbox: {err}"
-            ) from err
+                    f"Failed to connect to the wallbox: {err}"
+                ) from err
 
     async def disconnect(self) -> None:
-        """Disconnect from the wallbox."""
-        if self._client.connected:
-            self._client.close()
+        """Release the shared gateway connection.
+
+        The socket only closes once no other API on the same gateway
+        still uses it. Safe to call more than once.
+        """
+        if not self._connection_held:
+            return
+        self._connection_held = False
+        CONNECTION_POOL.release(self._connection)
+
+    @property
+    def changed_keys(self) -> frozenset[str]:
+        """Data keys whose decoded value changed in the last `async_get_data`."""
+        return self._changed_keys
+
+    @property
+    def polled_keys(self) -> frozenset[str]:
+        """Keys `async_get_data` decodes under the current demand."""
+        return frozenset(
+            key for cap in self._polled_capabilities for key in cap.polled_keys
+        )
+
+    @property
+    def available_keys(self) -> frozenset[str]:
+        """Every key the loaded capabilities can poll, demanded or not."""
+        return frozenset(
+            key for cap in self._capabilities for key in type(cap).polled_keys
+        )
+
+    def set_polled_keys(self, keys: Collection[str] | None) -> None:
+        """Poll only the registers behind `keys`; None polls everything.
+
+        Recompiles the read plans lazily. Every tier is read on the next
+        poll, so registers that just became needed have a value at once.
+        """
+        demand = None if keys is None else frozenset(keys)
+        if demand == self._demand:
+            return
+        self._demand = demand
+        self._restrict_capabilities()
+        self._unread_tiers = set(ALL_TIERS)
+        _LOGGER.debug("Demand-driven read plan: %s", self.read_plan.describe())
+
+    @property
+    def transaction_stats(self) -> dict[str, dict[str, float | int]]:
+        """Queue-wait metrics per priority class on this API's gateway."""
+        return {
+            priority.name.lower(): stats.as_dict()
+            for priority, stats in self._connection.scheduler.stats.items()
+        }
+
+    @property
+    def seconds_since_transaction(self) -> float | None:
+        """Seconds since the wallbox last answered a transaction, if ever."""
+        if self._last_transaction is None:
+            return None
+        return time.monotonic() - self._last_transaction
+
+    @property
+    def pipelined(self) -> bool:
+        """Return True while polls are read in pipelined mode."""
+        return self._pipelined and self._connection.pipeline is not None
+
+    def set_pipelined(self, enabled: bool) -> None:
+        """Switch pipelined reads on or off from the next poll on.
+
+        Switching off only stops this API from using the gateway's
+        pipelined socket; other APIs on the gateway may still use it.
+        """
+        self._pipelined = enabled
+        if enabled:
+            self._connection.get_pipeline()
 
     @property
     def capabilities(self) -> list[Capability]:
         """Loaded capabilities, in registration order."""
         return list(self._capabilities)
 
+    @property
+    def capability_health(self) -> dict[str, dict[str, Any]]:
+        """Failure counts and quarantine state per loaded capability."""
+        now = time.monotonic()
+        return {key: health.as_dict(now) for key, health in self._health.items()}
+
+    @property
+    def _polled_capabilities(self) -> list[Capability]:
+        """Loaded capabilities that aren't quarantined, core first."""
+        return [
+            cap for cap in self._capabilities if not self._health[cap.key].quarantined
+        ]
+
     async def async_read_registers(
-        self, definitions: list[RegisterDefinition]
+        self,
+        definitions: list[RegisterDefinition],
+        priority: TransactionPriority = TransactionPriority.SLOW_POLL,
     ) -> dict[int, int]:
         """Read every register described by `definitions` in as few Modbus calls as possible.
 
-        Sorts definitions by (type, address) and coalesces consecutive
-        same-type reads into single block transactions. Returns a dict
-        keyed by absolute register address, so a capability that
-        declared `RegisterDefinition(15, 2, INPUT)` decodes as
-        `regs[15]` and `regs[16]`.
-
-        Duplicate definitions are tolerated (the merge simply reads
-        the address once). Non-consecutive addresses become separate
-        block reads.
+        `plan_blocks` coalesces same-type definitions into block
+        transactions, bridging holes of up to `max_gap` registers.
+        Returns a dict keyed by absolute register address, so a
+        capability that declared `RegisterDefinition(15, 2, INPUT)`
+        decodes as `regs[15]` and `regs[16]`. Bridged gap addresses
+        are read but not returned.
+
+        If a gap-bridging block is rejected by the device, it is retried
+        as its gap-free sub-blocks. When those succeed and the device
+        answered "illegal data address", the bridged addresses are
+        remembered as unreadable so later plans never cross them again.
+        A rejected gap-free block is bisected down to the addresses the
+        device refuses (see `_async_bisect`); those are remembered too,
+        and their words are left out of `result`. Any other rejection
+        is treated as transient: nothing is learned and the next poll
+        tries again.
+
+        Each block transaction waits for the gateway at `priority`;
+        ad-hoc reads default to the slow class so they never hold up
+        control writes or regular polls.
         """
         await self.connect()
 
         result: dict[int, int] = {}
-        if not definitions:
-            return result
-
-        # Deduplicate first so overlapping definitions don't split a block.
-        unique = list({(d.type, d.address, d.count): d for d in definitions}.values())
-        sorted_defs = sorted(unique, key=lambda d: (d.type.value, d.address))
-
-        i = 0
-        while i < len(sorted_defs):
-            current = sorted_defs[i]
-            start_addr = current.address
-            end_addr = current.address + current.count
-            merge_count = 1
-
-            while i + merge_count < len(sorted_defs):
-                nxt = sorted_defs[i + merge_count]
-                if nxt.type == current.type and nxt.address == end_addr:
-                    end_addr += nxt.count
-                    merge_count += 1
-                else:
-                    break
+        if definitions:
+            await self._async_read_blocks(
+                plan_blocks(definitions, self._max_gap, self._unreadable),
+                result,
+                priority,
+            )
+        return result
 
-            total_count = end_addr - start_addr
-            try:
-                if current.type == RegisterType.INPUT:
-                    read_result = await self._client.read_input_registers(
-                        address=start_addr,
-                        count=total_count,
-                        device_id=self._device_id,
-                    )
-                else:
-                    read_result = await self._client.read_holding_registers(
-                        address=start_addr,
-                        count=total_count,
-                        device_id=self._device_id,
-                    )
-            except (ModbusException, OSError) as err:
-                raise HeidelbergEnergyControlReadError(
-                    f"Failed to read {total_count} {current.type.value} register(s) at {start_addr}: {err}"
-                ) from err
+    @property
+    def unreadable_addresses(self) -> frozenset[tuple[RegisterType, int]]:
+        """Addresses the merge planner must never bridge on this device."""
+        return frozenset(self._unreadable)
 
-            if read_result.isError():
-                raise HeidelbergEnergyControlReadError(
-                    f"Failed to read {total_count} {current.type.value} register(s) at {start_addr}"
-                )
+    def mark_unreadable(self, register_type: RegisterType, address: int) -> None:
+        """Record an address the device rejects, so reads avoid it.
+
+        Merged blocks stop bridging it and capabilities stop polling the
+        fields that live in it (their keys drop out of the poll data).
+        """
+        if (register_type, address) in self._unreadable:
+            return
+        self._unreadable.add((register_type, address))
+        self._restrict_capabilities()
 
-            for offset in range(total_count):
-                result[start_addr + offset] = read_result.registers[offset]
+    def _restrict_capabilities(self) -> None:
+        """Narrow every capability to the demand and the readable fields."""
+        for cap in self._capabilities:
+            cap.restrict(self._demand, self._unreadable)
+        self._read_plans.clear()
+        self._decoded.clear()
 
-            i += merge_count
+    @property
+    def read_plan(self) -> ReadPlan:
+        """The compiled plan that polls every tier of the loaded capabilities."""
+        return self.read_plan_for(ALL_TIERS)
 
-        return result
+    def read_plan_for(self, tiers: Collection[PollTier]) -> ReadPlan:
+        """The compiled poll plan for one combination of tiers.
+
+        Compiled on first use and reused by every later `async_get_data`
+        call for the same tiers; recompiled lazily only after the
+        capability set or the unreadable-address set changes.
+        """
+        tiers = frozenset(tiers)
+        plan = self._read_plans.get(tiers)
+        if plan is None:
+            plan = self._read_plans[tiers] = ReadPlan.compile(
+                self._polled_capabilities, self._max_gap, self._unreadable, tiers
+            )
+        return plan
+
+    async def _async_read_blocks(
+        self,
+        blocks: Iterable[RegisterBlock],
+        result: dict[int, int],
+        priority: TransactionPriority,
+    ) -> None:
+        """Run planned block transactions into `result`, learning unreadable gaps.
+
+        In pipelined mode every block is sent at once; blocks the device
+        rejects, or all blocks if the gateway can't pipeline, then go
+        through the serial path below.
+        """
+        blocks = list(blocks)
+        if self.pipelined and len(blocks) > 1:
+            blocks = await self._async_read_blocks_pipelined(
+                blocks, result, priority
+            )
+
+        for block in blocks:
+            try:
+                await self._async_read_block(block, result, priority)
+            except _BlockRejectedError as err:
+                if block.gaps:
+                    await self._async_read_split(block, result, priority, err)
+                else:
+                    await self._async_bisect(block, result, priority, err)
+
+    async def _async_read_blocks_pipelined(
+        self,
+        blocks: list[RegisterBlock],
+        result: dict[int, int],
+        priority: TransactionPriority,
+    ) -> list[RegisterBlock]:
+        """Read `blocks` pipelined; return the blocks still to be read serially."""
+        try:
+            async with self._connection.transaction(priority):
+                # Another API may have dropped it while this one waited.
+                if (pipeline := self._connection.pipeline) is None:
+                    return blocks
+                replies = await pipeline.async_read_blocks(
+                    self._device_id, blocks
+                )
+        except PipelineError as err:
+            _LOGGER.warning(
+                "Gateway %s:%s does not handle pipelined reads (%s); "
+                "falling back to serial reads",
+                self._host,
+                self._port,
+                err,
+            )
+            self._connection.drop_pipeline()
+            return blocks
+
+        # Rejected blocks are retried serially, so they are split or
+        # bisected (or their error surfaces) as without pipelining; the
+        # pipelined reply carries no exception code to learn from.
+        pending: list[RegisterBlock] = []
+        for block, registers in zip(blocks, replies, strict=True):
+            if registers is None:
+                pending.append(block)
+            else:
+                self._store_block(block, registers, result)
+        return pending
+
+    async def _async_read_split(
+        self,
+        block: RegisterBlock,
+        result: dict[int, int],
+        priority: TransactionPriority,
+        error: _BlockRejectedError,
+    ) -> None:
+        """Re-read a rejected gap-bridging block as its gap-free sub-blocks.
+
+        The gap addresses are only learned if the device answered
+        "illegal data address"; after any other rejection the merged
+        block is tried again on the next poll.
+        """
+        _LOGGER.debug(
+            "Merged read of %s %s register(s) at %s rejected (%s); "
+            "reading it without gap address(es) %s",
+            block.count,
+            block.type.value,
+            block.address,
+            error,
+            block.gaps,
+        )
+        for sub_block in block.split():
+            try:
+                await self._async_read_block(sub_block, result, priority)
+            except _BlockRejectedError as err:
+                await self._async_bisect(sub_block, result, priority, err)
+        if error.illegal_address:
+            self._unreadable.update((block.type, a) for a in block.gaps)
+            self._read_plans.clear()
+
+    async def _async_bisect(
+        self,
+        block: RegisterBlock,
+        result: dict[int, int],
+        priority: TransactionPriority,
+        error: _BlockRejectedError,
+    ) -> None:
+        """Find the addresses a rejected gap-free block trips over.
+
+        The block is re-read in halves, recursively, until every
+        rejected half is a single register. Registers the device
+        answered "illegal data address" for are marked unreadable and
+        the rest of the block lands in `result` as usual.
+
+        Any other rejection (a busy or failing device, a gateway error)
+        says nothing about the register itself, so it is never learned:
+        `error` is re-raised and the next poll reads the block again.
+        """
+        rejected: dict[int, bool] = {}
+        await self._async_read_halves(block, result, priority, rejected)
+        if block.count == 1:
+            rejected[block.address] = error.illegal_address
+        if not rejected:
+            return  # every half read fine; the rejection was transient
+        illegal = sorted(a for a, is_illegal in rejected.items() if is_illegal)
+        if illegal:
+            _LOGGER.info(
+                "Device rejects %s register(s) %s; reading around them from now on",
+                block.type.value,
+                illegal,
+            )
+            self._unreadable.update((block.type, a) for a in illegal)
+            self._restrict_capabilities()
+        if len(illegal) < len(rejected):
+            raise error
+
+    async def _async_read_halves(
+        self,
+        block: RegisterBlock,
+        result: dict[int, int],
+        priority: TransactionPriority,
+        rejected: dict[int, bool],
+    ) -> None:
+        """Read both halves of `block`, recursing into rejected ones.
+
+        Single registers the device rejects go into `rejected`, mapped
+        to whether it answered "illegal data address".
+        """
+        if block.count == 1:
+            return
+        half = block.count // 2
+        for part in (
+            RegisterBlock(block.type, block.address, half),
+            RegisterBlock(block.type, block.address + half, block.count - half),
+        ):
+            try:
+                await self._async_read_block(part, result, priority)
+            except _BlockRejectedError as err:
+                if part.count == 1:
+                    rejected[part.address] = err.illegal_address
+                else:
+                    await self._async_read_halves(part, result, priority, rejected)
 
     async def async_get_static_data(self) -> dict[str, Any] | None:
         """Read static data via the core capability, then load the rest.
@@ -161,20 +501,20 @@ class HeidelbergEnergyControlAPI:
         capabilities isn't useful here because static reads only
         happen once at setup).
         """
-        await self.connect()
-
-        core_cap = self._capabilities[0]
-        core_regs = await self.async_read_registers(list(core_cap.static_definitions))
-        static: dict[str, Any] = dict(core_cap.decode_static(core_regs))
-
+        static = await self.async_read_core_static_data()
         layout_str = static.get(DATA_REG_LAYOUT_VER)
 
+        capabilities = [self._capabilities[0]]
         for cls in CAPABILITIES[1:]:
             cap = cls()
             if not self._version_gate_passes(cap, layout_str):
                 continue
             try:
-                if not await cap.async_probe(self._client, self._device_id):
+                async with self._connection.transaction(
+                    TransactionPriority.SLOW_POLL
+                ):
+                    supported = await cap.async_probe(self._client, self._device_id)
+                if not supported:
                     continue
                 if cap.static_definitions:
                     cap_regs = await self.async_read_registers(
@@ -186,11 +526,47 @@ class HeidelbergEnergyControlAPI:
                     "Capability %r failed to load, skipping: %s", cap.key, err
                 )
                 continue
-            self._capabilities.append(cap)
+            capabilities.append(cap)
 
-        self._loaded = True
+        self._load_capabilities(capabilities)
         return static
 
+    async def async_read_core_static_data(self) -> dict[str, Any]:
+        """Read the core capability's static data (versions, hardware limits)."""
+        await self.connect()
+        core_cap = self._capabilities[0]
+        core_regs = await self.async_read_registers(list(core_cap.static_definitions))
+        return dict(core_cap.decode_static(core_regs))
+
+    def restore_static_data(
+        self, static: dict[str, Any], capability_keys: Collection[str]
+    ) -> dict[str, Any]:
+        """Load the capabilities a previous `async_get_static_data` found.
+
+        No Modbus traffic: the caller vouches that `static` and
+        `capability_keys` were read from this device (e.g. cached from
+        an earlier start), and revalidates them later.
+        """
+        self._load_capabilities(
+            [
+                self._capabilities[0],
+                *(cls() for cls in CAPABILITIES[1:] if cls.key in capability_keys),
+            ]
+        )
+        return dict(static)
+
+    def _load_capabilities(self, capabilities: list[Capability]) -> None:
+        """Poll `capabilities` from now on, core first."""
+        self._capabilities = capabilities
+        self._health = {
+            cap.key: self._health.get(cap.key) or CapabilityHealth()
+            for cap in capabilities
+        }
+        self._restrict_capabilities()
+        self._loaded = True
+        self._unread_tiers = set(ALL_TIERS)
+        _LOGGER.debug("Compiled read plan: %s", self.read_plan.describe())
+
     async def async_write_command(self, key: str, value: int) -> bool:
         """Write a value for a symbolic command key (FC06).
 
@@ -202,9 +578,15 @@ class HeidelbergEnergyControlAPI:
         await self.connect()
         for cap in self._capabilities:
             if cap.supports_write(key):
-                result = await cap.async_write(
-                    self._client, self._device_id, key, value
-                )
+                async with self._connection.transaction(
+                    TransactionPriority.CONTROL
+                ):
+                    result = await cap.async_write(
+                        self._client, self._device_id, key, value
+                    )
+                self._last_transaction = time.monotonic()
+                if result:
+                    self._apply_write(cap, key, value)
                 _LOGGER.debug(
                     "Write complete: WRITE: %.3fs",
                     time.perf_counter() - write_start,
@@ -215,26 +597,110 @@ class HeidelbergEnergyControlAPI:
             f"No capability owns writes for command {key!r}"
         )
 
-    async def async_get_data(self) -> dict[str, Any]:
-        """Batch-read every loaded capability's polled registers and merge decodes.
+    def _apply_write(self, cap: Capability, key: str, value: int) -> None:
+        """Put a written value into the register image.
 
-        Definitions are collected across all capabilities and handed to
-        `async_read_registers`, which coalesces consecutive same-type
-        blocks into single Modbus transactions. Each capability then
-        decodes its own slice from the resulting {address: value} dict.
+        A slow-tier register (remote lock, standby, watchdog) may not be
+        read again for minutes, so the written words are stored as if
+        read. Dropping the capability's cached decode makes the next
+        poll decode them even if none of its blocks are re-read.
+        """
+        assert cap.compiled_schema is not None
+        address, words = cap.compiled_schema.encode(key, value)
+        for offset, word in enumerate(words):
+            self._register_image[address + offset] = word
+        self._decoded.pop(cap.key, None)
+
+    async def async_keepalive(self) -> None:
+        """Feed the wallbox watchdog with the cheapest transaction there is.
+
+        One single-register holding read (the target current) at
+        KEEPALIVE priority: it goes before queued polls, after control
+        writes. The value is discarded.
+        """
+        await self.connect()
+        try:
+            async with self._connection.transaction(TransactionPriority.KEEPALIVE):
+                result = await self._client.read_holding_registers(
+                    address=_KEEPALIVE_REGISTER, count=1, device_id=self._device_id
+                )
+        except (ModbusException, OSError) as err:
+            raise HeidelbergEnergyControlReadError(
+                f"Keep-alive read failed: {err}"
+            ) from err
+        if result.isError():
+            raise HeidelbergEnergyControlReadError("Keep-alive read was rejected")
+        self._last_transaction = time.monotonic()
+
+    async def async_get_data(
+        self, tiers: Collection[PollTier] | None = None
+    ) -> dict[str, Any]:
+        """Batch-read the loaded capabilities' polled registers and merge decodes.
+
+        Reads the registers of `tiers` (default: all) via the cached plan
+        for that tier combination, so a poll does no planning work.
+        Tiers that have never been read are always added, so every
+        capability can decode. Fresh words are merged into the register
+        image, and each capability decodes from the full image.
+
+        Every word read is compared with the one already in the image. A
+        capability none of whose addresses (per the all-tier plan's slice
+        map) changed reuses its previous decode instead of decoding again.
+        `changed_keys` then reports exactly which keys differ from the
+        previous result.
         """
         all_start = time.perf_counter()
         await self.connect()
+        await self._async_reprobe_quarantined(time.monotonic())
 
-        all_defs: list[RegisterDefinition] = []
-        for cap in self._capabilities:
-            all_defs.extend(cap.polled_definitions)
-
-        registers = await self.async_read_registers(all_defs)
+        due = ALL_TIERS if tiers is None else frozenset(tiers) | self._unread_tiers
+        plan = self.read_plan_for(due)
+        try:
+            await self._async_read_blocks(
+                plan.blocks, self._register_image, TransactionPriority.FAST_POLL
+            )
+        except HeidelbergEnergyControlReadError as err:
+            await self._async_read_isolated(due, err)
+        self._unread_tiers -= due
+        registers = self._register_image
+        # Kept until every capability decoded: words a failed poll stored
+        # still count as changed next time, whichever tiers are due then.
+        # Hence the all-tier plan's slices: they hold every address a
+        # capability decodes from.
+        changed_addresses = self._changed_addresses
+        slice_plan = self.read_plan
 
         merged: dict[str, Any] = {}
-        for cap in self._capabilities:
-            merged.update(cap.decode_polled(registers))
+        changed_keys: set[str] = set()
+        for cap in self._polled_capabilities:
+            previous = self._decoded.get(cap.key)
+            if previous is not None and not (
+                changed_addresses
+                and self._slices_changed(slice_plan, cap.key, changed_addresses)
+            ):
+                merged.update(previous)
+                continue
+            # A schema decode raises these on a missing or malformed word;
+            # anything else is a bug and propagates.
+            try:
+                decoded = cap.decode_polled(registers)
+            except (KeyError, TypeError, ValueError) as err:
+                if cap is self._capabilities[0]:
+                    raise
+                self._quarantine(cap, err)
+                continue
+            if previous is None:
+                changed_keys.update(decoded)
+            else:
+                changed_keys.update(
+                    key
+                    for key, value in decoded.items()
+                    if key not in previous or previous[key] != value
+                )
+            self._decoded[cap.key] = decoded
+            merged.update(decoded)
+        self._changed_keys = frozenset(changed_keys)
+        changed_addresses.clear()
 
         _LOGGER.debug(
             "Fetch complete: Total: %.3fs",
@@ -242,6 +708,94 @@ class HeidelbergEnergyControlAPI:
         )
         return merged
 
+    @staticmethod
+    def _slices_changed(plan: ReadPlan, key: str, changed: set[int]) -> bool:
+        """Return True if any address of `key`'s slices is in `changed`."""
+        for s in plan.slices.get(key, ()):
+            start = plan.blocks[s.block].address + s.offset
+            if not changed.isdisjoint(range(start, start + s.count)):
+                return True
+        return False
+
+    async def _async_read_isolated(
+        self, tiers: frozenset[PollTier], error: HeidelbergEnergyControlReadError
+    ) -> None:
+        """Re-read a failed poll capability by capability.
+
+        Optional capabilities whose own reads fail are quarantined; the
+        poll goes on with the rest. Raises if the core capability's
+        reads fail, as there is nothing to publish without them.
+        """
+        _LOGGER.debug("Poll read failed (%s); reading capabilities one by one", error)
+        core, *optional = self._polled_capabilities
+        try:
+            await self._async_read_capability(core, tiers, TransactionPriority.FAST_POLL)
+        except HeidelbergEnergyControlReadError as err:
+            self._health[core.key].record_error(err)
+            raise
+        for cap in optional:
+            try:
+                await self._async_read_capability(
+                    cap, tiers, TransactionPriority.FAST_POLL
+                )
+            except HeidelbergEnergyControlReadError as err:
+                self._quarantine(cap, err)
+
+    async def _async_reprobe_quarantined(self, now: float) -> None:
+        """Re-probe quarantined capabilities whose backoff has passed.
+
+        A capability is polled again once its `async_probe` passes and
+        its polled registers read cleanly (straight into the image, so
+        it decodes at once); otherwise its backoff doubles.
+        """
+        for cap in self._capabilities[1:]:
+            health = self._health[cap.key]
+            if not health.due(now):
+                continue
+            try:
+                async with self._connection.transaction(
+                    TransactionPriority.SLOW_POLL
+                ):
+                    supported = await cap.async_probe(self._client, self._device_id)
+                if not supported:
+                    raise HeidelbergEnergyControlReadError(
+                        f"Probe of capability {cap.key!r} failed"
+                    )
+                await self._async_read_capability(
+                    cap, ALL_TIERS, TransactionPriority.SLOW_POLL
+                )
+            except HeidelbergEnergyControlReadError as err:
+                self._quarantine(cap, err)
+                continue
+            health.record_recovery()
+            _LOGGER.info("Capability %r recovered; polling it again", cap.key)
+            self._read_plans.clear()
+
+    async def _async_read_capability(
+        self,
+        cap: Capability,
+        tiers: Collection[PollTier],
+        priority: TransactionPriority,
+    ) -> None:
+        """Read one capability's polled registers in `tiers` into the image."""
+        await self._async_read_blocks(
+            ReadPlan.compile([cap], self._max_gap, self._unreadable, tiers).blocks,
+            self._register_image,
+            priority,
+        )
+
+    def _quarantine(self, cap: Capability, error: Exception) -> None:
+        """Leave a failing capability out of polls until its next re-probe."""
+        delay = self._health[cap.key].record_failure(time.monotonic(), error)
+        _LOGGER.warning(
+            "Capability %r failed (%s); not polling it for %.0f s",
+            cap.key,
+            error,
+            delay,
+        )
+        self._read_plans.clear()
+        self._decoded.pop(cap.key, None)
+
     # --- helpers retained for backwards compatibility with existing tests ---
 
     def _register_to_version(self, decimal_value: int) -> str:
@@ -252,6 +806,62 @@ class HeidelbergEnergyControlAPI:
 
     # --- internal ---
 
+    async def _async_read_block(
+        self,
+        block: RegisterBlock,
+        result: dict[int, int],
+        priority: TransactionPriority,
+    ) -> None:
+        """Run one block transaction and store the requested words in `result`."""
+        try:
+            async with self._connection.transaction(priority):
+                if block.type == RegisterType.INPUT:
+                    read_result = await self._client.read_input_registers(
+                        address=block.address,
+                        count=block.count,
+                        device_id=self._device_id,
+                    )
+                else:
+                    read_result = await self._client.read_holding_registers(
+                        address=block.address,
+                        count=block.count,
+                        device_id=self._device_id,
+                    )
+        except (ModbusException, OSError) as err:
+            raise HeidelbergEnergyControlReadError(
+                f"Failed to read {block.count} {block.type.value} register(s) at {block.address}: {err}"
+            ) from err
+
+        if read_result.isError() or len(read_result.registers) < block.count:
+            raise _BlockRejectedError(
+                f"Failed to read {block.count} {block.type.value} register(s) at {block.address}",
+                illegal_address=getattr(read_result, "exception_code", None)
+                == _ILLEGAL_DATA_ADDRESS,
+            )
+
+        self._store_block(block, read_result.registers, result)
+
+    def _store_block(
+        self, block: RegisterBlock, registers: list[int], result: dict[int, int]
+    ) -> None:
+        """Copy a block's requested words into `result`, skipping gap words.
+
+        Words that change the poll's register image are recorded in
+        `_changed_addresses`.
+        """
+        self._last_transaction = time.monotonic()
+        gaps = block.gaps
+        changed = (
+            self._changed_addresses if result is self._register_image else None
+        )
+        for offset in range(block.count):
+            addr = block.address + offset
+            if addr not in gaps:
+                word = registers[offset]
+                if changed is not None and result.get(addr) != word:
+                    changed.add(addr)
+                result[addr] = word
+
     @staticmethod
     def _version_gate_passes(cap: Capability, layout_str: str | None) -> bool:
         """Apply the capability's min_layout_version gate. Fail-open on parse errors."""
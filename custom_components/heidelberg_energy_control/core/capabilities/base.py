@@ -4,9 +4,13 @@ A capability owns a group of related Modbus registers (e.g. v1.0.x
 core data, MID power meter, phase switch). Each capability declares
 its register needs as immutable tuples of `RegisterDefinition`; the
 API collects definitions from every loaded capability and coalesces
-consecutive same-type reads into single block transactions. The
+nearby same-type reads into single block transactions. The
 capability then decodes its part of the response synchronously from
-a `{address: value}` dict.
+an `{address: value}` mapping.
+
+Most capabilities don't write any of that by hand: they declare a
+`schema` of `RegisterField`s, and the compiled schema supplies the
+polled definitions, polled keys, `decode_polled` and the writes.
 
 Subclasses override only the hooks they actually use. Defaults are
 no-ops so a capability that only contributes static data, or only
@@ -15,9 +19,17 @@ handles one write, stays minimal.
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Collection, Mapping
+import logging
+from typing import Any, ClassVar
+
+from pymodbus.exceptions import ModbusException
 
-from ..registers import RegisterDefinition
+from ..exceptions import HeidelbergEnergyControlWriteError
+from ..registers import PollTier, RegisterDefinition, RegisterType
+from ..schema import CompiledSchema, RegisterField, compile_schema
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class Capability:
@@ -26,9 +38,68 @@ class Capability:
     key: str = ""
     min_layout_version: str | None = None
 
+    # Default tier for polled definitions that don't set their own.
+    poll_tier: PollTier = PollTier.FAST
+
     static_definitions: tuple[RegisterDefinition, ...] = ()
     polled_definitions: tuple[RegisterDefinition, ...] = ()
 
+    # Keys decode_polled produces.
+    polled_keys: tuple[str, ...] = ()
+
+    # Declarative polled/writable registers; compiled once per class.
+    schema: tuple[RegisterField, ...] = ()
+    compiled_schema: ClassVar[CompiledSchema | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the subclass's schema into definitions, keys and decoder."""
+        super().__init_subclass__(**kwargs)
+        if "schema" not in cls.__dict__:
+            return
+        compiled = cls.compiled_schema = compile_schema(cls.schema)
+        cls.polled_definitions = compiled.polled_definitions
+        cls.polled_keys = compiled.polled_keys
+        if "decode_polled" not in cls.__dict__:
+            cls.decode_polled = staticmethod(compiled.decode)  # type: ignore[method-assign,assignment]
+
+    def restrict(
+        self,
+        keys: Collection[str] | None,
+        unreadable: Collection[tuple[RegisterType, int]] = (),
+    ) -> None:
+        """Poll only the schema fields for `keys`; None polls every field.
+
+        Fields living in an `unreadable` `(type, address)` are dropped
+        as well, so their keys are absent from the poll data instead of
+        failing the read. Narrows this instance's polled definitions,
+        keys and decoder to a sub-schema (compiled and cached like the
+        full one). Writes keep using the full schema. No-op without a
+        schema.
+        """
+        if self.compiled_schema is None:
+            return
+        fields = tuple(
+            f
+            for f in self.schema
+            if (keys is None or f.key in keys)
+            and not any(
+                (f.type, a) in unreadable
+                for a in range(f.address, f.address + f.width)
+            )
+        )
+        compiled = (
+            self.compiled_schema
+            if len(fields) == len(self.schema)
+            else compile_schema(fields)
+        )
+        self.polled_definitions = compiled.polled_definitions
+        self.polled_keys = compiled.polled_keys
+        self.decode_polled = compiled.decode  # type: ignore[method-assign]
+
+    def tier_of(self, definition: RegisterDefinition) -> PollTier:
+        """Return the polling tier a definition of this capability runs in."""
+        return definition.tier or self.poll_tier
+
     async def async_probe(self, client: Any, device_id: int) -> bool:
         """Runtime check after the version gate passes.
 
@@ -37,7 +108,7 @@ class Capability:
         """
         return True
 
-    def decode_static(self, registers: dict[int, int]) -> dict[str, Any]:
+    def decode_static(self, registers: Mapping[int, int]) -> dict[str, Any]:
         """Build this capability's contribution to the static-data dict.
 
         `registers` contains the values for every address in
@@ -47,16 +118,44 @@ class Capability:
         """
         return {}
 
-    def decode_polled(self, registers: dict[int, int]) -> dict[str, Any]:
+    def decode_polled(self, registers: Mapping[int, int]) -> dict[str, Any]:
         """Build this capability's contribution to the polled-data dict."""
         return {}
 
     def supports_write(self, key: str) -> bool:
         """Return True if this capability owns writes for the given command key."""
-        return False
+        schema = self.compiled_schema
+        return schema is not None and key in schema.encoders
 
     async def async_write(
         self, client: Any, device_id: int, key: str, value: int
     ) -> bool:
-        """Perform a write owned by this capability, addressed by command key."""
-        raise NotImplementedError
+        """Perform a write owned by this capability, addressed by command key.
+
+        Default: write the schema field's register(s) — FC06 for one
+        word, FC16 for a 32-bit value.
+        """
+        if self.compiled_schema is None:
+            raise NotImplementedError
+        address, words = self.compiled_schema.encode(key, value)
+        try:
+            if len(words) == 1:
+                result = await client.write_register(
+                    address=address, value=words[0], device_id=device_id
+                )
+            else:
+                result = await client.write_registers(
+                    address=address, values=words, device_id=device_id
+                )
+            if result.isError():
+                raise HeidelbergEnergyControlWriteError(
+                    f"Failed to write command {key} (register {address})"
+                )
+            return True
+        except (ModbusException, OSError) as err:
+            _LOGGER.error(
+                "Error on writing command %s (reg %s): %s", key, address, err
+            )
+            raise HeidelbergEnergyControlWriteError(
+                f"Failed to write command {key} (register {address}): {err}"
+            ) from err
@@ -11,36 +11,37 @@ below 1.0.8 do not.
 
 from __future__ import annotations
 
-import logging
 from typing import Any
 
 from pymodbus.exceptions import ModbusException
 
 from ...const import COMMAND_STANDBY
-from ..exceptions import HeidelbergEnergyControlWriteError
-from ..registers import RegisterDefinition, RegisterType
+from ..registers import PollTier, RegisterType
+from ..schema import RegisterField
 from .base import Capability
 
-_LOGGER = logging.getLogger(__name__)
-
 REG_COMMAND_STANDBY = 258
 
 _STANDBY_ENABLED = 0
 _STANDBY_DISABLED = 4
 
-_COMMAND_REGISTERS: dict[str, int] = {
-    COMMAND_STANDBY: REG_COMMAND_STANDBY,
-}
-
 
 class StandbyCapability(Capability):
     """Standby-mode control (holding register 258)."""
 
     key = "standby"
     min_layout_version = "1.0.8"
-
-    polled_definitions: tuple[RegisterDefinition, ...] = (
-        RegisterDefinition(REG_COMMAND_STANDBY, 1, RegisterType.HOLDING),
+    poll_tier = PollTier.SLOW
+
+    # Switch is "on" when the standby function is enabled (register = 0).
+    schema: tuple[RegisterField, ...] = (
+        RegisterField(
+            COMMAND_STANDBY,
+            REG_COMMAND_STANDBY,
+            RegisterType.HOLDING,
+            bool_when=("==", _STANDBY_ENABLED),
+            writable=True,
+        ),
     )
 
     async def async_probe(self, client: Any, device_id: int) -> bool:
@@ -58,31 +59,3 @@ class StandbyCapability(Capability):
         except (ModbusException, OSError):
             return False
         return not result.isError()
-
-    def decode_polled(self, registers: dict[int, int]) -> dict[str, Any]:
-        # Switch is "on" when the standby function is enabled (register = 0).
-        return {COMMAND_STANDBY: registers[REG_COMMAND_STANDBY] == _STANDBY_ENABLED}
-
-    def supports_write(self, key: str) -> bool:
-        return key in _COMMAND_REGISTERS
-
-    async def async_write(
-        self, client: Any, device_id: int, key: str, value: int
-    ) -> bool:
-        address = _COMMAND_REGISTERS[key]
-        try:
-            result = await client.write_register(
-                address=address, value=int(value), device_id=device_id
-            )
-            if result.isError():
-                raise HeidelbergEnergyControlWriteError(
-                    f"Failed to write command {key} (register {address})"
-                )
-            return True
-        except (ModbusException, OSError) as err:
-            _LOGGER.error(
-                "Error on writing command %s (reg %s): %s", key, address, err
-            )
-            raise HeidelbergEnergyControlWriteError(
-                f"Failed to write command {key} (register {address}): {err}"
-            ) from err
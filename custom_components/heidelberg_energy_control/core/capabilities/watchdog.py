@@ -16,36 +16,39 @@ wire-format integer that goes back over Modbus.
 
 from __future__ import annotations
 
-import logging
 from typing import Any
 
 from pymodbus.exceptions import ModbusException
 
 from ...const import COMMAND_FAILSAFE_CURRENT, COMMAND_WATCHDOG_TIMEOUT
-from ..exceptions import HeidelbergEnergyControlWriteError
-from ..registers import RegisterDefinition, RegisterType
+from ..registers import PollTier, RegisterType
+from ..schema import RegisterField
 from .base import Capability
 
-_LOGGER = logging.getLogger(__name__)
-
 REG_WATCHDOG_TIMEOUT = 257
 REG_FAILSAFE_CURRENT = 262
 
-_COMMAND_REGISTERS: dict[str, int] = {
-    COMMAND_WATCHDOG_TIMEOUT: REG_WATCHDOG_TIMEOUT,
-    COMMAND_FAILSAFE_CURRENT: REG_FAILSAFE_CURRENT,
-}
-
 
 class WatchdogCapability(Capability):
     """Watchdog timeout (reg 257) + FailSafe current (reg 262)."""
 
     key = "watchdog"
     min_layout_version = "1.0.8"
-
-    polled_definitions: tuple[RegisterDefinition, ...] = (
-        RegisterDefinition(REG_WATCHDOG_TIMEOUT, 1, RegisterType.HOLDING),
-        RegisterDefinition(REG_FAILSAFE_CURRENT, 1, RegisterType.HOLDING),
+    poll_tier = PollTier.SLOW
+
+    schema: tuple[RegisterField, ...] = (
+        RegisterField(
+            COMMAND_WATCHDOG_TIMEOUT,
+            REG_WATCHDOG_TIMEOUT,
+            RegisterType.HOLDING,
+            writable=True,
+        ),
+        RegisterField(
+            COMMAND_FAILSAFE_CURRENT,
+            REG_FAILSAFE_CURRENT,
+            RegisterType.HOLDING,
+            writable=True,
+        ),
     )
 
     async def async_probe(self, client: Any, device_id: int) -> bool:
@@ -63,33 +66,3 @@ class WatchdogCapability(Capability):
         except (ModbusException, OSError):
             return False
         return not result.isError()
-
-    def decode_polled(self, registers: dict[int, int]) -> dict[str, Any]:
-        return {
-            COMMAND_WATCHDOG_TIMEOUT: registers[REG_WATCHDOG_TIMEOUT],
-            COMMAND_FAILSAFE_CURRENT: registers[REG_FAILSAFE_CURRENT],
-        }
-
-    def supports_write(self, key: str) -> bool:
-        return key in _COMMAND_REGISTERS
-
-    async def async_write(
-        self, client: Any, device_id: int, key: str, value: int
-    ) -> bool:
-        address = _COMMAND_REGISTERS[key]
-        try:
-            result = await client.write_register(
-                address=address, value=int(value), device_id=device_id
-            )
-            if result.isError():
-                raise HeidelbergEnergyControlWriteError(
-                    f"Failed to write command {key} (register {address})"
-                )
-            return True
-        except (ModbusException, OSError) as err:
-            _LOGGER.error(
-                "Error on writing command %s (reg %s): %s", key, address, err
-            )
-            raise HeidelbergEnergyControlWriteError(
-                f"Failed to write command {key} (register {address}): {err}"
-            ) from err
@@ -0,0 +1,113 @@
+"""Shared Modbus gateway connections.
+
+Several wallboxes often sit behind one TCP-to-RS485 gateway and differ
+only in their device ID. Many of those gateways accept just one or two
+sockets, so one client per config entry makes the entries fight over
+sockets and reconnect. `CONNECTION_POOL` hands every API on the same
+(host, port) the same `ModbusConnection`. The connection is
+reference-counted and closed when the last API releases it.
+
+Every Modbus transaction runs inside `ModbusConnection.transaction()`,
+which waits for a slot from the connection's `TransactionScheduler`.
+Within a priority class the order is FIFO, so transactions from
+different device IDs take turns in arrival order and one wallbox's
+poll can't starve another's.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+
+from pymodbus.client import AsyncModbusTcpClient
+
+from .pipeline import ModbusTcpPipeline
+from .scheduler import TransactionPriority, TransactionScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Client timeout (s) for every transaction on a shared connection.
+CLIENT_TIMEOUT = 5
+
+
+class ModbusConnection:
+    """One gateway socket, shared by every API on the same host:port."""
+
+    def __init__(self, host: str, port: int) -> None:
+        """Initialize the connection (the socket opens on first use)."""
+        self.host = host
+        self.port = port
+        self.client = AsyncModbusTcpClient(host, port=port, timeout=CLIENT_TIMEOUT)
+        self.users = 0
+        self.scheduler = TransactionScheduler()
+        # Second socket for pipelined reads; None until an API asks for
+        # it, and again once it is dropped for every API on the gateway.
+        self.pipeline: ModbusTcpPipeline | None = None
+
+    @asynccontextmanager
+    async def transaction(
+        self, priority: TransactionPriority = TransactionPriority.FAST_POLL
+    ) -> AsyncIterator[None]:
+        """Hold the gateway for one transaction (or one pipelined exchange)."""
+        async with self.scheduler.slot(priority):
+            yield
+
+    def get_pipeline(self) -> ModbusTcpPipeline:
+        """Return the gateway's pipelined-read socket, creating it on demand."""
+        if self.pipeline is None:
+            self.pipeline = ModbusTcpPipeline(
+                self.host, self.port, timeout=CLIENT_TIMEOUT
+            )
+        return self.pipeline
+
+    def drop_pipeline(self) -> None:
+        """Close and forget the pipelined-read socket.
+
+        Every API on the gateway reads serially from then on.
+        """
+        if self.pipeline is not None:
+            self.pipeline.close()
+            self.pipeline = None
+
+    def close(self) -> None:
+        """Close every socket owned by this connection."""
+        if self.client.connected:
+            self.client.close()
+        self.drop_pipeline()
+
+
+class ModbusConnectionPool:
+    """Process-wide, reference-counted registry of gateway connections."""
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._connections: dict[tuple[str, int], ModbusConnection] = {}
+
+    def acquire(self, host: str, port: int) -> ModbusConnection:
+        """Return the shared connection for host:port and take a reference."""
+        connection = self._connections.get((host, port))
+        if connection is None:
+            connection = ModbusConnection(host, port)
+            self._connections[(host, port)] = connection
+        connection.users += 1
+        _LOGGER.debug(
+            "Gateway %s:%s now shared by %s API(s)", host, port, connection.users
+        )
+        return connection
+
+    def release(self, connection: ModbusConnection) -> None:
+        """Drop a reference; close the connection when nobody uses it."""
+        connection.users -= 1
+        if connection.users > 0:
+            return
+        connection.close()
+        if self._connections.get((connection.host, connection.port)) is connection:
+            del self._connections[(connection.host, connection.port)]
+
+    def __len__(self) -> int:
+        """Return the number of open gateway connections."""
+        return len(self._connections)
+
+
+CONNECTION_POOL = ModbusConnectionPool()
@@ -0,0 +1,185 @@
+"""Derived metrics computed from decoded coordinator data.
+
+Capabilities decode raw registers into values the wallbox reports.
+Everything computed *from* those values (average current, active
+phases, apparent power, ...) is declared here as a `DerivedMetric`: an
+output key, the keys it reads, and a function of those values.
+
+`DerivedGraph` orders the metrics so a metric runs after every derived
+metric it reads, then evaluates them once per poll. A metric whose
+inputs are unchanged since the last poll keeps its previous value
+without running, so adding metrics costs nothing on an idle wallbox.
+A metric with a `None` input is `None` itself; one whose inputs aren't
+in the data at all (e.g. a capability that isn't loaded) is left out.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from ..const import (
+    DATA_APPARENT_POWER,
+    DATA_APPARENT_POWER_L1,
+    DATA_APPARENT_POWER_L2,
+    DATA_APPARENT_POWER_L3,
+    DATA_CHARGING_POWER,
+    DATA_CURRENT,
+    DATA_CURRENT_L1,
+    DATA_CURRENT_L2,
+    DATA_CURRENT_L3,
+    DATA_PHASE_IMBALANCE,
+    DATA_PHASES_ACTIVE,
+    DATA_POWER_FACTOR,
+    DATA_VOLTAGE_L1,
+    DATA_VOLTAGE_L2,
+    DATA_VOLTAGE_L3,
+)
+
+# A phase counts as active above this current (A).
+ACTIVE_PHASE_THRESHOLD = 0.1
+
+_MISSING = object()
+
+_PHASE_CURRENTS = (DATA_CURRENT_L1, DATA_CURRENT_L2, DATA_CURRENT_L3)
+
+
+@dataclass(frozen=True)
+class DerivedMetric:
+    """One derived key and how to compute it from other keys."""
+
+    key: str
+    inputs: tuple[str, ...]
+    compute: Callable[..., Any]
+
+
+class DerivedGraph:
+    """Evaluate derived metrics in dependency order, skipping unchanged ones."""
+
+    def __init__(self, metrics: Iterable[DerivedMetric]) -> None:
+        """Order the metrics; raise ValueError on duplicates or cycles."""
+        by_key: dict[str, DerivedMetric] = {}
+        for metric in metrics:
+            if metric.key in by_key:
+                raise ValueError(f"Derived key {metric.key!r} defined twice")
+            by_key[metric.key] = metric
+
+        order: list[DerivedMetric] = []
+        state: dict[str, bool] = {}  # False: visiting, True: done
+
+        def visit(metric: DerivedMetric) -> None:
+            if state.get(metric.key) is True:
+                return
+            if state.get(metric.key) is False:
+                raise ValueError(f"Derived key {metric.key!r} depends on itself")
+            state[metric.key] = False
+            for key in metric.inputs:
+                if key in by_key:
+                    visit(by_key[key])
+            state[metric.key] = True
+            order.append(metric)
+
+        for metric in by_key.values():
+            visit(metric)
+
+        self.metrics: tuple[DerivedMetric, ...] = tuple(order)
+        self._inputs: dict[str, tuple[Any, ...]] = {}
+        self._values: dict[str, Any] = {}
+
+    @property
+    def keys(self) -> frozenset[str]:
+        """Return every key the graph adds to the data."""
+        return frozenset(m.key for m in self.metrics)
+
+    def requirements(self, keys: Iterable[str]) -> frozenset[str]:
+        """Return `keys` plus every key the derived ones among them read."""
+        by_key = {m.key: m for m in self.metrics}
+        required: set[str] = set()
+        pending = list(keys)
+        while pending:
+            key = pending.pop()
+            if key in required:
+                continue
+            required.add(key)
+            if key in by_key:
+                pending.extend(by_key[key].inputs)
+        return frozenset(required)
+
+    def apply(self, data: dict[str, Any]) -> frozenset[str]:
+        """Add every derived key to `data`; return the keys whose value changed."""
+        changed: set[str] = set()
+        for metric in self.metrics:
+            inputs = tuple(data.get(key, _MISSING) for key in metric.inputs)
+            if _MISSING in inputs:
+                continue
+            if metric.key not in self._values or inputs != self._inputs[metric.key]:
+                value = (
+                    None
+                    if any(value is None for value in inputs)
+                    else metric.compute(*inputs)
+                )
+                if value != self._values.get(metric.key):
+                    changed.add(metric.key)
+                self._inputs[metric.key] = inputs
+                self._values[metric.key] = value
+            data[metric.key] = self._values[metric.key]
+        return frozenset(changed)
+
+
+def _phases_active(*currents: float) -> int:
+    return sum(1 for i in currents if i > ACTIVE_PHASE_THRESHOLD)
+
+
+def _average_current(l1: float, l2: float, l3: float, phases: int) -> float:
+    return round((l1 + l2 + l3) / max(1, phases), 2)
+
+
+def _apparent_power(voltage: float, current: float) -> float:
+    return round(voltage * current, 1)
+
+
+def _sum_power(*powers: float) -> float:
+    return round(sum(powers), 1)
+
+
+def _phase_imbalance(l1: float, l2: float, l3: float) -> float | None:
+    """Spread of the active phase currents in % of their mean."""
+    active = [i for i in (l1, l2, l3) if i > ACTIVE_PHASE_THRESHOLD]
+    if len(active) < 2:
+        return None
+    mean = sum(active) / len(active)
+    return round((max(active) - min(active)) / mean * 100, 1)
+
+
+def _power_factor(power: float, apparent: float) -> float | None:
+    """Real over apparent power in %, None while (almost) idle."""
+    if apparent < 1:
+        return None
+    return round(min(1.0, power / apparent) * 100, 1)
+
+
+CORE_METRICS: tuple[DerivedMetric, ...] = (
+    DerivedMetric(DATA_PHASES_ACTIVE, _PHASE_CURRENTS, _phases_active),
+    DerivedMetric(
+        DATA_CURRENT, (*_PHASE_CURRENTS, DATA_PHASES_ACTIVE), _average_current
+    ),
+    DerivedMetric(
+        DATA_APPARENT_POWER_L1, (DATA_VOLTAGE_L1, DATA_CURRENT_L1), _apparent_power
+    ),
+    DerivedMetric(
+        DATA_APPARENT_POWER_L2, (DATA_VOLTAGE_L2, DATA_CURRENT_L2), _apparent_power
+    ),
+    DerivedMetric(
+        DATA_APPARENT_POWER_L3, (DATA_VOLTAGE_L3, DATA_CURRENT_L3), _apparent_power
+    ),
+    DerivedMetric(
+        DATA_APPARENT_POWER,
+        (DATA_APPARENT_POWER_L1, DATA_APPARENT_POWER_L2, DATA_APPARENT_POWER_L3),
+        _sum_power,
+    ),
+    DerivedMetric(DATA_PHASE_IMBALANCE, _PHASE_CURRENTS, _phase_imbalance),
+    DerivedMetric(
+        DATA_POWER_FACTOR, (DATA_CHARGING_POWER, DATA_APPARENT_POWER), _power_factor
+    ),
+)
@@ -17,3 +17,7 @@ class HeidelbergEnergyControlReadError(HeidelbergEnergyControlAPIError):
 
 class HeidelbergEnergyControlWriteError(HeidelbergEnergyControlAPIError):
     """Error to indicate a write error to the wallbox."""
+
+
+class HeidelbergEnergyControlBusyError(HeidelbergEnergyControlConnectionError):
+    """Error to indicate the gateway's transaction queue is full."""
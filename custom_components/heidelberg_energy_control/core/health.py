@@ -0,0 +1,77 @@
+"""Per-capability failure bookkeeping for the poll path.
+
+A poll reads every loaded capability's registers in merged blocks, so
+one misbehaving optional register group (a firmware that stops
+answering the watchdog registers, say) used to fail the whole poll and
+take every entity offline with it.
+
+The API now isolates failures by capability. A capability whose reads
+or decode fail is quarantined: it drops out of the read plans and its
+keys out of the poll data, while the core data keeps publishing. Once
+its backoff has passed, the API re-probes it (the capability's own
+`async_probe` plus a read of its polled registers). The backoff doubles
+after each failure, from `QUARANTINE_BASE_DELAY` up to
+`QUARANTINE_MAX_DELAY`. `CapabilityHealth` holds that state for one
+capability.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+# Seconds before the first re-probe of a quarantined capability; each
+# failed re-probe doubles it, up to the maximum.
+QUARANTINE_BASE_DELAY = 30.0
+QUARANTINE_MAX_DELAY = 3600.0
+
+
+@dataclass
+class CapabilityHealth:
+    """Failure counters and quarantine state of one capability."""
+
+    failures: int = 0
+    consecutive_failures: int = 0
+    retry_at: float | None = None
+    last_error: str | None = None
+
+    @property
+    def quarantined(self) -> bool:
+        """Return True while the capability is left out of polls."""
+        return self.retry_at is not None
+
+    def record_error(self, error: object) -> None:
+        """Count a failure that doesn't quarantine (e.g. of the core data)."""
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = str(error)
+
+    def record_failure(self, now: float, error: object) -> float:
+        """Quarantine after a failure; return the backoff in seconds."""
+        self.record_error(error)
+        delay = min(
+            QUARANTINE_BASE_DELAY * 2 ** (self.consecutive_failures - 1),
+            QUARANTINE_MAX_DELAY,
+        )
+        self.retry_at = now + delay
+        return delay
+
+    def record_recovery(self) -> None:
+        """Lift the quarantine after a successful re-probe."""
+        self.consecutive_failures = 0
+        self.retry_at = None
+
+    def due(self, now: float) -> bool:
+        """Return True if a quarantined capability should be re-probed."""
+        return self.retry_at is not None and now >= self.retry_at
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return a JSON-friendly summary."""
+        return {
+            "failures": self.failures,
+            "quarantined": self.quarantined,
+            "retry_in": (
+                None if self.retry_at is None else max(0.0, self.retry_at - now)
+            ),
+            "last_error": self.last_error,
+        }
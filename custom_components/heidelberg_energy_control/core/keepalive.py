@@ -0,0 +1,87 @@
+"""Watchdog keep-alive timing and metrics.
+
+The wallbox falls back to its FailSafe current when it sees no Modbus
+transaction within the watchdog timeout. Polls alone only keep it fed
+while every poll finishes in time; one slow poll on a busy gateway is
+enough to drop the car's charging current.
+
+The coordinator therefore runs a keep-alive loop next to polling. It
+sends the cheapest transaction there is (one holding register read, at
+`TransactionPriority.KEEPALIVE`) only when no other transaction reached
+the wallbox within `KEEPALIVE_FRACTION` of the timeout, so with regular
+polls it stays silent. It keeps going while polls fail, since that is
+when the watchdog needs it most, and backs off between failed attempts.
+`KeepaliveStats` records what it did.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Feed the watchdog once this share of its timeout passed without a
+# transaction.
+KEEPALIVE_FRACTION = 0.5
+# Seconds between checks while the watchdog is disabled or unknown.
+KEEPALIVE_IDLE_CHECK = 30.0
+# Shortest wait (s) before retrying a failed keep-alive.
+KEEPALIVE_MIN_RETRY = 1.0
+
+
+def keepalive_due_in(timeout: float, since_transaction: float | None) -> float:
+    """Return seconds until a keep-alive is due (0: send one now).
+
+    `timeout` is the watchdog window, `since_transaction` the seconds
+    since the last transaction the wallbox answered (None if none yet).
+    """
+    if since_transaction is None:
+        return 0.0
+    return max(0.0, timeout * KEEPALIVE_FRACTION - since_transaction)
+
+
+def keepalive_retry_in(timeout: float, failures: int) -> float:
+    """Return seconds to wait after `failures` keep-alives failed in a row.
+
+    Starts at a tenth of the watchdog `timeout` (at least
+    KEEPALIVE_MIN_RETRY) and doubles per failure, capped at
+    KEEPALIVE_FRACTION of the timeout so every window still gets a try.
+    """
+    first = max(timeout / 10, KEEPALIVE_MIN_RETRY)
+    return min(first * 2 ** (failures - 1), max(timeout * KEEPALIVE_FRACTION, first))
+
+
+@dataclass
+class KeepaliveStats:
+    """What the keep-alive loop sent and how long the wallbox took."""
+
+    sent: int = 0
+    failed: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    # Longest time (s) the wallbox went without a transaction, as seen
+    # right before a keep-alive.
+    max_silence: float = 0.0
+    last_error: str | None = None
+
+    def record_sent(self, duration: float, silence: float | None) -> None:
+        """Count a keep-alive the wallbox answered."""
+        self.sent += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        if silence is not None:
+            self.max_silence = max(self.max_silence, silence)
+
+    def record_failure(self, error: object) -> None:
+        """Count a keep-alive that failed."""
+        self.failed += 1
+        self.last_error = str(error)
+
+    def as_dict(self) -> dict[str, float | int | str | None]:
+        """Return the metrics as a plain dict (e.g. for diagnostics)."""
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "last_duration": round(self.last_duration, 4),
+            "max_duration": round(self.max_duration, 4),
+            "max_silence": round(self.max_silence, 4),
+            "last_error": self.last_error,
+        }
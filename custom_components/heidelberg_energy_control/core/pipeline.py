@@ -0,0 +1,141 @@
+"""Pipelined Modbus TCP block reads.
+
+Modbus TCP allows several transactions to be outstanding on one socket,
+matched by the MBAP transaction ID. pymodbus serializes every request
+behind its own lock, so a poll with one input block and two or three
+holding blocks still costs one round trip per block. This module
+sends all read requests of a poll back-to-back on a socket of its own
+and then collects the replies, so the poll costs roughly one RTT.
+
+Only FC03/FC04 reads are pipelined; writes keep going through the
+pymodbus client. Many TCP-to-RS485 gateways process requests strictly
+in order and some drop queued frames, so any irregularity (a reply
+out of send order, an unknown transaction ID, a timeout, a short or
+malformed frame) raises `PipelineError`. The API then falls back to
+serial reads for good.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+import struct
+
+from .registers import RegisterBlock, RegisterType
+
+_MBAP = struct.Struct(">HHHB")  # transaction id, protocol id, length, unit id
+_READ_REQUEST = struct.Struct(">BHH")  # function code, address, count
+# MBAP length field bounds: unit id plus a PDU of 1..253 bytes.
+_MIN_MBAP_LENGTH = 2
+_MAX_MBAP_LENGTH = 254
+
+_FUNCTION_CODES: dict[RegisterType, int] = {
+    RegisterType.HOLDING: 0x03,
+    RegisterType.INPUT: 0x04,
+}
+
+
+class PipelineError(Exception):
+    """The gateway did not handle pipelined transactions cleanly."""
+
+
+class ModbusTcpPipeline:
+    """Minimal Modbus TCP reader that keeps several requests in flight."""
+
+    def __init__(self, host: str, port: int, timeout: float = 5) -> None:
+        """Initialize the pipeline (no socket is opened yet)."""
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._next_tid = 0
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the pipeline socket is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        """Open the pipeline socket (no-op if already open)."""
+        if self.connected:
+            return
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), self._timeout
+            )
+        except (OSError, TimeoutError) as err:
+            raise PipelineError(f"Failed to open pipeline socket: {err}") from err
+
+    def close(self) -> None:
+        """Close the pipeline socket."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def async_read_blocks(
+        self, device_id: int, blocks: Sequence[RegisterBlock]
+    ) -> list[list[int] | None]:
+        """Send every block read at once and return the replies in block order.
+
+        A block the device answers with a Modbus exception response maps
+        to `None`. Anything that suggests the gateway can't pipeline
+        closes the socket and raises `PipelineError`.
+        """
+        await self.connect()
+        try:
+            return await asyncio.wait_for(
+                self._exchange(device_id, blocks), self._timeout
+            )
+        except PipelineError:
+            self.close()
+            raise
+        except (OSError, TimeoutError, asyncio.IncompleteReadError) as err:
+            self.close()
+            raise PipelineError(f"Pipelined read failed: {err}") from err
+
+    async def _exchange(
+        self, device_id: int, blocks: Sequence[RegisterBlock]
+    ) -> list[list[int] | None]:
+        assert self._reader is not None and self._writer is not None
+
+        tids: list[int] = []
+        frames = bytearray()
+        for block in blocks:
+            self._next_tid = self._next_tid % 0xFFFF + 1
+            tids.append(self._next_tid)
+            frames += _MBAP.pack(self._next_tid, 0, 6, device_id)
+            frames += _READ_REQUEST.pack(
+                _FUNCTION_CODES[block.type], block.address, block.count
+            )
+        self._writer.write(frames)
+        await self._writer.drain()
+
+        replies: list[list[int] | None] = []
+        for expected_tid, block in zip(tids, blocks, strict=True):
+            tid, protocol, length, unit = _MBAP.unpack(
+                await self._reader.readexactly(_MBAP.size)
+            )
+            if not _MIN_MBAP_LENGTH <= length <= _MAX_MBAP_LENGTH:
+                raise PipelineError(f"Invalid MBAP length {length}")
+            pdu = await self._reader.readexactly(length - 1)
+            if tid != expected_tid or protocol != 0 or unit != device_id:
+                raise PipelineError(
+                    f"Out-of-order reply: expected transaction {expected_tid}, got {tid}"
+                )
+            replies.append(_decode_read_response(pdu, block))
+        return replies
+
+
+def _decode_read_response(pdu: bytes, block: RegisterBlock) -> list[int] | None:
+    """Decode an FC03/FC04 response PDU; `None` for an exception response."""
+    function_code = _FUNCTION_CODES[block.type]
+    if pdu and pdu[0] == function_code | 0x80:
+        return None
+    if len(pdu) < 2 or pdu[0] != function_code or pdu[1] != 2 * block.count:
+        raise PipelineError(
+            f"Malformed reply for {block.count} {block.type.value} register(s) at {block.address}"
+        )
+    if len(pdu) != 2 + 2 * block.count:
+        raise PipelineError("Truncated reply frame")
+    return list(struct.unpack(f">{block.count}H", pdu[2:]))
@@ -0,0 +1,61 @@
+"""Poll interval that follows what the wallbox is doing.
+
+With no car plugged in (state A) nothing changes for hours, so polling
+at the scan interval is mostly wasted bus traffic. `AdaptivePollInterval`
+picks each next interval from the last poll instead: the idle interval
+while no car is plugged in, the scan interval while one is plugged in
+or charging, and a short burst of fast polls right after any state
+change so a plug-in or charge start shows up at once.
+
+No interval ever exceeds the watchdog window divided by
+`WATCHDOG_HEADROOM`, so the polls alone keep a watchdog fed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+
+# Seconds between the polls of a burst, and polls per burst.
+BURST_INTERVAL = 2.0
+BURST_POLLS = 3
+# The longest interval must fit this many times into the watchdog window.
+WATCHDOG_HEADROOM = 1.5
+
+
+@dataclass(slots=True)
+class AdaptivePollInterval:
+    """Next poll interval (s) from the wallbox state of the last poll."""
+
+    scan_interval: float
+    idle_interval: float
+    burst_interval: float = BURST_INTERVAL
+    burst_polls: int = BURST_POLLS
+    _last_state: Hashable = field(default=None, init=False)
+    _burst_left: int = field(default=0, init=False)
+
+    def next_interval(
+        self, state: Hashable, idle: bool, watchdog_timeout: float | None = None
+    ) -> float:
+        """Return the interval until the next poll.
+
+        `state` is anything that changes on a state transition (None if
+        unknown), `idle` whether no car is plugged in, and
+        `watchdog_timeout` the watchdog window in seconds (None or 0
+        when disabled).
+        """
+        if state is not None:
+            if self._last_state is not None and state != self._last_state:
+                self._burst_left = self.burst_polls
+            self._last_state = state
+
+        if self._burst_left:
+            self._burst_left -= 1
+            interval = min(self.burst_interval, self.scan_interval)
+        elif idle:
+            interval = max(self.idle_interval, self.scan_interval)
+        else:
+            interval = self.scan_interval
+        if watchdog_timeout:
+            interval = min(interval, watchdog_timeout / WATCHDOG_HEADROOM)
+        return interval
@@ -0,0 +1,129 @@
+"""Precompiled poll read plan.
+
+The set of polled definitions only changes when capabilities load (or
+when the API learns a new unreadable address), so merging them into
+block transactions on every poll is wasted work. `ReadPlan.compile`
+does it once; the API caches the result and the poll hot path only
+runs the transactions.
+
+Alongside the block list the plan records, per capability, where each
+of its definitions lives inside the planned blocks (`BlockSlice`).
+That slice map is what later per-block and per-capability logic keys
+off, and it makes the plan inspectable without re-deriving anything.
+
+A plan covers a set of `PollTier`s; the API keeps one compiled plan per
+tier combination the coordinator asks for, so tiers that fall due
+together still merge into shared block reads.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .capabilities import Capability
+from .registers import PollTier, RegisterBlock, RegisterType, plan_blocks
+
+ALL_TIERS: frozenset[PollTier] = frozenset(PollTier)
+
+
+@dataclass(frozen=True)
+class BlockSlice:
+    """Location of one definition inside a planned block."""
+
+    block: int
+    offset: int
+    count: int
+
+
+@dataclass(frozen=True)
+class ReadPlan:
+    """Compiled block list plus per-capability slice map."""
+
+    blocks: tuple[RegisterBlock, ...]
+    slices: dict[str, tuple[BlockSlice, ...]] = field(default_factory=dict)
+    tiers: frozenset[PollTier] = ALL_TIERS
+
+    @classmethod
+    def compile(
+        cls,
+        capabilities: Iterable[Capability],
+        max_gap: int = 0,
+        unreadable: Collection[tuple[RegisterType, int]] = (),
+        tiers: Collection[PollTier] = ALL_TIERS,
+    ) -> ReadPlan:
+        """Merge the capabilities' polled definitions in `tiers` into one plan.
+
+        Registers a restricted capability left out (see
+        `Capability.restrict`) may still be bridged, so demand shrinks
+        what is decoded without adding transactions.
+        """
+        tiers = frozenset(tiers)
+        capabilities = list(capabilities)
+        selected = {
+            cap.key: [d for d in cap.polled_definitions if cap.tier_of(d) in tiers]
+            for cap in capabilities
+        }
+        filler = {
+            (d.type, address)
+            for cap in capabilities
+            for d in type(cap).polled_definitions
+            if cap.tier_of(d) in tiers
+            for address in range(d.address, d.address + d.count)
+        }
+        blocks = tuple(
+            plan_blocks(
+                (d for defs in selected.values() for d in defs),
+                max_gap,
+                unreadable,
+                filler,
+            )
+        )
+
+        slices: dict[str, tuple[BlockSlice, ...]] = {}
+        for key, defs in selected.items():
+            cap_slices: list[BlockSlice] = []
+            for d in defs:
+                for index, block in enumerate(blocks):
+                    if (
+                        block.type == d.type
+                        and block.address <= d.address
+                        and d.address + d.count <= block.address + block.count
+                    ):
+                        cap_slices.append(
+                            BlockSlice(index, d.address - block.address, d.count)
+                        )
+                        break
+            slices[key] = tuple(cap_slices)
+
+        return cls(blocks=blocks, slices=slices, tiers=tiers)
+
+    @property
+    def transaction_count(self) -> int:
+        """Number of Modbus transactions one poll costs."""
+        return len(self.blocks)
+
+    def describe(self) -> dict[str, Any]:
+        """Return a JSON-friendly summary, e.g. for diagnostics or logs."""
+        return {
+            "tiers": sorted(t.value for t in self.tiers),
+            "transactions": self.transaction_count,
+            "registers": sum(b.count for b in self.blocks),
+            "blocks": [
+                {
+                    "type": b.type.value,
+                    "address": b.address,
+                    "count": b.count,
+                    "gaps": list(b.gaps),
+                }
+                for b in self.blocks
+            ],
+            "capabilities": {
+                key: [
+                    {"block": s.block, "offset": s.offset, "count": s.count}
+                    for s in cap_slices
+                ]
+                for key, cap_slices in self.slices.items()
+            },
+        }
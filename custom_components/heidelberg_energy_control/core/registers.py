@@ -2,16 +2,30 @@
 
 Capabilities describe the registers they need via `RegisterDefinition`
 tuples rather than issuing Modbus reads themselves. The API collects
-definitions from every loaded capability and coalesces consecutive
+definitions from every loaded capability and coalesces nearby
 same-type reads into single block transactions, keeping bus load
 down without the capabilities knowing about each other.
+
+Each definition belongs to a `PollTier`. The coordinator polls every
+tier on its own cadence and reads the tiers that fall due together in
+one merged plan, so configuration registers that almost never change
+don't cost bus time on every poll.
+
+`plan_blocks` is the merge planner. It bridges holes of up to
+`max_gap` registers between definitions (reading a few unused words
+is far cheaper than another round trip on an RS485 gateway), but
+never bridges an address known to be unreadable on the device.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, replace
 from enum import Enum
 
+# Modbus caps a single FC03/FC04 response at 125 registers.
+MAX_BLOCK_COUNT = 125
+
 
 class RegisterType(Enum):
     """Modbus register type (function code family)."""
@@ -20,19 +34,140 @@ class RegisterType(Enum):
     HOLDING = "holding"   # FC03
 
 
+class PollTier(Enum):
+    """How often a polled register group needs refreshing."""
+
+    FAST = "fast"       # every poll: state, currents, power, target current
+    MEDIUM = "medium"   # energy counters
+    SLOW = "slow"       # configuration holding registers
+
+
 @dataclass(frozen=True)
 class RegisterDefinition:
     """Definition of one contiguous register block a capability needs.
 
     A definition of `RegisterDefinition(address=15, count=2, type=INPUT)`
-    means "read input registers 15 and 16." The API returns a dict
+    means "read input registers 15 and 16." The API returns a mapping
     keyed by absolute address, so a capability decoding a 32-bit value
     would do `pack_32bit(regs[15], regs[16])`.
+
+    `tier` only matters for polled definitions; `None` means the
+    owning capability's `poll_tier`.
     """
 
     address: int
     count: int
     type: RegisterType
+    tier: PollTier | None = None
+
+
+@dataclass(frozen=True)
+class RegisterBlock:
+    """One planned block transaction covering one or more definitions.
+
+    `gaps` lists the addresses inside the block that no definition
+    asked for; they are read only to avoid a second round trip and
+    their values are discarded.
+    """
+
+    type: RegisterType
+    address: int
+    count: int
+    gaps: tuple[int, ...] = ()
+
+    def split(self) -> list[RegisterBlock]:
+        """Return the gap-free sub-blocks this block was merged from."""
+        if not self.gaps:
+            return [self]
+        gaps = set(self.gaps)
+        blocks: list[RegisterBlock] = []
+        start: int | None = None
+        for addr in range(self.address, self.address + self.count + 1):
+            wanted = addr < self.address + self.count and addr not in gaps
+            if wanted and start is None:
+                start = addr
+            elif not wanted and start is not None:
+                blocks.append(RegisterBlock(self.type, start, addr - start))
+                start = None
+        return blocks
+
+
+def plan_blocks(
+    definitions: Iterable[RegisterDefinition],
+    max_gap: int = 0,
+    unreadable: Collection[tuple[RegisterType, int]] = (),
+    filler: Collection[tuple[RegisterType, int]] = (),
+) -> list[RegisterBlock]:
+    """Coalesce definitions into as few same-type block reads as possible.
+
+    Definitions are deduplicated and sorted by (type, address). A
+    definition joins the current block when it overlaps or starts at
+    most `max_gap` registers after the block's end, the merged block
+    stays within `MAX_BLOCK_COUNT`, and none of the bridged addresses
+    is in `unreadable` (a set of `(type, address)` pairs). With
+    `max_gap=0` only touching or overlapping definitions merge.
+    Definitions covering an unreadable address are read around it.
+
+    Addresses in `filler` (registers known to be readable but not asked
+    for, e.g. those of disabled entities) are bridged for free: they
+    don't count towards `max_gap`, so leaving fields out of a poll never
+    splits a block the full poll reads in one transaction.
+    """
+    unique = {
+        (d.type, d.address, d.count): d
+        for definition in definitions
+        for d in _readable_parts(definition, unreadable)
+    }
+    sorted_defs = sorted(unique.values(), key=lambda d: (d.type.value, d.address))
+
+    blocks: list[RegisterBlock] = []
+    current: RegisterDefinition | None = None
+    start = end = 0
+    covered: set[int] = set()
+
+    def _close() -> None:
+        gaps = tuple(a for a in range(start, end) if a not in covered)
+        blocks.append(RegisterBlock(current.type, start, end - start, gaps))
+
+    for d in sorted_defs:
+        if current is not None and d.type == current.type:
+            hole = range(end, d.address)
+            new_end = max(end, d.address + d.count)
+            if (
+                sum((d.type, a) not in filler for a in hole) <= max_gap
+                and new_end - start <= MAX_BLOCK_COUNT
+                and not any((d.type, a) in unreadable for a in hole)
+            ):
+                covered.update(range(d.address, d.address + d.count))
+                end = new_end
+                continue
+        if current is not None:
+            _close()
+        current = d
+        start, end = d.address, d.address + d.count
+        covered = set(range(start, end))
+
+    if current is not None:
+        _close()
+    return blocks
+
+
+def _readable_parts(
+    definition: RegisterDefinition,
+    unreadable: Collection[tuple[RegisterType, int]],
+) -> Iterable[RegisterDefinition]:
+    """Split a definition around the addresses in `unreadable`."""
+    start = definition.address
+    end = start + definition.count
+    for address in range(start, end) if unreadable else ():
+        if (definition.type, address) in unreadable:
+            if address > start:
+                yield replace(definition, address=start, count=address - start)
+            start = address + 1
+    if start == definition.address:
+        yield definition
+    elif end > start:
+        yield replace(definition, address=start, count=end - start)
 
 
 def pack_32bit(high: int, low: int) -> int:
@@ -0,0 +1,143 @@
+"""Priority transaction scheduler for a shared gateway connection.
+
+A gateway handles one Modbus transaction at a time. With a plain lock,
+a slider or switch write queues behind every block read of a running
+poll (and behind other wallboxes' polls on the same gateway). The
+scheduler gives each transaction a `TransactionPriority`. When the
+connection frees up, the oldest waiter of the most urgent class goes
+next, so a control write waits for at most the transaction already on
+the wire.
+
+Every class has a bounded queue. A full queue means the gateway can't
+keep up, so the transaction fails fast instead of piling up. Per-class
+counters (`QueueStats`) record how long transactions waited for the bus.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+import time
+
+from .exceptions import HeidelbergEnergyControlBusyError
+
+
+class TransactionPriority(IntEnum):
+    """Transaction classes, most urgent first."""
+
+    CONTROL = 0  # user/automation writes
+    KEEPALIVE = 1  # watchdog feeding
+    FAST_POLL = 2  # regular poll reads
+    SLOW_POLL = 3  # static data, probes, rarely changing registers
+
+
+# Waiters allowed per class before new transactions are rejected.
+QUEUE_LIMITS: dict[TransactionPriority, int] = {
+    TransactionPriority.CONTROL: 16,
+    TransactionPriority.KEEPALIVE: 16,
+    TransactionPriority.FAST_POLL: 32,
+    TransactionPriority.SLOW_POLL: 32,
+}
+
+
+@dataclass
+class QueueStats:
+    """Queue-wait metrics for one priority class."""
+
+    transactions: int = 0
+    rejected: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Mean time (s) a transaction of this class waited for the bus."""
+        return self.total_wait / self.transactions if self.transactions else 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the metrics as a plain dict (e.g. for diagnostics)."""
+        return {
+            "transactions": self.transactions,
+            "rejected": self.rejected,
+            "average_wait": round(self.average_wait, 4),
+            "max_wait": round(self.max_wait, 4),
+            "last_wait": round(self.last_wait, 4),
+        }
+
+
+class TransactionScheduler:
+    """Grant the bus to one transaction at a time, by priority then FIFO."""
+
+    def __init__(
+        self, queue_limits: dict[TransactionPriority, int] | None = None
+    ) -> None:
+        """Initialize an idle scheduler."""
+        self._limits = queue_limits or QUEUE_LIMITS
+        self._queues: dict[TransactionPriority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in TransactionPriority
+        }
+        self._busy = False
+        self.stats: dict[TransactionPriority, QueueStats] = {
+            priority: QueueStats() for priority in TransactionPriority
+        }
+
+    @property
+    def queued(self) -> int:
+        """Number of transactions currently waiting for the bus."""
+        return sum(
+            1 for queue in self._queues.values() for fut in queue if not fut.done()
+        )
+
+    @asynccontextmanager
+    async def slot(self, priority: TransactionPriority) -> AsyncIterator[None]:
+        """Wait for the bus at `priority` and hold it for one transaction."""
+        stats = self.stats[priority]
+        wait_start = time.monotonic()
+
+        if self._busy:
+            queue = self._queues[priority]
+            if len(queue) >= self._limits[priority]:
+                stats.rejected += 1
+                raise HeidelbergEnergyControlBusyError(
+                    f"Too many queued {priority.name.lower()} transactions"
+                )
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            queue.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in queue:
+                    queue.remove(waiter)
+                # Cancelled right after being granted the bus: pass it on.
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+        else:
+            self._busy = True
+
+        waited = time.monotonic() - wait_start
+        stats.transactions += 1
+        stats.total_wait += waited
+        stats.last_wait = waited
+        stats.max_wait = max(stats.max_wait, waited)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Hand the bus to the next waiter, most urgent class first."""
+        for priority in TransactionPriority:
+            queue = self._queues[priority]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self._busy = False
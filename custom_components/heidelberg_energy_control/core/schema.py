@@ -0,0 +1,227 @@
+"""Declarative register schema, compiled into decode/encode functions.
+
+A capability used to hand-write its polled `RegisterDefinition`s, a
+`decode_polled` that builds the data dict register by register, a
+command → register map and a copy of the same write error handling.
+All of that follows from a list of `RegisterField`s: where a value
+lives (address, type, width), how to turn the wire word(s) into the
+value (signedness, scale, enum map or boolean test), which `PollTier`
+it belongs to and whether commands may write it.
+
+`compile_schema` turns such a schema into a `CompiledSchema` once, at
+import time of the capability:
+
+  - polled definitions: one per contiguous run of same-type, same-tier
+    addresses, in declaration order
+  - a generated `decode` function: one inlined lookup per register
+    slot, and the result dict built in a single literal with the
+    conversions inlined (no per-field function calls or loops)
+  - a generated encoder per writable key, returning the words to write
+
+Compiled schemas are cached by the schema itself (fields are frozen
+and hashable), so equal schemas share one set of generated functions.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+from .registers import PollTier, RegisterDefinition, RegisterType
+
+# Boolean tests a field may apply to its wire value.
+_BOOL_OPS = frozenset(("==", "!=", ">", ">=", "<", "<="))
+
+
+@dataclass(frozen=True)
+class RegisterField:
+    """One key in the poll data and the register(s) it decodes from.
+
+    `width` is in 16-bit words (1 or 2; 32-bit values are high word
+    first). The decoded value is the wire value divided by `scale`;
+    writes take the value in the same unit and multiply it back.
+    `enum` maps wire values to decoded values; wire values it doesn't
+    list decode to `enum_default` formatted with the value (or None).
+    `bool_when`, e.g. `(">=", 4)`, decodes to the result of that test.
+    Several fields may read the same address the same way.
+    """
+
+    key: str
+    address: int
+    type: RegisterType = RegisterType.INPUT
+    width: int = 1
+    scale: int = 1
+    signed: bool = False
+    enum: tuple[tuple[int, Any], ...] = ()
+    enum_default: str | None = None
+    bool_when: tuple[str, int] | None = None
+    tier: PollTier | None = None
+    writable: bool = False
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """Definitions, keys and generated functions for one schema."""
+
+    fields: tuple[RegisterField, ...]
+    polled_definitions: tuple[RegisterDefinition, ...]
+    polled_keys: tuple[str, ...]
+    decode: Callable[[Mapping[int, int]], dict[str, Any]]
+    encoders: Mapping[str, tuple[int, Callable[[Any], list[int]]]]
+    source: str = field(repr=False, default="")
+
+    def encode(self, key: str, value: Any) -> tuple[int, list[int]]:
+        """Return (address, words) writing `value` to writable `key`."""
+        address, encoder = self.encoders[key]
+        return address, encoder(value)
+
+
+@cache
+def compile_schema(fields: tuple[RegisterField, ...]) -> CompiledSchema:
+    """Compile a schema; raise ValueError if it is inconsistent."""
+    _validate(fields)
+    namespace: dict[str, Any] = {}
+
+    # Every distinct word slot, per register type and address, read once.
+    slots: dict[tuple[RegisterType, int], RegisterField] = {}
+    for f in fields:
+        slots.setdefault((f.type, f.address), f)
+    lines = ["def decode(registers):"]
+    for register_type in RegisterType:
+        for address in sorted(a for t, a in slots if t is register_type):
+            lookup = _lookup_expr(slots[register_type, address])
+            lines.append(f"    {_var(register_type, address)} = {lookup}")
+    lines.append("    return {")
+    for f in fields:
+        lines.append(f"        {f.key!r}: {_decode_expr(f, namespace)},")
+    lines.append("    }")
+
+    encoder_names: dict[str, str] = {}
+    for f in fields:
+        if f.writable:
+            name = encoder_names[f.key] = f"encode_{len(encoder_names)}"
+            lines.extend(("", f"def {name}(value):", f"    {_encode_body(f)}"))
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, "<register schema>", "exec"), namespace)  # noqa: S102
+    return CompiledSchema(
+        fields=fields,
+        polled_definitions=_definitions(fields),
+        polled_keys=tuple(dict.fromkeys(f.key for f in fields)),
+        decode=namespace["decode"],
+        encoders={
+            f.key: (f.address, namespace[encoder_names[f.key]])
+            for f in fields
+            if f.writable
+        },
+        source=source,
+    )
+
+
+def _validate(fields: tuple[RegisterField, ...]) -> None:
+    seen: dict[str, RegisterField] = {}
+    slots: dict[tuple[RegisterType, int], RegisterField] = {}
+    for f in fields:
+        if f.key in seen:
+            raise ValueError(f"Register schema defines {f.key!r} twice")
+        seen[f.key] = f
+        if f.width not in (1, 2):
+            raise ValueError(f"{f.key!r}: width must be 1 or 2 words")
+        if f.scale < 1:
+            raise ValueError(f"{f.key!r}: scale must be a positive integer")
+        if f.bool_when is not None and f.bool_when[0] not in _BOOL_OPS:
+            raise ValueError(f"{f.key!r}: unknown test {f.bool_when[0]!r}")
+        if f.enum and f.bool_when is not None:
+            raise ValueError(f"{f.key!r}: use either enum or bool_when")
+        other = slots.setdefault((f.type, f.address), f)
+        if (other.width, other.signed) != (f.width, f.signed):
+            raise ValueError(
+                f"{f.key!r} and {other.key!r} read register {f.address} differently"
+            )
+    covered: dict[tuple[RegisterType, int], str] = {}
+    for f in slots.values():
+        for address in range(f.address, f.address + f.width):
+            if (f.type, address) in covered:
+                raise ValueError(
+                    f"{f.key!r} overlaps {covered[f.type, address]!r} at {address}"
+                )
+            covered[f.type, address] = f.key
+
+
+def _runs(addresses: list[int], width: Callable[[int], int]) -> list[list[int]]:
+    """Split sorted slot addresses into runs of back-to-back slots."""
+    runs: list[list[int]] = []
+    for address in addresses:
+        if runs and runs[-1][-1] + width(runs[-1][-1]) == address:
+            runs[-1].append(address)
+        else:
+            runs.append([address])
+    return runs
+
+
+def _definitions(
+    fields: tuple[RegisterField, ...],
+) -> tuple[RegisterDefinition, ...]:
+    """One definition per contiguous run of same-type, same-tier words."""
+    # (type, tier) -> address -> (declaration index, width)
+    groups: dict[
+        tuple[RegisterType, PollTier | None], dict[int, tuple[int, int]]
+    ] = {}
+    for index, f in enumerate(fields):
+        groups.setdefault((f.type, f.tier), {}).setdefault(
+            f.address, (index, f.width)
+        )
+
+    ordered: list[tuple[int, RegisterDefinition]] = []
+    for (register_type, tier), slots in groups.items():
+        for run in _runs(sorted(slots), lambda a, slots=slots: slots[a][1]):
+            count = run[-1] + slots[run[-1]][1] - run[0]
+            ordered.append(
+                (
+                    min(slots[a][0] for a in run),
+                    RegisterDefinition(run[0], count, register_type, tier),
+                )
+            )
+    ordered.sort(key=lambda item: item[0])
+    return tuple(definition for _, definition in ordered)
+
+
+def _var(register_type: RegisterType, address: int) -> str:
+    return f"{register_type.value[0]}{address}"
+
+
+def _lookup_expr(f: RegisterField) -> str:
+    """Read one slot (16 or 32 bit, optionally signed) from the mapping."""
+    if f.width == 1:
+        word = f"registers[{f.address}]"
+        return f"(({word} ^ 0x8000) - 0x8000)" if f.signed else word
+    word = f"(registers[{f.address}] << 16 | registers[{f.address + 1}])"
+    return f"(({word} ^ 0x80000000) - 0x80000000)" if f.signed else word
+
+
+def _decode_expr(f: RegisterField, namespace: dict[str, Any]) -> str:
+    word = _var(f.type, f.address)
+    if f.bool_when is not None:
+        op, operand = f.bool_when
+        return f"{word} {op} {operand!r}"
+    if f.enum:
+        enum_name = f"_e{len(namespace)}"
+        namespace[enum_name] = dict(f.enum)
+        if f.enum_default is None:
+            return f"{enum_name}.get({word})"
+        return (
+            f"{enum_name}[{word}] if {word} in {enum_name} "
+            f"else {f.enum_default!r}.format({word})"
+        )
+    if f.scale != 1:
+        return f"{word} / {float(f.scale)!r}"
+    return word
+
+
+def _encode_body(f: RegisterField) -> str:
+    value = "int(value)" if f.scale == 1 else f"round(value * {f.scale})"
+    if f.width == 1:
+        return f"return [{value} & 0xFFFF]" if f.signed else f"return [{value}]"
+    return f"v = {value} & 0xFFFFFFFF; return [v >> 16, v & 0xFFFF]"
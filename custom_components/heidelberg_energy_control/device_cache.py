@@ -0,0 +1,135 @@
+"""Persistent facts learned about one wallbox.
+
+The API learns at runtime which register addresses the device rejects
+(a merged read fails, bisection finds the culprit) and reads around
+them from then on. Learning costs a failed read plus a handful of
+bisection reads, so the result is kept in a `Store` file per config
+entry and handed back to the API on the next start: a firmware with
+holes in its register map is read with maximal batching from the very
+first poll.
+
+What the device rejects depends on its firmware, so the map is stored
+together with the firmware version it was learned on and dropped when
+the wallbox reports a different one.
+
+The cache also keeps the static data and the keys of the capabilities
+that passed their version gate and probe. Setup trusts them instead of
+reading static registers and probing every optional capability again
+(one serialized transaction each, on every restart and options change),
+and the coordinator revalidates them in the background once polling
+runs. The read plan is not stored: it is compiled in memory from the
+cached capabilities and bad-address map, which is all it depends on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .core.registers import RegisterType
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class DeviceCache:
+    """Store-backed facts about one wallbox: bad addresses, static data."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize an empty cache (call async_load before use)."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.device_cache.{entry_id}",
+            atomic_writes=True,
+        )
+        self._data: dict[str, Any] = {}
+        self._loaded = False
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load what a previous run learned (once; later calls are no-ops)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if (stored := await self._store.async_load()) is not None:
+            self._data = stored
+
+    @property
+    def static_data(self) -> dict[str, Any] | None:
+        """Return the cached static data, or None if there is none."""
+        return self._data.get("static")
+
+    @property
+    def capabilities(self) -> list[str]:
+        """Return the keys of the capabilities the device supports."""
+        return self._data.get("capabilities", [])
+
+    @callback
+    def async_set_static_data(
+        self, static: dict[str, Any], capabilities: Collection[str]
+    ) -> None:
+        """Replace the cached static data and capabilities; schedule a save."""
+        if static == self.static_data and list(capabilities) == self.capabilities:
+            return
+        self._async_update(static=dict(static), capabilities=list(capabilities))
+
+    @callback
+    def async_clear_static_data(self) -> None:
+        """Forget the static data, so the next setup reads and probes again."""
+        self._async_update(static=None, capabilities=[])
+
+    def unreadable(self, firmware: str | None) -> set[tuple[RegisterType, int]]:
+        """Return the addresses learned as unreadable on this firmware."""
+        if self._data.get("firmware") != firmware:
+            return set()
+        return {
+            (RegisterType(register_type), address)
+            for register_type, address in self._data.get("unreadable", ())
+        }
+
+    @callback
+    def async_set_unreadable(
+        self,
+        firmware: str | None,
+        addresses: Collection[tuple[RegisterType, int]],
+    ) -> None:
+        """Replace the bad-address map and schedule a save."""
+        _LOGGER.debug(
+            "Remembering unreadable registers for firmware %s: %s",
+            firmware,
+            addresses,
+        )
+        self._async_update(
+            firmware=firmware,
+            unreadable=sorted(
+                [register_type.value, address] for register_type, address in addresses
+            ),
+        )
+
+    @callback
+    def _async_update(self, **values: Any) -> None:
+        self._data = {**self._data, **values}
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now (e.g. on unload)."""
+        if self._save_pending:
+            self._save_pending = False
+            await self._store.async_save(self._data)
+
+    async def async_remove(self) -> None:
+        """Delete the cache file."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        # The data dict is replaced, never mutated, so reading it here is safe.
+        self._save_pending = False
+        return self._data
@@ -0,0 +1,39 @@
+"""Diagnostics for Heidelberg Energy Control.
+
+Shows what the API has learned about the device at runtime: the
+compiled read plan, registers it reads around, per-capability failure
+counts and quarantine state, and what the watchdog keep-alive sent.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import HeidelbergEnergyControlConfigEntry
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: HeidelbergEnergyControlConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    api = coordinator.api
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "static_data": coordinator.static_data,
+        "restored_at": coordinator.restored_at,
+        "capabilities": api.capability_health,
+        "unreadable_registers": sorted(
+            [register_type.value, address]
+            for register_type, address in api.unreadable_addresses
+        ),
+        "read_plan": api.read_plan.describe(),
+        "transactions": api.transaction_stats,
+        "keepalive": coordinator.keepalive_stats.as_dict(),
+    }
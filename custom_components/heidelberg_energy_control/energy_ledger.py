@@ -0,0 +1,213 @@
+"""Persistent bookkeeping for the energy sensors.
+
+The energy sensors correct hardware counter resets with an offset and
+track the session start. That state used to ride along as extra state
+attributes so `RestoreEntity` could recover it, which put it into the
+recorder on every poll. The ledger keeps it in a `Store` file of its own
+instead, one record per sensor key.
+
+`SessionEnergyTracker` is the coordinator's session bookkeeping on top
+of the ledger: it turns the total energy counter and the plugged state
+into the session energy and start time.
+
+Writes are debounced: routine changes (the last raw counter value) are
+saved at most once per `SAVE_DELAY`, changes that matter for recovery
+(a new offset after a counter jump, a session start) are saved at once.
+The file is replaced atomically, so a crash leaves either the previous
+or the new ledger on disk, never a torn one. Records are replaced rather
+than mutated, so the snapshot the writer serializes is always consistent.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.restore_state import async_get as async_get_restore_state
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_SESSION_ENERGY, DATA_TOTAL_ENERGY, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Seconds a routine change may wait before it is written.
+SAVE_DELAY = 300
+
+_MISSING = object()
+
+
+class EnergyLedger:
+    """Store-backed records of the energy sensors' correction state."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize an empty ledger (call async_load before use)."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.energy_ledger.{entry_id}",
+            atomic_writes=True,
+        )
+        self._records: dict[str, dict[str, Any]] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the records written by a previous run."""
+        if (stored := await self._store.async_load()) is not None:
+            self._records = stored.get("records", {})
+
+    def record(self, key: str) -> dict[str, Any]:
+        """Return the stored record for a sensor key (empty if none)."""
+        return self._records.get(key, {})
+
+    @callback
+    def async_update(self, key: str, *, urgent: bool = False, **values: Any) -> None:
+        """Update a sensor's record and schedule a save."""
+        record = self._records.get(key, {})
+        if all(record.get(name, _MISSING) == value for name, value in values.items()):
+            return
+        self._records = {**self._records, key: {**record, **values}}
+
+        if urgent:
+            self._store.async_delay_save(self._data_to_save)
+        elif not self._save_pending:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._save_pending = True
+
+    async def async_flush(self) -> None:
+        """Write pending changes now (e.g. on unload)."""
+        if self._save_pending:
+            self._save_pending = False
+            await self._store.async_save({"records": self._records})
+
+    async def async_remove(self) -> None:
+        """Delete the ledger file."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        # Called on the event loop at write time; the returned dict is
+        # then serialized in the executor. Records are replaced, never
+        # mutated in place, so that serialization sees a consistent view.
+        self._save_pending = False
+        return {"records": self._records}
+
+
+class SessionEnergyTracker:
+    """Session energy from the total counter, reset when a car plugs in.
+
+    Counter jumps are absorbed into an offset, as for the total energy
+    sensor. While unplugged, the last session's energy is kept.
+    """
+
+    def __init__(self, ledger: EnergyLedger, key: str = DATA_SESSION_ENERGY) -> None:
+        """Initialize the tracker; state is read from the ledger on first use."""
+        self._ledger = ledger
+        self._key = key
+        self._loaded = False
+        self._total_offset = 0.0
+        self._last_raw_value: float | None = None
+        self._start_corrected: float | None = None
+        self._last_is_plugged = False
+        self._energy: float | None = None
+        self.started: datetime | None = None
+
+    def _load(self) -> None:
+        record = self._ledger.record(self._key)
+        self._total_offset = float(record.get("total_offset") or 0.0)
+        self._last_raw_value = record.get("last_raw_value")
+        self._start_corrected = record.get("start_corrected")
+        self._last_is_plugged = bool(record.get("last_is_plugged", False))
+        self._energy = record.get("session_energy")
+        started = record.get("started")
+        self.started = dt_util.parse_datetime(started) if started else None
+        self._loaded = True
+
+    def update(self, raw_total: float, is_plugged: bool) -> float | None:
+        """Advance the session with a new counter reading; return its energy."""
+        if not self._loaded:
+            self._load()
+
+        jumped = self._last_raw_value is not None and raw_total < self._last_raw_value
+        if jumped:
+            self._total_offset += self._last_raw_value - raw_total
+            _LOGGER.warning(
+                "Counter jump detected for session energy: offset now %s kWh",
+                self._total_offset,
+            )
+        self._last_raw_value = raw_total
+        corrected = raw_total + self._total_offset
+
+        plugged_in = is_plugged and not self._last_is_plugged
+        if plugged_in:
+            # A car was just plugged in: a new session starts.
+            self._start_corrected = corrected
+            self._energy = 0.0
+            self.started = dt_util.utcnow()
+            _LOGGER.debug("Session started at %s kWh", corrected)
+        elif is_plugged and self._start_corrected is None:
+            # Plugged in, but the start was lost: count from here.
+            self._start_corrected = corrected
+        if is_plugged and self._start_corrected is not None:
+            self._energy = max(0.0, round(corrected - self._start_corrected, 2))
+
+        # Offsets and session edges must survive a crash; the rest can wait.
+        self._ledger.async_update(
+            self._key,
+            urgent=jumped or is_plugged != self._last_is_plugged,
+            total_offset=self._total_offset,
+            last_raw_value=raw_total,
+            start_corrected=self._start_corrected,
+            last_is_plugged=is_plugged,
+            session_energy=self._energy,
+            started=self.started.isoformat() if self.started else None,
+        )
+        self._last_is_plugged = is_plugged
+        return self._energy
+
+
+@callback
+def async_adopt_legacy_attributes(
+    hass: HomeAssistant, ledger: EnergyLedger, entry_id: str
+) -> None:
+    """Seed the ledger from the state attributes older versions used.
+
+    Before the ledger, the energy sensors kept their tracking values in
+    state attributes. On the first start after upgrading, take them over
+    from the restore-state cache so corrections and the running session
+    carry on.
+    """
+    registry = er.async_get(hass)
+    last_states = async_get_restore_state(hass).last_states
+    for key in (DATA_TOTAL_ENERGY, DATA_SESSION_ENERGY):
+        if ledger.record(key):
+            continue
+        entity_id = registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{entry_id}_{key}"
+        )
+        if entity_id is None or (stored := last_states.get(entity_id)) is None:
+            continue
+        if record := legacy_record(stored.state.state, stored.state.attributes):
+            _LOGGER.debug("Adopting legacy energy attributes of %s", entity_id)
+            ledger.async_update(key, urgent=True, **record)
+
+
+def legacy_record(state: str, attrs: Any) -> dict[str, Any]:
+    """Translate pre-ledger state attributes into a ledger record."""
+    record: dict[str, Any] = {}
+    if (offset := attrs.get("_total_offset")) is not None:
+        record["total_offset"] = float(offset)
+    if (raw := attrs.get("_last_raw_value")) is not None:
+        record["last_raw_value"] = float(raw)
+    if (start := attrs.get("_start_corrected")) is not None:
+        record["start_corrected"] = float(start)
+    if "_last_is_plugged" in attrs:
+        record["last_is_plugged"] = str(attrs["_last_is_plugged"]).lower() == "true"
+        with contextlib.suppress(ValueError):
+            record["session_energy"] = float(state)
+    return record
@@ -0,0 +1,119 @@
+"""The coordinator's last poll, kept across restarts.
+
+After a restart every entity would sit at unknown until the first poll
+completes, which with a slow gateway takes seconds and makes automations
+on the plugged state or the virtual current misfire. The coordinator
+therefore keeps its last data, together with the virtual layer's target
+current and enable state, in a `Store` file per config entry and serves
+it right away on the next start, marked as restored until live data
+replaces it.
+
+Writes are debounced to one per `SAVE_DELAY`; whatever the coordinator
+holds at write time is written, and HA writes a pending save on
+shutdown, so a clean restart always starts from the very last poll.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# Seconds a new poll may wait before it is written.
+SAVE_DELAY = 300
+
+
+class LastDataStore:
+    """Store-backed copy of the coordinator's last data and virtual state."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize an empty store (call async_load before use)."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.last_data.{entry_id}",
+            atomic_writes=True,
+        )
+        self._stored: dict[str, Any] = {}
+        self._source: Callable[[], dict[str, Any]] | None = None
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load what the previous run wrote."""
+        if (stored := await self._store.async_load()) is not None:
+            self._stored = stored
+
+    @property
+    def data(self) -> dict[str, Any] | None:
+        """Return the last data, or None if nothing was stored."""
+        if (values := self._stored.get("data")) is None:
+            return None
+        data = dict(values)
+        for key in self._stored.get("timestamps", ()):
+            if isinstance(data.get(key), str):
+                data[key] = dt_util.parse_datetime(data[key])
+        return data
+
+    @property
+    def saved_at(self) -> datetime | None:
+        """Return when the stored data was polled."""
+        saved_at = self._stored.get("saved_at")
+        return dt_util.parse_datetime(saved_at) if saved_at else None
+
+    def virtual_state(self, key: str, default: Any = None) -> Any:
+        """Return a stored virtual-layer value (target current, enable)."""
+        return self._stored.get("virtual", {}).get(key, default)
+
+    @callback
+    def async_schedule_save(self, source: Callable[[], dict[str, Any]]) -> None:
+        """Schedule writing what source returns at write time."""
+        self._source = source
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending save now (e.g. on unload)."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the file."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        if self._source is not None:
+            self._stored = self._source()
+        return self._stored
+
+
+def serialize(
+    data: Mapping[str, Any], virtual: Mapping[str, Any], saved_at: datetime
+) -> dict[str, Any]:
+    """Return coordinator data and virtual state as a JSON-safe record.
+
+    Timestamps are written as ISO strings and listed, so they come back
+    as datetimes; any other non-JSON value is left out.
+    """
+    values: dict[str, Any] = {}
+    timestamps: list[str] = []
+    for key, value in data.items():
+        if isinstance(value, datetime):
+            values[key] = value.isoformat()
+            timestamps.append(key)
+        elif value is None or isinstance(value, (bool, int, float, str)):
+            values[key] = value
+    return {
+        "saved_at": saved_at.isoformat(),
+        "data": values,
+        "timestamps": timestamps,
+        "virtual": dict(virtual),
+    }
@@ -12,7 +12,9 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import (
+    PERCENTAGE,
     EntityCategory,
+    UnitOfApparentPower,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfEnergy,
@@ -23,13 +25,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HeidelbergEnergyControlConfigEntry
-from .classes.heidelberg_sensor import HeidelbergSensor
+from .classes.heidelberg_sensor import NO_DEADBAND, Deadband, HeidelbergSensor
 from .classes.heidelberg_sensor_active_phases import HeidelbergSensorActivePhases
 from .classes.heidelberg_sensor_coordinator import HeidelbergSensorCoordinator
-from .classes.heidelberg_sensor_energy_session import HeidelbergSensorEnergySession
 from .classes.heidelberg_sensor_energy_total import HeidelbergSensorEnergyTotal
 from .const import (
     COMMAND_TARGET_CURRENT,
+    DATA_APPARENT_POWER,
+    DATA_APPARENT_POWER_L1,
+    DATA_APPARENT_POWER_L2,
+    DATA_APPARENT_POWER_L3,
     DATA_CHARGING_POWER,
     DATA_CHARGING_STATE,
     DATA_CURRENT,
@@ -40,8 +45,11 @@ from .const import (
     DATA_HW_MIN_CURR,
     DATA_HW_MAX_CURR,
     DATA_PCB_TEMPERATURE,
+    DATA_PHASE_IMBALANCE,
     DATA_PHASES_ACTIVE,
+    DATA_POWER_FACTOR,
     DATA_SESSION_ENERGY,
+    DATA_SESSION_START,
     DATA_TOTAL_ENERGY,
     DATA_VOLTAGE_L1,
     DATA_VOLTAGE_L2,
@@ -61,6 +69,10 @@ class HeidelbergSensorEntityDescription(SensorEntityDescription):
     # Optional: display-unit divisor for values on raw wire form.
     multiplier: float | None = None
 
+    # Optional: state-write deadband; None falls back to the device-class
+    # default (see DEFAULT_DEADBANDS).
+    deadband: Deadband | None = None
+
 
 SENSOR_TYPES: tuple[HeidelbergSensorEntityDescription, ...] = (
     HeidelbergSensorEntityDescription(
@@ -97,6 +109,12 @@ SENSOR_TYPES: tuple[HeidelbergSensorEntityDescription, ...] = (
         suggested_display_precision=2,
         capability=CoreCapability,
     ),
+    HeidelbergSensorEntityDescription(
+        key=DATA_SESSION_START,
+        translation_key=DATA_SESSION_START,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        capability=CoreCapability,
+    ),
     HeidelbergSensorEntityDescription(
         key=DATA_ENERGY_SINCE_POWER_ON,
         translation_key=DATA_ENERGY_SINCE_POWER_ON,
@@ -151,6 +169,66 @@ SENSOR_TYPES: tuple[HeidelbergSensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         capability=CoreCapability,
     ),
+    HeidelbergSensorEntityDescription(
+        key=DATA_APPARENT_POWER,
+        translation_key=DATA_APPARENT_POWER,
+        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        capability=CoreCapability,
+    ),
+    HeidelbergSensorEntityDescription(
+        key=DATA_APPARENT_POWER_L1,
+        translation_key=DATA_APPARENT_POWER_L1,
+        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        capability=CoreCapability,
+    ),
+    HeidelbergSensorEntityDescription(
+        key=DATA_APPARENT_POWER_L2,
+        translation_key=DATA_APPARENT_POWER_L2,
+        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        capability=CoreCapability,
+    ),
+    HeidelbergSensorEntityDescription(
+        key=DATA_APPARENT_POWER_L3,
+        translation_key=DATA_APPARENT_POWER_L3,
+        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        capability=CoreCapability,
+    ),
+    HeidelbergSensorEntityDescription(
+        key=DATA_PHASE_IMBALANCE,
+        translation_key=DATA_PHASE_IMBALANCE,
+        icon="mdi:scale-unbalanced",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        capability=CoreCapability,
+    ),
+    HeidelbergSensorEntityDescription(
+        key=DATA_POWER_FACTOR,
+        translation_key=DATA_POWER_FACTOR,
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        capability=CoreCapability,
+    ),
     HeidelbergSensorEntityDescription(
         key=DATA_VOLTAGE_L1,
         translation_key=DATA_VOLTAGE_L1,
@@ -210,6 +288,8 @@ SENSOR_TYPES: tuple[HeidelbergSensorEntityDescription, ...] = (
         suggested_display_precision=1,
         capability=CoreCapability,
         multiplier=10,
+        # Set points move in 0.1 A steps; every one of them matters.
+        deadband=NO_DEADBAND,
     ),
     HeidelbergSensorEntityDescription(
         key=DATA_HW_MAX_CURR,
@@ -252,10 +332,6 @@ async def async_setup_entry(
                 entities.append(
                     HeidelbergSensorEnergyTotal(coordinator, entry, description)
                 )
-            elif description.key == DATA_SESSION_ENERGY:
-                entities.append(
-                    HeidelbergSensorEnergySession(coordinator, entry, description)
-                )
             elif description.key == DATA_PHASES_ACTIVE:
                 entities.append(
                     HeidelbergSensorActivePhases(coordinator, entry, description)
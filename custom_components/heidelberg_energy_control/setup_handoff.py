@@ -0,0 +1,74 @@
+"""Hand the config flow's connected API over to the first entry setup.
+
+The config flow validates a new wallbox by connecting, reading its
+static data and probing every optional capability. The entry is set up
+moments later and would do all of that again on a fresh socket. Instead
+the flow parks its API (connection reference, loaded capabilities) and
+the static data here, and the first setup for the same host, port and
+device claims them. An unclaimed handoff expires after
+`HANDOFF_TIMEOUT` seconds and releases its connection.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .core.api import HeidelbergEnergyControlAPI
+
+# Seconds a parked API waits for its entry setup before disconnecting.
+HANDOFF_TIMEOUT = 60
+
+type HandoffKey = tuple[str, int, int]
+
+_HANDOFFS: HassKey[dict[HandoffKey, _Handoff]] = HassKey(f"{DOMAIN}_setup_handoff")
+
+
+@dataclass(slots=True)
+class _Handoff:
+    """A validated API waiting for its entry setup."""
+
+    api: HeidelbergEnergyControlAPI
+    static_data: dict[str, Any]
+    cancel_expiry: CALLBACK_TYPE
+
+
+@callback
+def async_offer(
+    hass: HomeAssistant,
+    key: HandoffKey,
+    api: HeidelbergEnergyControlAPI,
+    static_data: dict[str, Any],
+) -> None:
+    """Park a connected API and its static data for the next setup of key."""
+    handoffs = hass.data.setdefault(_HANDOFFS, {})
+    if (previous := handoffs.pop(key, None)) is not None:
+        previous.cancel_expiry()
+        hass.async_create_task(previous.api.disconnect())
+
+    @callback
+    def _expire(_now: Any) -> None:
+        if (handoff := handoffs.get(key)) is not None and handoff.api is api:
+            del handoffs[key]
+            hass.async_create_task(api.disconnect())
+
+    handoffs[key] = _Handoff(
+        api, static_data, async_call_later(hass, HANDOFF_TIMEOUT, _expire)
+    )
+
+
+@callback
+def async_claim(
+    hass: HomeAssistant, key: HandoffKey
+) -> tuple[HeidelbergEnergyControlAPI, dict[str, Any]] | None:
+    """Take the API and static data parked for key, if any."""
+    handoff = hass.data.get(_HANDOFFS, {}).pop(key, None)
+    if handoff is None:
+        return None
+    handoff.cancel_expiry()
+    return handoff.api, handoff.static_data
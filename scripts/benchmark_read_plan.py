@@ -0,0 +1,61 @@
+"""Micro-benchmark: per-poll planning overhead, rebuilt vs. cached plan.
+
+Usage:
+    python scripts/benchmark_read_plan.py [--iterations 100000]
+
+Compares the old hot path (collect every capability's polled
+definitions, dedupe, sort and merge them on each poll) against the
+cached `ReadPlan`, where a poll only fetches the precompiled block
+list. No wallbox or network is needed; only the planning step is
+timed, not the Modbus transactions.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.heidelberg_energy_control.const import DEFAULT_MAX_REGISTER_GAP
+from custom_components.heidelberg_energy_control.core.capabilities import CAPABILITIES
+from custom_components.heidelberg_energy_control.core.read_plan import ReadPlan
+from custom_components.heidelberg_energy_control.core.registers import plan_blocks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    capabilities = [cls() for cls in CAPABILITIES]
+    unreadable: set = set()
+
+    def rebuild_per_poll():
+        all_defs = []
+        for cap in capabilities:
+            all_defs.extend(cap.polled_definitions)
+        return plan_blocks(all_defs, DEFAULT_MAX_REGISTER_GAP, unreadable)
+
+    cached = ReadPlan.compile(capabilities, DEFAULT_MAX_REGISTER_GAP, unreadable)
+
+    def cached_plan():
+        return cached.blocks
+
+    def compile_once():
+        return ReadPlan.compile(capabilities, DEFAULT_MAX_REGISTER_GAP, unreadable)
+
+    for label, fn in (
+        ("rebuild per poll", rebuild_per_poll),
+        ("cached plan", cached_plan),
+        ("compile (setup)", compile_once),
+    ):
+        seconds = timeit.timeit(fn, number=args.iterations)
+        print(f"{label:>17}: {seconds / args.iterations * 1e6:8.3f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Micro-benchmark: core capability decode, hand-written vs. schema-generated.
+
+Usage:
+    python scripts/benchmark_schema_decode.py [--iterations 100000]
+
+The hand-written decoder is the core capability's `decode_polled` as
+it was before the register schema: one dict lookup per register and
+the conversions spelled out per key. It is timed against the decoder
+compiled from `CoreCapability.schema`, both on the plain
+`{address: value}` dict the API decodes from. No wallbox or network
+is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.heidelberg_energy_control.const import (
+    CHARGING_STATE_MAP,
+    COMMAND_REMOTE_LOCK,
+    COMMAND_TARGET_CURRENT,
+    DATA_CHARGING_POWER,
+    DATA_CHARGING_STATE,
+    DATA_CURRENT_L1,
+    DATA_CURRENT_L2,
+    DATA_CURRENT_L3,
+    DATA_ENERGY_SINCE_POWER_ON,
+    DATA_EXTERNAL_LOCK_STATE,
+    DATA_IS_CHARGING,
+    DATA_IS_PLUGGED,
+    DATA_PCB_TEMPERATURE,
+    DATA_TOTAL_ENERGY,
+    DATA_VOLTAGE_L1,
+    DATA_VOLTAGE_L2,
+    DATA_VOLTAGE_L3,
+)
+from custom_components.heidelberg_energy_control.core.capabilities import CoreCapability
+from custom_components.heidelberg_energy_control.core.registers import pack_32bit
+
+DATA = [7, 160, 160, 158, 312, 231, 230, 229, 1, 11040, 0, 1234, 2, 4567]
+
+
+def hand_written(registers):
+    state_reg = registers[5]
+    power_reg = registers[14]
+    return {
+        DATA_CHARGING_STATE: CHARGING_STATE_MAP.get(
+            state_reg, f"Unknown ({state_reg})"
+        ),
+        DATA_CURRENT_L1: registers[6] / 10.0,
+        DATA_CURRENT_L2: registers[7] / 10.0,
+        DATA_CURRENT_L3: registers[8] / 10.0,
+        DATA_PCB_TEMPERATURE: registers[9] / 10.0,
+        DATA_VOLTAGE_L1: registers[10],
+        DATA_VOLTAGE_L2: registers[11],
+        DATA_VOLTAGE_L3: registers[12],
+        DATA_CHARGING_POWER: power_reg,
+        DATA_ENERGY_SINCE_POWER_ON: pack_32bit(registers[15], registers[16]) / 1000.0,
+        DATA_TOTAL_ENERGY: pack_32bit(registers[17], registers[18]) / 1000.0,
+        DATA_EXTERNAL_LOCK_STATE: registers[13] == 0,
+        DATA_IS_PLUGGED: state_reg >= 4,
+        DATA_IS_CHARGING: power_reg > 0,
+        COMMAND_REMOTE_LOCK: registers[259] == 0,
+        COMMAND_TARGET_CURRENT: registers[261],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    as_dict = {5 + offset: word for offset, word in enumerate(DATA)}
+    as_dict.update({259: 1, 261: 160})
+    generated = CoreCapability.compiled_schema.decode
+    assert hand_written(as_dict) == generated(as_dict)
+
+    for label, fn in (
+        ("hand-written", lambda: hand_written(as_dict)),
+        ("generated", lambda: generated(as_dict)),
+    ):
+        seconds = timeit.timeit(fn, number=args.iterations)
+        print(f"{label:>18}: {seconds / args.iterations * 1e6:8.3f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,8 +30,11 @@ def build_mock_modbus_client(fixture: dict[str, list[int]]) -> MagicMock:
     """Build an AsyncModbusTcpClient mock that serves the given fixture.
 
     Maps (address, count) for both input and holding reads to the recorded
-    register lists. Unknown reads return an error response so tests fail
-    loudly on un-recorded register accesses.
+    register lists. Reads inside the recorded 5..18 data block (e.g. a
+    single polling tier's part of it) are served from that block.
+    Unknown reads return an "illegal data address" exception response,
+    as the wallbox does, so tests fail loudly on un-recorded register
+    accesses.
     """
     client = MagicMock()
     client.connected = False
@@ -59,13 +62,18 @@ def build_mock_modbus_client(fixture: dict[str, list[int]]) -> MagicMock:
         rr = MagicMock()
         if registers is None:
             rr.isError = MagicMock(return_value=True)
+            rr.exception_code = 0x02
             rr.registers = []
         else:
             rr.isError = MagicMock(return_value=False)
             rr.registers = registers
         return rr
 
+    data_block = fixture["input_5_18_data"]
+
     async def _read_input(address, count, device_id):
+        if (address, count) not in input_reads and 5 <= address and address + count <= 19:
+            return _response(data_block[address - 5 : address - 5 + count])
         return _response(input_reads.get((address, count)))
 
     async def _read_holding(address, count, device_id):
@@ -91,5 +99,6 @@ def mock_api() -> MagicMock:
     api = MagicMock()
     api.async_get_data = AsyncMock(return_value={})
     api.async_write_command = AsyncMock(return_value=True)
+    api.changed_keys = frozenset()
     api.disconnect = AsyncMock()
     return api
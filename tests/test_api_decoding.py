@@ -18,7 +18,6 @@ from custom_components.heidelberg_energy_control.const import (
     COMMAND_TARGET_CURRENT,
     DATA_CHARGING_POWER,
     DATA_CHARGING_STATE,
-    DATA_CURRENT,
     DATA_CURRENT_L1,
     DATA_CURRENT_L2,
     DATA_CURRENT_L3,
@@ -30,7 +29,6 @@ from custom_components.heidelberg_energy_control.const import (
     DATA_IS_CHARGING,
     DATA_IS_PLUGGED,
     DATA_PCB_TEMPERATURE,
-    DATA_PHASES_ACTIVE,
     DATA_REG_LAYOUT_VER,
     DATA_SW_VERSION,
     DATA_TOTAL_ENERGY,
@@ -64,8 +62,6 @@ VARIANT_V1_0_7 = pytest.param(
     },
     {
         DATA_CHARGING_STATE: "C",
-        DATA_PHASES_ACTIVE: 3,
-        DATA_CURRENT: 16.0,
         DATA_CURRENT_L1: 16.0,
         DATA_CURRENT_L2: 16.0,
         DATA_CURRENT_L3: 16.0,
@@ -97,8 +93,6 @@ VARIANT_V2_0_4 = pytest.param(
     },
     {
         DATA_CHARGING_STATE: "C",
-        DATA_PHASES_ACTIVE: 0,
-        DATA_CURRENT: 0.0,
         DATA_CURRENT_L1: 0.0,
         DATA_CURRENT_L2: 0.0,
         DATA_CURRENT_L3: 0.0,
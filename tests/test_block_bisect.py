@@ -0,0 +1,163 @@
+"""Tests for self-healing reads around registers the device rejects.
+
+Pins:
+  - a rejected gap-free block is bisected: the bad address is learned,
+    the rest of the block is still returned, later plans read around it
+  - the fields behind a bad address drop out of the poll data; the
+    poll itself succeeds, and the next poll costs no extra reads
+  - an address is learned only if the device said "illegal data
+    address"; any other rejection fails the read and learns nothing,
+    also when the rest of the block was readable
+  - the coordinator persists the bad-address map and restores it on
+    the next start, unless the firmware changed
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.heidelberg_energy_control.const import (
+    DATA_CURRENT_L3,
+    DATA_PCB_TEMPERATURE,
+    DATA_SW_VERSION,
+    DATA_VOLTAGE_L1,
+    DOMAIN,
+)
+from custom_components.heidelberg_energy_control.coordinator import (
+    HeidelbergEnergyControlCoordinator,
+)
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.exceptions import (
+    HeidelbergEnergyControlReadError,
+)
+from custom_components.heidelberg_energy_control.core.registers import (
+    RegisterDefinition,
+    RegisterType,
+    plan_blocks,
+)
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+INPUT = RegisterType.INPUT
+# Input register of the PCB temperature.
+_BAD = 9
+
+
+def _rejecting(client: MagicMock, bad: int = _BAD, code: int = 2) -> AsyncMock:
+    """Make the client reject every input read covering `bad` with `code`."""
+    serve = client.read_input_registers.side_effect
+
+    async def _read_input(address, count, device_id):
+        if address <= bad < address + count:
+            rr = MagicMock()
+            rr.isError = MagicMock(return_value=True)
+            rr.exception_code = code
+            rr.registers = []
+            return rr
+        return await serve(address, count, device_id)
+
+    client.read_input_registers = AsyncMock(side_effect=_read_input)
+    return client.read_input_registers
+
+
+async def _loaded_api() -> HeidelbergEnergyControlAPI:
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    api._client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    await api.async_get_static_data()
+    return api
+
+
+async def test_bisect_learns_the_bad_address():
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    api._client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    _rejecting(api._client)
+
+    registers = await api.async_read_registers([RegisterDefinition(5, 14, INPUT)])
+
+    assert api.unreadable_addresses == {(INPUT, _BAD)}
+    assert sorted(registers) == [a for a in range(5, 19) if a != _BAD]
+    assert [(b.address, b.count) for b in plan_blocks(
+        [RegisterDefinition(5, 14, INPUT)], 2, api.unreadable_addresses
+    )] == [(5, 4), (10, 9)]
+
+
+async def test_transient_rejection_is_never_learned():
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    api._client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    _rejecting(api._client, code=6)
+
+    with pytest.raises(HeidelbergEnergyControlReadError):
+        await api.async_read_registers([RegisterDefinition(5, 14, INPUT)])
+    assert not api.unreadable_addresses
+
+
+async def test_poll_reads_around_a_bad_register():
+    api = await _loaded_api()
+    reads = _rejecting(api._client)
+
+    data = await api.async_get_data()
+
+    assert DATA_PCB_TEMPERATURE not in data
+    assert data[DATA_CURRENT_L3] == 16.0
+    assert DATA_VOLTAGE_L1 in data
+
+    reads.reset_mock()
+    await api.async_get_data()
+    assert reads.await_count == len(
+        [b for b in api.read_plan.blocks if b.type is INPUT]
+    )
+
+
+@pytest.mark.parametrize("code", [2, 4], ids=["illegal-address", "device-failure"])
+async def test_lone_register_needs_an_illegal_address_answer(code):
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    rr = MagicMock()
+    rr.isError = MagicMock(return_value=True)
+    rr.exception_code = code
+    api._client = MagicMock()
+    api._client.connected = True
+    api._client.read_input_registers = AsyncMock(return_value=rr)
+
+    if code == 2:
+        assert await api.async_read_registers([RegisterDefinition(5, 1, INPUT)]) == {}
+        assert api.unreadable_addresses == {(INPUT, 5)}
+    else:
+        with pytest.raises(HeidelbergEnergyControlReadError):
+            await api.async_read_registers([RegisterDefinition(5, 1, INPUT)])
+        assert not api.unreadable_addresses
+
+
+async def test_coordinator_remembers_bad_addresses(hass):
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={})
+    entry.add_to_hass(hass)
+
+    api = await _loaded_api()
+    _rejecting(api._client)
+    coord = HeidelbergEnergyControlCoordinator(
+        hass=hass, api=api, static_data={DATA_SW_VERSION: "1.0.7"}, entry=entry
+    )
+    await coord._async_setup()
+    await coord._async_update_data()
+    await coord.device_cache.async_flush()
+    learned = api.unreadable_addresses
+    assert (INPUT, _BAD) in learned
+
+    restored = await _loaded_api()
+    coord = HeidelbergEnergyControlCoordinator(
+        hass=hass, api=restored, static_data={DATA_SW_VERSION: "1.0.7"}, entry=entry
+    )
+    await coord._async_setup()
+    assert restored.unreadable_addresses == learned
+    assert DATA_PCB_TEMPERATURE not in restored.polled_keys
+
+    updated = await _loaded_api()
+    coord = HeidelbergEnergyControlCoordinator(
+        hass=hass, api=updated, static_data={DATA_SW_VERSION: "1.0.8"}, entry=entry
+    )
+    await coord._async_setup()
+    assert (INPUT, _BAD) not in updated.unreadable_addresses
@@ -2,7 +2,12 @@
 
 Pins:
   - consecutive same-type register definitions merge into a single Modbus read
-  - non-consecutive addresses become separate reads
+  - holes up to `max_gap` registers are bridged; bridged words are not returned
+  - addresses known to be unreadable are never bridged
+  - a rejected gap-bridging read falls back to its gap-free sub-blocks;
+    the bridged addresses are recorded as unreadable only if the device
+    answered "illegal data address"
+  - addresses further apart than `max_gap` become separate reads
   - different register types (input vs holding) never merge
   - duplicate definitions are deduplicated, not read twice
   - error responses and Modbus exceptions surface as ReadError
@@ -22,18 +27,25 @@ from custom_components.heidelberg_energy_control.core.exceptions import (
     HeidelbergEnergyControlReadError,
 )
 from custom_components.heidelberg_energy_control.core.registers import (
+    MAX_BLOCK_COUNT,
+    RegisterBlock,
     RegisterDefinition,
     RegisterType,
+    plan_blocks,
 )
 
 
-def _api_with_mock_client() -> tuple[HeidelbergEnergyControlAPI, MagicMock]:
+def _api_with_mock_client(
+    max_gap: int = 2,
+) -> tuple[HeidelbergEnergyControlAPI, MagicMock]:
     """Build an API instance backed by a fully mocked client.
 
     The client is pre-configured as connected; individual tests set
     read_input_registers / read_holding_registers side_effects.
     """
-    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    api = HeidelbergEnergyControlAPI(
+        host="x", port=502, device_id=1, max_gap=max_gap
+    )
     client = MagicMock()
     client.connected = True
 
@@ -53,9 +65,10 @@ def _ok(registers: list[int]) -> MagicMock:
     return rr
 
 
-def _err() -> MagicMock:
+def _err(code: int | None = None) -> MagicMock:
     rr = MagicMock()
     rr.isError = MagicMock(return_value=True)
+    rr.exception_code = code
     rr.registers = []
     return rr
 
@@ -121,6 +134,163 @@ async def test_non_consecutive_input_definitions_become_separate_reads():
     assert client.read_input_registers.await_count == 2
 
 
+# ---------- gap bridging ----------
+
+
+async def test_small_gap_is_bridged_in_one_read():
+    """Holding 259 and 261 (one-register hole at 260) → one read of (259, 3)."""
+    api, client = _api_with_mock_client(max_gap=1)
+    client.read_holding_registers = AsyncMock(return_value=_ok([1, 999, 160]))
+
+    result = await api.async_read_registers(
+        [
+            RegisterDefinition(259, 1, RegisterType.HOLDING),
+            RegisterDefinition(261, 1, RegisterType.HOLDING),
+        ]
+    )
+
+    # The bridged word at 260 is read but not returned.
+    assert result == {259: 1, 261: 160}
+    client.read_holding_registers.assert_awaited_once_with(
+        address=259, count=3, device_id=1
+    )
+
+
+async def test_gap_wider_than_max_gap_is_not_bridged():
+    api, client = _api_with_mock_client(max_gap=1)
+    client.read_holding_registers = AsyncMock(side_effect=[_ok([1]), _ok([160])])
+
+    result = await api.async_read_registers(
+        [
+            RegisterDefinition(257, 1, RegisterType.HOLDING),
+            RegisterDefinition(260, 1, RegisterType.HOLDING),
+        ]
+    )
+
+    assert result == {257: 1, 260: 160}
+    assert client.read_holding_registers.await_count == 2
+
+
+async def test_max_gap_zero_only_merges_touching_definitions():
+    api, client = _api_with_mock_client(max_gap=0)
+    client.read_holding_registers = AsyncMock(side_effect=[_ok([1]), _ok([160])])
+
+    await api.async_read_registers(
+        [
+            RegisterDefinition(259, 1, RegisterType.HOLDING),
+            RegisterDefinition(261, 1, RegisterType.HOLDING),
+        ]
+    )
+
+    assert client.read_holding_registers.await_count == 2
+
+
+async def test_known_unreadable_address_is_never_bridged():
+    api, client = _api_with_mock_client(max_gap=2)
+    api.mark_unreadable(RegisterType.HOLDING, 260)
+    client.read_holding_registers = AsyncMock(side_effect=[_ok([1]), _ok([160])])
+
+    await api.async_read_registers(
+        [
+            RegisterDefinition(259, 1, RegisterType.HOLDING),
+            RegisterDefinition(261, 1, RegisterType.HOLDING),
+        ]
+    )
+
+    assert client.read_holding_registers.await_args_list[0].kwargs["count"] == 1
+    assert client.read_holding_registers.await_args_list[1].kwargs["count"] == 1
+
+
+async def test_rejected_gap_read_falls_back_and_learns_unreadable_address():
+    """Device rejects the bridged (259, 3) read → split reads, 260 remembered."""
+    api, client = _api_with_mock_client(max_gap=1)
+
+    async def _read_holding(address, count, device_id):
+        if address <= 260 < address + count:
+            return _err(0x02)
+        return _ok({259: [1], 261: [160]}[address])
+
+    client.read_holding_registers = AsyncMock(side_effect=_read_holding)
+    definitions = [
+        RegisterDefinition(259, 1, RegisterType.HOLDING),
+        RegisterDefinition(261, 1, RegisterType.HOLDING),
+    ]
+
+    result = await api.async_read_registers(definitions)
+
+    assert result == {259: 1, 261: 160}
+    assert (RegisterType.HOLDING, 260) in api.unreadable_addresses
+
+    # The next read goes straight to the split plan.
+    client.read_holding_registers.reset_mock()
+    await api.async_read_registers(definitions)
+    assert client.read_holding_registers.await_count == 2
+
+
+async def test_transient_gap_rejection_is_retried_next_read():
+    """A busy device (0x06) rejecting the merged read teaches nothing."""
+    api, client = _api_with_mock_client(max_gap=1)
+    client.read_holding_registers = AsyncMock(
+        side_effect=[_err(0x06), _ok([1]), _ok([160]), _ok([1, 0, 160])]
+    )
+    definitions = [
+        RegisterDefinition(259, 1, RegisterType.HOLDING),
+        RegisterDefinition(261, 1, RegisterType.HOLDING),
+    ]
+
+    assert await api.async_read_registers(definitions) == {259: 1, 261: 160}
+    assert api.unreadable_addresses == frozenset()
+
+    assert await api.async_read_registers(definitions) == {259: 1, 261: 160}
+    assert client.read_holding_registers.await_args.kwargs["count"] == 3
+
+
+async def test_rejected_gap_free_subblock_still_raises():
+    """If a sub-block also fails, the fallback surfaces a ReadError."""
+    api, client = _api_with_mock_client(max_gap=1)
+    client.read_holding_registers = AsyncMock(return_value=_err())
+
+    with pytest.raises(HeidelbergEnergyControlReadError):
+        await api.async_read_registers(
+            [
+                RegisterDefinition(259, 1, RegisterType.HOLDING),
+                RegisterDefinition(261, 1, RegisterType.HOLDING),
+            ]
+        )
+    assert api.unreadable_addresses == frozenset()
+
+
+# ---------- planner ----------
+
+
+def test_plan_blocks_records_gaps_and_splits_back():
+    blocks = plan_blocks(
+        [
+            RegisterDefinition(257, 2, RegisterType.HOLDING),
+            RegisterDefinition(261, 2, RegisterType.HOLDING),
+        ],
+        max_gap=2,
+    )
+
+    assert blocks == [RegisterBlock(RegisterType.HOLDING, 257, 6, gaps=(259, 260))]
+    assert blocks[0].split() == [
+        RegisterBlock(RegisterType.HOLDING, 257, 2),
+        RegisterBlock(RegisterType.HOLDING, 261, 2),
+    ]
+
+
+def test_plan_blocks_respects_modbus_block_size_limit():
+    blocks = plan_blocks(
+        [
+            RegisterDefinition(0, MAX_BLOCK_COUNT, RegisterType.INPUT),
+            RegisterDefinition(MAX_BLOCK_COUNT, 1, RegisterType.INPUT),
+        ],
+        max_gap=2,
+    )
+
+    assert [b.count for b in blocks] == [MAX_BLOCK_COUNT, 1]
+
+
 # ---------- type separation: input and holding never merge ----------
 
 
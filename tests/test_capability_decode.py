@@ -22,7 +22,6 @@ from custom_components.heidelberg_energy_control.const import (
     DATA_HW_MIN_CURR,
     DATA_HW_VERSION,
     DATA_IS_CHARGING,
-    DATA_PHASES_ACTIVE,
     DATA_REG_LAYOUT_VER,
     DATA_SW_VERSION,
     DATA_TOTAL_ENERGY,
@@ -38,6 +37,7 @@ from custom_components.heidelberg_energy_control.core.capabilities.core import (
     CoreCapability,
 )
 from custom_components.heidelberg_energy_control.core.registers import (
+    PollTier,
     RegisterDefinition,
     RegisterType,
 )
@@ -117,7 +117,6 @@ def test_decode_polled_returns_full_output_from_dict():
     result = cap.decode_polled(regs)
 
     assert result[DATA_CHARGING_STATE] == "C"
-    assert result[DATA_PHASES_ACTIVE] == 3
     assert result[DATA_CURRENT_L1] == 16.0
     assert result[DATA_TOTAL_ENERGY] == 12345.6
     assert result[DATA_IS_CHARGING] is True
@@ -137,10 +136,13 @@ def test_core_declares_expected_definitions():
         RegisterDefinition(REG_HW_VERS, 1, RegisterType.INPUT),
         RegisterDefinition(REG_SW_VERS, 1, RegisterType.INPUT),
     )
-    # Polled defs: one input block for data, plus two holding registers
-    # for the command state.
+    # Polled defs: the data block split into a fast part and the medium-tier
+    # energy counters, plus two holding registers for the command state.
     assert CoreCapability.polled_definitions == (
-        RegisterDefinition(REG_DATA_START, 14, RegisterType.INPUT),
-        RegisterDefinition(REG_COMMAND_REMOTE_LOCK, 1, RegisterType.HOLDING),
+        RegisterDefinition(REG_DATA_START, 10, RegisterType.INPUT),
+        RegisterDefinition(15, 4, RegisterType.INPUT, PollTier.MEDIUM),
+        RegisterDefinition(
+            REG_COMMAND_REMOTE_LOCK, 1, RegisterType.HOLDING, PollTier.SLOW
+        ),
         RegisterDefinition(REG_COMMAND_TARGET_CURRENT, 1, RegisterType.HOLDING),
     )
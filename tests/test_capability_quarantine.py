@@ -0,0 +1,175 @@
+"""Tests for per-capability failure isolation.
+
+Pins:
+  - an optional capability whose registers stop answering is
+    quarantined; the poll still publishes the core data
+  - quarantined capabilities are left out of later polls
+  - once the backoff has passed they are re-probed: a clean re-probe
+    puts them back, a failed one doubles the backoff (capped)
+  - a failing core read still fails the poll
+  - an optional capability that can't decode its words is quarantined;
+    any other error from decoding propagates
+  - failure counts are exposed per capability, also in diagnostics
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pymodbus.exceptions import ModbusException
+import pytest
+
+from custom_components.heidelberg_energy_control.const import (
+    COMMAND_FAILSAFE_CURRENT,
+    COMMAND_STANDBY,
+    COMMAND_WATCHDOG_TIMEOUT,
+    DATA_CHARGING_POWER,
+)
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.exceptions import (
+    HeidelbergEnergyControlReadError,
+)
+from custom_components.heidelberg_energy_control.core.health import (
+    QUARANTINE_BASE_DELAY,
+    QUARANTINE_MAX_DELAY,
+    CapabilityHealth,
+)
+from custom_components.heidelberg_energy_control.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+_HOLDING = {257: 15000, 258: 0, 259: 1, 260: 0, 261: 60, 262: 0}
+
+
+async def _loaded_api() -> tuple[HeidelbergEnergyControlAPI, set[int], AsyncMock]:
+    """API on a v2.0.4 box with watchdog and standby; returns the broken set."""
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+    broken: set[int] = set()
+
+    async def _read_holding(address, count, device_id):
+        span = range(address, address + count)
+        if broken.intersection(span):
+            raise ModbusException("timeout")
+        rr = MagicMock()
+        rr.isError = MagicMock(return_value=not all(a in _HOLDING for a in span))
+        rr.registers = [_HOLDING.get(a, 0) for a in span]
+        return rr
+
+    client.read_holding_registers = AsyncMock(side_effect=_read_holding)
+    api._client = client
+    await api.async_get_static_data()
+    assert [cap.key for cap in api.capabilities] == ["core", "standby", "watchdog"]
+    return api, broken, client.read_holding_registers
+
+
+async def test_failing_capability_is_quarantined():
+    api, broken, reads = await _loaded_api()
+    broken.add(257)
+
+    data = await api.async_get_data()
+
+    assert DATA_CHARGING_POWER in data
+    assert COMMAND_STANDBY in data
+    assert COMMAND_WATCHDOG_TIMEOUT not in data
+    assert COMMAND_FAILSAFE_CURRENT not in data
+    health = api.capability_health
+    assert health["watchdog"]["failures"] == 1
+    assert health["watchdog"]["quarantined"] is True
+    assert health["standby"]["failures"] == 0
+
+    reads.reset_mock()
+    await api.async_get_data()
+    read = {
+        a
+        for call in reads.await_args_list
+        for a in range(
+            call.kwargs["address"], call.kwargs["address"] + call.kwargs["count"]
+        )
+    }
+    assert 257 not in read and 262 not in read
+
+
+async def test_quarantined_capability_is_reprobed_with_backoff():
+    api, broken, _ = await _loaded_api()
+    broken.add(257)
+    await api.async_get_data()
+    watchdog = api._health["watchdog"]
+
+    watchdog.retry_at = 0
+    await api.async_get_data()
+    assert watchdog.failures == 2
+    assert api.capability_health["watchdog"]["retry_in"] > QUARANTINE_BASE_DELAY
+
+    broken.clear()
+    watchdog.retry_at = 0
+    data = await api.async_get_data()
+    assert data[COMMAND_WATCHDOG_TIMEOUT] == 15000
+    assert api.capability_health["watchdog"]["quarantined"] is False
+
+
+async def test_core_failure_still_fails_the_poll():
+    api, broken, _ = await _loaded_api()
+    broken.add(261)
+
+    with pytest.raises(HeidelbergEnergyControlReadError):
+        await api.async_get_data()
+    assert api.capability_health["core"]["failures"] == 1
+
+
+async def test_undecodable_capability_is_quarantined():
+    api, _, _ = await _loaded_api()
+    watchdog = api.capabilities[2]
+
+    with patch.object(watchdog, "decode_polled", side_effect=KeyError(257)):
+        data = await api.async_get_data()
+
+    assert COMMAND_STANDBY in data
+    assert COMMAND_WATCHDOG_TIMEOUT not in data
+    assert api.capability_health["watchdog"]["quarantined"] is True
+
+
+async def test_unexpected_decode_error_propagates():
+    api, _, _ = await _loaded_api()
+    watchdog = api.capabilities[2]
+
+    with (
+        patch.object(watchdog, "decode_polled", side_effect=RuntimeError("bug")),
+        pytest.raises(RuntimeError),
+    ):
+        await api.async_get_data()
+    assert api.capability_health["watchdog"]["quarantined"] is False
+
+
+def test_backoff_doubles_up_to_the_cap():
+    health = CapabilityHealth()
+
+    delays = [health.record_failure(0, "err") for _ in range(10)]
+
+    assert delays[:3] == [
+        QUARANTINE_BASE_DELAY,
+        2 * QUARANTINE_BASE_DELAY,
+        4 * QUARANTINE_BASE_DELAY,
+    ]
+    assert delays[-1] == QUARANTINE_MAX_DELAY
+    health.record_recovery()
+    assert health.record_failure(0, "err") == QUARANTINE_BASE_DELAY
+
+
+async def test_diagnostics_expose_capability_health(hass):
+    api, broken, _ = await _loaded_api()
+    broken.add(257)
+    await api.async_get_data()
+    entry = MagicMock()
+    entry.data = {"host": "10.0.0.2", "port": 502, "device_id": 1}
+    entry.runtime_data.api = api
+    entry.runtime_data.static_data = {}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["host"] == "**REDACTED**"
+    assert diagnostics["capabilities"]["watchdog"]["failures"] == 1
@@ -0,0 +1,144 @@
+"""Tests for the shared, reference-counted gateway connection pool.
+
+Pins:
+  - APIs on the same host:port share one connection and one client;
+    a different port gets its own connection
+  - the socket stays open until the last API releases the connection,
+    and disconnect() is idempotent
+  - a setup whose first poll fails releases its connection
+  - transactions from different device IDs never overlap on the shared
+    client and are served in arrival order
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.heidelberg_energy_control.const import DOMAIN
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.connection import CONNECTION_POOL
+from custom_components.heidelberg_energy_control.core.exceptions import (
+    HeidelbergEnergyControlConnectionError,
+)
+from custom_components.heidelberg_energy_control.core.registers import (
+    RegisterDefinition,
+    RegisterType,
+)
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+
+async def test_apis_on_same_gateway_share_one_connection():
+    a = HeidelbergEnergyControlAPI(host="gw-share", port=502, device_id=1)
+    b = HeidelbergEnergyControlAPI(host="gw-share", port=502, device_id=2)
+    c = HeidelbergEnergyControlAPI(host="gw-share", port=503, device_id=1)
+
+    assert a._connection is b._connection
+    assert a._client is b._client
+    assert c._connection is not a._connection
+    assert a._connection.users == 2
+
+    for api in (a, b, c):
+        await api.disconnect()
+
+
+async def test_socket_closes_only_when_last_api_releases():
+    a = HeidelbergEnergyControlAPI(host="gw-release", port=502, device_id=1)
+    b = HeidelbergEnergyControlAPI(host="gw-release", port=502, device_id=2)
+    connection = a._connection
+    client = MagicMock()
+    client.connected = True
+    connection.client = client
+
+    await a.disconnect()
+    await a.disconnect()  # idempotent: must not drop b's reference
+    client.close.assert_not_called()
+    assert connection.users == 1
+
+    await b.disconnect()
+    client.close.assert_called_once()
+    assert connection.users == 0
+
+    # A fresh API on the same gateway gets a new connection.
+    d = HeidelbergEnergyControlAPI(host="gw-release", port=502, device_id=1)
+    assert d._connection is not connection
+    await d.disconnect()
+
+
+async def test_transactions_across_device_ids_are_serialized_in_order():
+    a = HeidelbergEnergyControlAPI(
+        host="gw-fair", port=502, device_id=1, max_gap=0
+    )
+    b = HeidelbergEnergyControlAPI(
+        host="gw-fair", port=502, device_id=2, max_gap=0
+    )
+    active = 0
+    max_active = 0
+    order: list[tuple[int, int]] = []
+
+    async def _read(address, count, device_id):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        order.append((device_id, address))
+        await asyncio.sleep(0)
+        active -= 1
+        rr = MagicMock()
+        rr.isError = MagicMock(return_value=False)
+        rr.registers = [0] * count
+        return rr
+
+    client = MagicMock()
+    client.connected = True
+    client.read_input_registers = AsyncMock(side_effect=_read)
+    a._client = b._client = client
+
+    definitions = [
+        RegisterDefinition(5, 1, RegisterType.INPUT),
+        RegisterDefinition(100, 1, RegisterType.INPUT),
+    ]
+    await asyncio.gather(
+        a.async_read_registers(definitions), b.async_read_registers(definitions)
+    )
+
+    assert max_active == 1
+    # FIFO lock: the two wallboxes alternate rather than one draining first.
+    assert order == [(1, 5), (2, 5), (1, 100), (2, 100)]
+
+    await a.disconnect()
+    await b.disconnect()
+    assert ("gw-fair", 502) not in CONNECTION_POOL._connections
+
+
+async def test_failed_first_poll_releases_the_connection(hass):
+    client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "gw-retry", "port": 502, "device_id": 1},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.heidelberg_energy_control.core.connection.AsyncModbusTcpClient",
+            return_value=client,
+        ),
+        patch(
+            "custom_components.heidelberg_energy_control.core.api."
+            "HeidelbergEnergyControlAPI.async_get_data",
+            side_effect=HeidelbergEnergyControlConnectionError("gone"),
+        ),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert ("gw-retry", 502) not in CONNECTION_POOL._connections
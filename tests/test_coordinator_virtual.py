@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+from pymodbus.exceptions import ModbusException
 import pytest
 
 from custom_components.heidelberg_energy_control.const import (
@@ -24,6 +25,9 @@ from custom_components.heidelberg_energy_control.const import (
 from custom_components.heidelberg_energy_control.coordinator import (
     HeidelbergEnergyControlCoordinator,
 )
+from custom_components.heidelberg_energy_control.core.exceptions import (
+    HeidelbergEnergyControlAPIError,
+)
 
 
 def _make_coordinator(
@@ -216,3 +220,33 @@ async def test_empty_responses_raise_update_failed_on_third(hass, mock_api):
     await coord._async_update_data()
     with pytest.raises(UpdateFailed):
         await coord._async_update_data()
+
+
+# ---------- poll errors ----------
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        HeidelbergEnergyControlAPIError("bad frame"),
+        ModbusException("timeout"),
+        ConnectionResetError("reset"),
+    ],
+)
+async def test_communication_errors_raise_update_failed(hass, mock_api, error):
+    from homeassistant.helpers.update_coordinator import UpdateFailed
+
+    coord = _make_coordinator(hass, mock_api)
+    mock_api.async_get_data.side_effect = error
+
+    with pytest.raises(UpdateFailed):
+        await coord._async_update_data()
+
+
+async def test_unexpected_errors_propagate(hass, mock_api):
+    """A bug is not a failed poll: it keeps its own type and traceback."""
+    coord = _make_coordinator(hass, mock_api)
+    mock_api.async_get_data.side_effect = RuntimeError("bug")
+
+    with pytest.raises(RuntimeError):
+        await coord._async_update_data()
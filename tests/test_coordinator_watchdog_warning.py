@@ -1,8 +1,8 @@
 """Tests for the coordinator's watchdog-headroom warning.
 
 If the poll interval is close to (or exceeds) the wallbox's watchdog
-timeout, a single missed poll will trigger the FailSafe current. The
-coordinator watches for that config mismatch on each successful update
+timeout, only keep-alives between polls hold off the FailSafe current,
+and a single lost one lets it take over. The coordinator watches for that config mismatch on each successful update
 and logs a one-shot warning so the user can retune before it bites.
 
 The watchdog timeout is stored in the coordinator data as raw
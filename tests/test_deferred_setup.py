@@ -0,0 +1,81 @@
+"""Tests for setting up while the wallbox is offline.
+
+Pins:
+  - with cached static data, setup succeeds without reaching the wallbox
+    and the entities are added as unavailable
+  - failed polls meanwhile back off, capped at MAX_CONNECT_BACKOFF
+  - the first successful poll restores the scan interval and availability
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import STATE_UNAVAILABLE
+
+from custom_components.heidelberg_energy_control.const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_CONNECT_BACKOFF,
+)
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.device_cache import DeviceCache
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+
+async def test_setup_defers_while_the_wallbox_is_offline(hass):
+    client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+    reachable_connect = client.connect
+    client.connect = AsyncMock(return_value=False)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "deferred", "port": 502, "device_id": 1},
+        options={},
+    )
+    entry.add_to_hass(hass)
+    # What an earlier start cached for this wallbox.
+    api = HeidelbergEnergyControlAPI(host="deferred-probe", port=502, device_id=1)
+    api._client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+    static = await api.async_read_core_static_data()
+    await api.disconnect()
+    cache = DeviceCache(hass, entry.entry_id)
+    cache.async_set_static_data(static, ["core"])
+    await cache.async_flush()
+
+    with patch(
+        "custom_components.heidelberg_energy_control.core.connection.AsyncModbusTcpClient",
+        return_value=client,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = entry.runtime_data
+        assert not coordinator.last_update_success
+        states = hass.states.async_all("sensor")
+        assert states
+        assert all(state.state == STATE_UNAVAILABLE for state in states)
+        assert coordinator.update_interval == timedelta(
+            seconds=DEFAULT_SCAN_INTERVAL * 2
+        )
+
+        for _ in range(10):
+            await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(seconds=MAX_CONNECT_BACKOFF)
+
+        client.connect = reachable_connect
+        with patch.object(hass.config_entries, "async_schedule_reload"):
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+
+        assert coordinator.last_update_success
+        assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        assert any(
+            state.state != STATE_UNAVAILABLE for state in hass.states.async_all("sensor")
+        )
+        assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,149 @@
+"""Tests for the demand-driven read plan.
+
+Pins:
+  - a restricted capability polls and decodes only the fields asked
+    for, and still owns all of its writes
+  - the API polls only the registers behind the demanded keys, but
+    bridges the left-out ones so no block read splits
+  - the coordinator skips registers whose entities are disabled,
+    unless an enabled derived entity or internal logic needs them
+  - enabling an entity in the registry puts its registers back
+"""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.heidelberg_energy_control.const import (
+    COMMAND_REMOTE_LOCK,
+    COMMAND_TARGET_CURRENT,
+    DATA_APPARENT_POWER,
+    DATA_APPARENT_POWER_L1,
+    DATA_APPARENT_POWER_L2,
+    DATA_APPARENT_POWER_L3,
+    DATA_CHARGING_POWER,
+    DATA_CURRENT_L1,
+    DATA_ENERGY_SINCE_POWER_ON,
+    DATA_PCB_TEMPERATURE,
+    DATA_POWER_FACTOR,
+    DATA_VOLTAGE_L1,
+    DATA_VOLTAGE_L2,
+    DATA_VOLTAGE_L3,
+    DOMAIN,
+)
+from custom_components.heidelberg_energy_control.coordinator import (
+    HeidelbergEnergyControlCoordinator,
+)
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.capabilities import CoreCapability
+from custom_components.heidelberg_energy_control.core.registers import (
+    PollTier,
+    RegisterDefinition,
+    RegisterType,
+)
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+# Default-disabled entities that only the voltage registers feed.
+_VOLTAGE_ONLY = (
+    DATA_VOLTAGE_L1,
+    DATA_VOLTAGE_L2,
+    DATA_VOLTAGE_L3,
+    DATA_APPARENT_POWER,
+    DATA_APPARENT_POWER_L1,
+    DATA_APPARENT_POWER_L2,
+    DATA_APPARENT_POWER_L3,
+    DATA_POWER_FACTOR,
+)
+
+
+async def _loaded_api() -> HeidelbergEnergyControlAPI:
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    api._client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    await api.async_get_static_data()
+    return api
+
+
+def test_restricted_capability_polls_only_demanded_fields():
+    cap = CoreCapability()
+    cap.restrict({DATA_CHARGING_POWER, COMMAND_TARGET_CURRENT})
+
+    assert cap.polled_definitions == (
+        RegisterDefinition(14, 1, RegisterType.INPUT),
+        RegisterDefinition(261, 1, RegisterType.HOLDING),
+    )
+    assert cap.decode_polled({14: 11040, 261: 160}) == {
+        DATA_CHARGING_POWER: 11040,
+        COMMAND_TARGET_CURRENT: 160,
+    }
+    assert cap.supports_write(COMMAND_REMOTE_LOCK) is True
+
+    cap.restrict(None)
+    assert cap.polled_definitions == CoreCapability.polled_definitions
+
+
+async def test_api_polls_only_demanded_registers():
+    api = await _loaded_api()
+    full = api.read_plan.describe()["registers"]
+
+    api.set_polled_keys({DATA_CHARGING_POWER, DATA_CURRENT_L1})
+    data = await api.async_get_data()
+
+    assert api.read_plan.describe()["registers"] < full
+    assert dict(data) == {DATA_CURRENT_L1: 16.0, DATA_CHARGING_POWER: 11040}
+    assert DATA_VOLTAGE_L1 in api.available_keys
+
+
+async def test_leaving_fields_out_never_splits_a_block():
+    api = await _loaded_api()
+    full = api.read_plan_for({PollTier.FAST}).blocks
+
+    # Default install: voltage and temperature entities are disabled.
+    api.set_polled_keys(
+        api.available_keys
+        - {DATA_VOLTAGE_L1, DATA_VOLTAGE_L2, DATA_VOLTAGE_L3, DATA_PCB_TEMPERATURE}
+    )
+    lean = api.read_plan_for({PollTier.FAST}).blocks
+
+    assert [(b.type, b.address, b.count) for b in lean] == [
+        (b.type, b.address, b.count) for b in full
+    ]
+
+
+async def test_coordinator_follows_the_entity_registry(hass, entity_registry):
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={})
+    entry.add_to_hass(hass)
+    for key in (*_VOLTAGE_ONLY, DATA_PCB_TEMPERATURE, DATA_CURRENT_L1):
+        entity_registry.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            f"{entry.entry_id}_{key}",
+            config_entry=entry,
+            disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+        )
+
+    api = await _loaded_api()
+    coord = HeidelbergEnergyControlCoordinator(
+        hass=hass, api=api, static_data={}, entry=entry
+    )
+    await coord._async_setup()
+    polled = api.polled_keys
+
+    assert not polled & {DATA_VOLTAGE_L1, DATA_VOLTAGE_L2, DATA_PCB_TEMPERATURE}
+    # Disabled, but the enabled average current is computed from it.
+    assert DATA_CURRENT_L1 in polled
+    assert DATA_ENERGY_SINCE_POWER_ON in polled  # no entity registered yet
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{DATA_APPARENT_POWER_L1}"
+    )
+    entity_registry.async_update_entity(entity_id, disabled_by=None)
+    await hass.async_block_till_done()
+
+    polled = api.polled_keys
+    assert DATA_VOLTAGE_L1 in polled
+    assert DATA_VOLTAGE_L2 not in polled
@@ -0,0 +1,147 @@
+"""Tests for the derived-metrics stage.
+
+Pins:
+  - metrics run after the derived metrics they read, whatever the
+    declaration order; duplicates and cycles are rejected
+  - a metric only runs when its inputs changed
+  - None inputs give None, absent inputs leave the key out
+  - the core metrics' values for a 3-phase charging wallbox
+  - the coordinator adds derived keys to every poll's data
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.heidelberg_energy_control.const import (
+    DATA_APPARENT_POWER,
+    DATA_APPARENT_POWER_L1,
+    DATA_CHARGING_POWER,
+    DATA_CURRENT,
+    DATA_CURRENT_L1,
+    DATA_CURRENT_L2,
+    DATA_CURRENT_L3,
+    DATA_HW_MAX_CURR,
+    DATA_PHASE_IMBALANCE,
+    DATA_PHASES_ACTIVE,
+    DATA_POWER_FACTOR,
+    DATA_REG_LAYOUT_VER,
+    DATA_VOLTAGE_L1,
+    DATA_VOLTAGE_L2,
+    DATA_VOLTAGE_L3,
+)
+from custom_components.heidelberg_energy_control.coordinator import (
+    HeidelbergEnergyControlCoordinator,
+)
+from custom_components.heidelberg_energy_control.core.derived import (
+    CORE_METRICS,
+    DerivedGraph,
+    DerivedMetric,
+)
+
+_CHARGING = {
+    DATA_CURRENT_L1: 16.0,
+    DATA_CURRENT_L2: 16.0,
+    DATA_CURRENT_L3: 15.0,
+    DATA_VOLTAGE_L1: 230,
+    DATA_VOLTAGE_L2: 231,
+    DATA_VOLTAGE_L3: 229,
+    DATA_CHARGING_POWER: 10800,
+}
+
+
+def test_metrics_run_in_dependency_order():
+    graph = DerivedGraph(
+        (
+            DerivedMetric("c", ("b",), lambda b: b + 1),
+            DerivedMetric("b", ("a",), lambda a: a * 2),
+        )
+    )
+    data = {"a": 1}
+
+    assert graph.apply(data) == {"b", "c"}
+    assert data == {"a": 1, "b": 2, "c": 3}
+
+
+@pytest.mark.parametrize(
+    "metrics",
+    [
+        (DerivedMetric("a", (), int), DerivedMetric("a", (), int)),
+        (DerivedMetric("a", ("b",), int), DerivedMetric("b", ("a",), int)),
+    ],
+    ids=["duplicate", "cycle"],
+)
+def test_invalid_graphs_are_rejected(metrics):
+    with pytest.raises(ValueError):
+        DerivedGraph(metrics)
+
+
+def test_metric_runs_only_when_inputs_change():
+    compute = MagicMock(side_effect=lambda a: a * 2)
+    graph = DerivedGraph((DerivedMetric("b", ("a",), compute),))
+
+    graph.apply({"a": 1})
+    data = {"a": 1}
+    assert graph.apply(data) == frozenset()
+    assert data["b"] == 2
+    assert compute.call_count == 1
+
+    graph.apply({"a": 2})
+    assert compute.call_count == 2
+
+
+def test_none_and_absent_inputs():
+    compute = MagicMock(return_value=0)
+    graph = DerivedGraph((DerivedMetric("b", ("a",), compute),))
+
+    data = {"a": None}
+    graph.apply(data)
+    assert data["b"] is None
+
+    data = {}
+    graph.apply(data)
+    assert "b" not in data
+    compute.assert_not_called()
+
+
+def test_core_metrics_for_three_phase_charging():
+    data = dict(_CHARGING)
+    DerivedGraph(CORE_METRICS).apply(data)
+
+    assert data[DATA_PHASES_ACTIVE] == 3
+    assert data[DATA_CURRENT] == 15.67
+    assert data[DATA_APPARENT_POWER_L1] == 3680.0
+    assert data[DATA_APPARENT_POWER] == 10811.0
+    assert data[DATA_PHASE_IMBALANCE] == 6.4
+    assert data[DATA_POWER_FACTOR] == 99.9
+
+
+def test_core_metrics_while_idle():
+    data = {**_CHARGING, DATA_CURRENT_L1: 0.0, DATA_CURRENT_L2: 0.0}
+    data[DATA_CURRENT_L3] = 0.0
+    data[DATA_CHARGING_POWER] = 0
+    DerivedGraph(CORE_METRICS).apply(data)
+
+    assert data[DATA_PHASES_ACTIVE] == 0
+    assert data[DATA_CURRENT] == 0.0
+    assert data[DATA_PHASE_IMBALANCE] is None
+    assert data[DATA_POWER_FACTOR] is None
+
+
+async def test_coordinator_adds_derived_keys(hass, mock_api):
+    entry = MagicMock()
+    entry.options = {}
+    coord = HeidelbergEnergyControlCoordinator(
+        hass=hass,
+        api=mock_api,
+        static_data={DATA_REG_LAYOUT_VER: "1.0.7", DATA_HW_MAX_CURR: 16},
+        entry=entry,
+    )
+    mock_api.async_get_data.return_value = dict(_CHARGING)
+
+    result = await coord._async_update_data()
+
+    assert result[DATA_PHASES_ACTIVE] == 3
+    assert result[DATA_APPARENT_POWER] == 10811.0
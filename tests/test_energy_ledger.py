@@ -0,0 +1,161 @@
+"""Tests for the persistent energy ledger.
+
+Pins:
+  - routine changes are debounced, urgent ones (counter jumps, session
+    edges) are written right away
+  - unchanged values don't schedule a write
+  - flushed records survive a reload
+  - the total energy sensor keeps its tracking values in the ledger and
+    exposes no state attributes
+  - the session tracker resets on plug-in, keeps the last session while
+    unplugged and absorbs counter jumps
+  - attributes of older versions are adopted once from the restore cache
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from pytest_homeassistant_custom_component.common import mock_restore_cache
+
+from homeassistant.core import State
+
+from custom_components.heidelberg_energy_control.classes.heidelberg_sensor_energy_total import (
+    HeidelbergSensorEnergyTotal,
+)
+from custom_components.heidelberg_energy_control.const import (
+    DATA_HW_VERSION,
+    DATA_REG_LAYOUT_VER,
+    DATA_SESSION_ENERGY,
+    DATA_SW_VERSION,
+    DATA_TOTAL_ENERGY,
+)
+from custom_components.heidelberg_energy_control.energy_ledger import (
+    EnergyLedger,
+    SessionEnergyTracker,
+    async_adopt_legacy_attributes,
+)
+
+_STORE_KEY = "heidelberg_energy_control.energy_ledger.abc"
+
+
+def _sensor(cls, key: str, ledger: EnergyLedger):
+    coordinator = MagicMock()
+    coordinator.energy_ledger = ledger
+    coordinator.static_data = {
+        DATA_REG_LAYOUT_VER: "1.0.7",
+        DATA_HW_VERSION: "1",
+        DATA_SW_VERSION: "1",
+    }
+    entry = MagicMock()
+    entry.entry_id = "abc"
+    return cls(coordinator, entry, MagicMock(key=key)), coordinator
+
+
+async def test_routine_changes_wait_urgent_ones_do_not(hass, hass_storage):
+    ledger = EnergyLedger(hass, "abc")
+    await ledger.async_load()
+
+    ledger.async_update(DATA_TOTAL_ENERGY, last_raw_value=1.0)
+    await hass.async_block_till_done()
+    assert _STORE_KEY not in hass_storage
+
+    ledger.async_update(DATA_TOTAL_ENERGY, urgent=True, total_offset=2.0)
+    await asyncio.sleep(0)  # let the zero-delay save timer fire
+    await hass.async_block_till_done()
+    assert hass_storage[_STORE_KEY]["data"]["records"] == {
+        DATA_TOTAL_ENERGY: {"last_raw_value": 1.0, "total_offset": 2.0}
+    }
+
+
+async def test_unchanged_values_do_not_schedule_a_write(hass):
+    ledger = EnergyLedger(hass, "abc")
+    ledger._store = MagicMock()
+
+    ledger.async_update(DATA_TOTAL_ENERGY, last_raw_value=1.0)
+    ledger.async_update(DATA_TOTAL_ENERGY, last_raw_value=1.0)
+    ledger.async_update(DATA_TOTAL_ENERGY, urgent=True, last_raw_value=1.0)
+
+    assert ledger._store.async_delay_save.call_count == 1
+
+
+async def test_flushed_records_survive_a_reload(hass, hass_storage):
+    ledger = EnergyLedger(hass, "abc")
+    ledger.async_update(DATA_SESSION_ENERGY, start_corrected=10.0)
+    await ledger.async_flush()
+
+    reloaded = EnergyLedger(hass, "abc")
+    await reloaded.async_load()
+    assert reloaded.record(DATA_SESSION_ENERGY) == {"start_corrected": 10.0}
+
+
+async def test_sensors_track_through_the_ledger(hass):
+    ledger = EnergyLedger(hass, "abc")
+    total, coordinator = _sensor(HeidelbergSensorEnergyTotal, DATA_TOTAL_ENERGY, ledger)
+
+    coordinator.data = {DATA_TOTAL_ENERGY: 100.0}
+    assert total.native_value == 100.0
+    coordinator.data = {DATA_TOTAL_ENERGY: 5.0}  # counter reset
+    assert total.native_value == 100.0
+    coordinator.data = {DATA_TOTAL_ENERGY: 7.0}
+    assert total.native_value == 102.0
+
+    assert ledger.record(DATA_TOTAL_ENERGY) == {
+        "total_offset": 95.0,
+        "last_raw_value": 7.0,
+    }
+    assert total.extra_state_attributes is None
+
+
+async def test_session_tracker(hass):
+    ledger = EnergyLedger(hass, "abc")
+    ledger._store = MagicMock()
+    tracker = SessionEnergyTracker(ledger)
+
+    assert tracker.update(100.0, False) is None
+    assert tracker.update(100.0, True) == 0.0
+    started = tracker.started
+    assert started is not None
+    assert tracker.update(101.5, True) == 1.5
+    assert tracker.update(2.0, True) == 1.5  # counter reset absorbed
+    assert tracker.update(2.5, True) == 2.0
+    assert tracker.update(2.5, False) == 2.0  # unplugged: last session kept
+    assert tracker.update(3.0, False) == 2.0
+    assert tracker.update(3.0, True) == 0.0  # new session
+    assert ledger.record(DATA_SESSION_ENERGY)["session_energy"] == 0.0
+
+
+async def test_legacy_attributes_are_adopted_once(hass, entity_registry):
+    entity_registry.async_get_or_create(
+        "sensor", "heidelberg_energy_control", f"abc_{DATA_SESSION_ENERGY}",
+        suggested_object_id="session",
+    )
+    mock_restore_cache(
+        hass,
+        [
+            State(
+                "sensor.session",
+                "1.5",
+                {
+                    "_total_offset": 3.0,
+                    "_last_raw_value": 50.0,
+                    "_start_corrected": 51.5,
+                    "_last_is_plugged": "True",
+                },
+            )
+        ],
+    )
+    ledger = EnergyLedger(hass, "abc")
+    ledger._store = MagicMock()
+
+    async_adopt_legacy_attributes(hass, ledger, "abc")
+    tracker = SessionEnergyTracker(ledger)
+
+    assert tracker.update(50.0, True) == 1.5
+    assert ledger.record(DATA_TOTAL_ENERGY) == {}
+
+    # A ledger record wins over stale attributes.
+    ledger.async_update(DATA_SESSION_ENERGY, session_energy=9.0)
+    async_adopt_legacy_attributes(hass, ledger, "abc")
+    assert ledger.record(DATA_SESSION_ENERGY)["session_energy"] == 9.0
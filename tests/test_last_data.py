@@ -0,0 +1,171 @@
+"""Tests for serving the last run's data at startup.
+
+Pins:
+  - the last poll and the virtual state survive an unload/setup cycle
+  - until the first poll after a restart, entities show the restored
+    values, each marked with `restored_at`, and the virtual target is kept
+  - the first live poll clears the marker on every entity
+  - restoring the virtual entities doesn't write to the wallbox, so setup
+    isn't held up by a connect that times out; the first successful poll
+    sends the restored target current instead
+  - timestamps round-trip; values JSON can't hold are left out
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import STATE_UNAVAILABLE
+
+from custom_components.heidelberg_energy_control.const import (
+    ATTR_RESTORED_AT,
+    DOMAIN,
+    VIRTUAL_ENABLE,
+    VIRTUAL_TARGET_CURRENT,
+)
+from custom_components.heidelberg_energy_control.last_data import (
+    LastDataStore,
+    serialize,
+)
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+
+async def test_restart_serves_the_last_data(hass):
+    client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+    reachable_connect = client.connect
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "last-data", "port": 502, "device_id": 1},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.heidelberg_energy_control.core.connection.AsyncModbusTcpClient",
+        return_value=client,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        await entry.runtime_data.async_handle_number_set(VIRTUAL_TARGET_CURRENT, 9.0)
+        live = dict(entry.runtime_data.data)
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+        gate = asyncio.Event()
+
+        async def _slow_connect() -> bool:
+            await gate.wait()
+            return await reachable_connect()
+
+        client.connect = AsyncMock(side_effect=_slow_connect)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = entry.runtime_data
+        assert coordinator.restored_at is not None
+        assert coordinator.target_current == 9.0
+        states = hass.states.async_all("sensor")
+        assert states
+        assert all(ATTR_RESTORED_AT in state.attributes for state in states)
+        for key, value in live.items():
+            if isinstance(value, (bool, int, float, str)):
+                assert coordinator.data[key] == value
+
+        gate.set()
+        # Not wait_background_tasks: the keep-alive loop runs until unload.
+        async with asyncio.timeout(10):
+            while coordinator.restored_at is not None:
+                await asyncio.sleep(0.01)
+        await hass.async_block_till_done()
+
+        assert coordinator.restored_at is None
+        assert all(
+            ATTR_RESTORED_AT not in state.attributes
+            and state.state != STATE_UNAVAILABLE
+            for state in hass.states.async_all("sensor")
+        )
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_restored_virtual_state_waits_for_the_first_poll(hass):
+    client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+    reachable_connect = client.connect
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "timing-out", "port": 502, "device_id": 1},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.heidelberg_energy_control.core.connection.AsyncModbusTcpClient",
+        return_value=client,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        await entry.runtime_data.async_handle_number_set(VIRTUAL_TARGET_CURRENT, 9.0)
+        assert entry.runtime_data.logic_enabled
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+        # Connecting fails only once the client timeout runs out.
+        timed_out = asyncio.Event()
+
+        async def _timing_out_connect() -> bool:
+            await timed_out.wait()
+            return False
+
+        client.connect = AsyncMock(side_effect=_timing_out_connect)
+        client.close()
+        client.write_register.reset_mock()
+        async with asyncio.timeout(5):
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+
+        coordinator = entry.runtime_data
+        client.write_register.assert_not_called()
+        assert coordinator.last_update_success
+        assert coordinator.target_current == 9.0
+        assert coordinator.logic_enabled
+        assert all(
+            state.state != STATE_UNAVAILABLE for state in hass.states.async_all("number")
+        )
+
+        timed_out.set()
+        async with asyncio.timeout(5):
+            while coordinator.last_update_success:
+                await asyncio.sleep(0.01)
+        client.write_register.assert_not_called()
+
+        client.connect = reachable_connect
+        with patch.object(hass.config_entries, "async_schedule_reload"):
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+
+        assert coordinator.last_update_success
+        client.write_register.assert_awaited_once_with(address=261, value=90, device_id=1)
+        assert coordinator.data[VIRTUAL_TARGET_CURRENT] == 9.0
+        assert coordinator.logic_enabled
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_record_round_trip(hass):
+    started = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    store = LastDataStore(hass, "round-trip")
+    store.async_schedule_save(
+        lambda: serialize(
+            {"a": 1.5, "b": True, "started": started, "odd": object()},
+            {VIRTUAL_ENABLE: True},
+            started,
+        )
+    )
+    await store.async_flush()
+
+    loaded = LastDataStore(hass, "round-trip")
+    await loaded.async_load()
+    assert loaded.data == {"a": 1.5, "b": True, "started": started}
+    assert loaded.saved_at == started
+    assert loaded.virtual_state(VIRTUAL_ENABLE) is True
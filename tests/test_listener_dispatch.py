@@ -0,0 +1,144 @@
+"""Tests for change-aware listener dispatch.
+
+Pins:
+  - a listener is only called when one of its context keys changed
+  - an unchanged update calls no keyed listener at all
+  - the first dispatch, availability flips and context-less listeners
+    notify everyone
+  - in-place edits of coordinator data (write handlers) are detected
+  - after a poll, the API's changed keys pick the listeners; keys the
+    coordinator sets itself and keys that disappear are still caught
+  - entities subscribe with their own key
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.heidelberg_energy_control.classes.heidelberg_sensor import (
+    HeidelbergSensor,
+)
+from custom_components.heidelberg_energy_control.const import (
+    COMMAND_STANDBY,
+    COMMAND_TARGET_CURRENT,
+    DATA_CHARGING_POWER,
+    DATA_HW_MAX_CURR,
+    DATA_HW_VERSION,
+    DATA_REG_LAYOUT_VER,
+    DATA_SW_VERSION,
+    DATA_TOTAL_ENERGY,
+    VIRTUAL_ENABLE,
+)
+from custom_components.heidelberg_energy_control.coordinator import (
+    HeidelbergEnergyControlCoordinator,
+)
+
+
+def _make_coordinator(hass, mock_api) -> HeidelbergEnergyControlCoordinator:
+    entry = MagicMock()
+    entry.options = {}
+    static_data = {
+        DATA_REG_LAYOUT_VER: "1.0.7",
+        DATA_HW_MAX_CURR: 16,
+        DATA_HW_VERSION: "1",
+        DATA_SW_VERSION: "1",
+    }
+    return HeidelbergEnergyControlCoordinator(
+        hass=hass, api=mock_api, static_data=static_data, entry=entry
+    )
+
+
+def _listen(coord, context) -> list[int]:
+    calls: list[int] = []
+    coord.async_add_listener(lambda: calls.append(1), context)
+    return calls
+
+
+async def test_only_listeners_of_changed_keys_are_notified(hass, mock_api):
+    coord = _make_coordinator(hass, mock_api)
+    power = _listen(coord, frozenset({DATA_CHARGING_POWER}))
+    energy = _listen(coord, frozenset({DATA_TOTAL_ENERGY}))
+
+    coord.async_set_updated_data({DATA_CHARGING_POWER: 0, DATA_TOTAL_ENERGY: 1.0})
+    assert (len(power), len(energy)) == (1, 1)  # first dispatch: everyone
+
+    coord.async_set_updated_data({DATA_CHARGING_POWER: 0, DATA_TOTAL_ENERGY: 1.0})
+    assert (len(power), len(energy)) == (1, 1)
+    assert coord.changed_keys == frozenset()
+
+    coord.async_set_updated_data({DATA_CHARGING_POWER: 3700, DATA_TOTAL_ENERGY: 1.0})
+    assert (len(power), len(energy)) == (2, 1)
+    assert coord.changed_keys == {DATA_CHARGING_POWER}
+    await coord.async_shutdown()
+
+
+async def test_availability_flip_and_unkeyed_listeners_notify(hass, mock_api):
+    coord = _make_coordinator(hass, mock_api)
+    keyed = _listen(coord, frozenset({DATA_CHARGING_POWER}))
+    unkeyed = _listen(coord, None)
+    data = {DATA_CHARGING_POWER: 0}
+
+    coord.async_set_updated_data(dict(data))
+    coord.async_set_updated_data(dict(data))
+    assert (len(keyed), len(unkeyed)) == (1, 2)
+
+    coord.async_set_update_error(Exception("gateway gone"))
+    assert (len(keyed), len(unkeyed)) == (2, 3)
+
+    coord.async_set_updated_data(dict(data))  # recovered, same values
+    assert (len(keyed), len(unkeyed)) == (3, 4)
+    await coord.async_shutdown()
+
+
+async def test_in_place_edit_is_detected(hass, mock_api):
+    coord = _make_coordinator(hass, mock_api)
+    power = _listen(coord, frozenset({DATA_CHARGING_POWER}))
+    coord.async_set_updated_data({DATA_CHARGING_POWER: 0})
+
+    coord.data[DATA_CHARGING_POWER] = 11000
+    coord.async_set_updated_data(coord.data)
+
+    assert len(power) == 2
+    await coord.async_shutdown()
+
+
+async def test_poll_dispatch_uses_the_api_change_set(hass, mock_api):
+    coord = _make_coordinator(hass, mock_api)
+    mock_api.async_get_data.return_value = {
+        COMMAND_TARGET_CURRENT: 0,
+        DATA_CHARGING_POWER: 0,
+        DATA_TOTAL_ENERGY: 1.0,
+        COMMAND_STANDBY: False,
+    }
+    await coord.async_refresh()
+    power = _listen(coord, frozenset({DATA_CHARGING_POWER}))
+    energy = _listen(coord, frozenset({DATA_TOTAL_ENERGY}))
+    enable = _listen(coord, frozenset({VIRTUAL_ENABLE}))
+    standby = _listen(coord, frozenset({COMMAND_STANDBY}))
+
+    # Only what the API reports is compared: the energy value differs
+    # from the last dispatch but the register diff says it didn't change.
+    mock_api.changed_keys = frozenset({DATA_CHARGING_POWER})
+    mock_api.async_get_data.return_value = {
+        COMMAND_TARGET_CURRENT: 160,
+        DATA_CHARGING_POWER: 3700,
+        DATA_TOTAL_ENERGY: 2.0,
+    }
+    await coord.async_refresh()
+
+    assert coord.changed_keys >= {DATA_CHARGING_POWER, VIRTUAL_ENABLE}
+    assert DATA_TOTAL_ENERGY not in coord.changed_keys
+    # A quarantined capability's keys disappear from the data.
+    assert COMMAND_STANDBY in coord.changed_keys
+    assert (len(power), len(energy), len(enable), len(standby)) == (1, 0, 1, 1)
+    await coord.async_shutdown()
+
+
+async def test_entities_subscribe_to_their_key(hass, mock_api):
+    coord = _make_coordinator(hass, mock_api)
+    entry = MagicMock()
+    entry.entry_id = "abc"
+
+    power = HeidelbergSensor(coord, entry, MagicMock(key=DATA_CHARGING_POWER))
+
+    assert power.coordinator_context == {DATA_CHARGING_POWER}
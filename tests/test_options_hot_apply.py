@@ -0,0 +1,74 @@
+"""Tests for applying options without a reload.
+
+Pins:
+  - an options change keeps the entry, its API and the virtual state
+    loaded: no reconnect, no re-probe
+  - scan interval, tier cadences and pipelining take effect at once
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_SCAN_INTERVAL
+
+from custom_components.heidelberg_energy_control.const import (
+    CONF_MEDIUM_TIER_INTERVAL,
+    CONF_PIPELINED,
+    CONF_SLOW_TIER_INTERVAL,
+    DOMAIN,
+)
+from custom_components.heidelberg_energy_control.core.registers import PollTier
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+
+async def test_options_apply_live(hass):
+    client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "hot-apply", "port": 502, "device_id": 1},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.heidelberg_energy_control.core.connection.AsyncModbusTcpClient",
+        return_value=client,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = entry.runtime_data
+        api = coordinator.api
+        coordinator.target_current = 12.0
+        connects = client.connect.await_count
+
+        with patch.object(hass.config_entries, "async_reload") as reload:
+            hass.config_entries.async_update_entry(
+                entry,
+                options={
+                    CONF_SCAN_INTERVAL: 5,
+                    CONF_MEDIUM_TIER_INTERVAL: 20,
+                    CONF_SLOW_TIER_INTERVAL: 600,
+                    CONF_PIPELINED: True,
+                },
+            )
+            await hass.async_block_till_done()
+
+        reload.assert_not_called()
+        assert entry.runtime_data is coordinator
+        assert coordinator.api is api
+        assert coordinator.target_current == 12.0
+        assert client.connect.await_count == connects
+        assert coordinator.update_interval == timedelta(seconds=5)
+        assert coordinator._tier_intervals[PollTier.MEDIUM] == 20
+        assert coordinator._tier_intervals[PollTier.SLOW] == 600
+        assert api.pipelined
+
+        hass.config_entries.async_update_entry(entry, options={CONF_PIPELINED: False})
+        await hass.async_block_till_done()
+        assert not api.pipelined
+        assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,207 @@
+"""Tests for opt-in pipelined Modbus TCP block reads.
+
+Pins:
+  - the pipeline sends every request before reading replies and decodes
+    them in block order; exception responses map to None
+  - a reply out of send order, a truncated frame or an MBAP length out
+    of range raises PipelineError and closes the pipeline socket
+  - in pipelined mode the API reads a multi-block poll in one pipeline
+    exchange, without serial client reads
+  - a PipelineError permanently falls back to serial reads, for every
+    API on the gateway
+  - a rejected gap-bridging block in a pipelined poll is re-read
+    serially; on "illegal data address" it is split and its gap
+    addresses are learned as unreadable
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.pipeline import (
+    ModbusTcpPipeline,
+    PipelineError,
+)
+from custom_components.heidelberg_energy_control.core.registers import (
+    RegisterBlock,
+    RegisterDefinition,
+    RegisterType,
+)
+
+INPUT_BLOCK = RegisterBlock(RegisterType.INPUT, 5, 2)
+HOLDING_BLOCK = RegisterBlock(RegisterType.HOLDING, 259, 1)
+
+
+def _reply(tid: int, fc: int, registers: list[int]) -> bytes:
+    pdu = bytes([fc, 2 * len(registers)]) + struct.pack(
+        f">{len(registers)}H", *registers
+    )
+    return struct.pack(">HHHB", tid, 0, len(pdu) + 1, 1) + pdu
+
+
+def _exception_reply(tid: int, fc: int) -> bytes:
+    pdu = bytes([fc | 0x80, 0x02])
+    return struct.pack(">HHHB", tid, 0, len(pdu) + 1, 1) + pdu
+
+
+def _pipeline_with_stream(data: bytes) -> tuple[ModbusTcpPipeline, MagicMock]:
+    pipeline = ModbusTcpPipeline("x", 502, timeout=1)
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    writer = MagicMock()
+    writer.is_closing = MagicMock(return_value=False)
+    writer.drain = AsyncMock()
+    pipeline._reader = reader
+    pipeline._writer = writer
+    return pipeline, writer
+
+
+# ---------- pipeline transport ----------
+
+
+async def test_pipeline_sends_all_requests_then_decodes_replies_in_order():
+    pipeline, writer = _pipeline_with_stream(
+        _reply(1, 0x04, [6, 160]) + _exception_reply(2, 0x03)
+    )
+
+    replies = await pipeline.async_read_blocks(1, [INPUT_BLOCK, HOLDING_BLOCK])
+
+    assert replies == [[6, 160], None]
+    # Both requests go out in a single write, before any reply is read.
+    writer.write.assert_called_once()
+    assert len(writer.write.call_args.args[0]) == 2 * 12
+
+
+async def test_pipeline_out_of_order_reply_raises_and_closes():
+    pipeline, writer = _pipeline_with_stream(
+        _reply(2, 0x03, [1]) + _reply(1, 0x04, [6, 160])
+    )
+
+    with pytest.raises(PipelineError):
+        await pipeline.async_read_blocks(1, [INPUT_BLOCK, HOLDING_BLOCK])
+
+    writer.close.assert_called_once()
+    assert not pipeline.connected
+
+
+async def test_pipeline_truncated_reply_raises():
+    pipeline, _ = _pipeline_with_stream(_reply(1, 0x04, [6]))
+
+    with pytest.raises(PipelineError):
+        await pipeline.async_read_blocks(1, [INPUT_BLOCK])
+
+
+@pytest.mark.parametrize("length", [0, 1, 255, 0xFFFF])
+async def test_pipeline_invalid_mbap_length_raises_and_closes(length):
+    header = struct.pack(">HHHB", 1, 0, length, 1)
+    pipeline, writer = _pipeline_with_stream(header + bytes([0x04, 2, 0, 6]))
+
+    with pytest.raises(PipelineError):
+        await pipeline.async_read_blocks(1, [INPUT_BLOCK])
+
+    writer.close.assert_called_once()
+
+
+# ---------- API integration ----------
+
+
+def _pipelined_api() -> tuple[HeidelbergEnergyControlAPI, MagicMock, MagicMock]:
+    api = HeidelbergEnergyControlAPI(
+        host="x", port=502, device_id=1, max_gap=1, pipelined=True
+    )
+    client = MagicMock()
+    client.connected = True
+    client.connect = AsyncMock(return_value=True)
+    client.read_input_registers = AsyncMock()
+    client.read_holding_registers = AsyncMock()
+    api._client = client
+    pipeline = MagicMock()
+    pipeline.async_read_blocks = AsyncMock()
+    api._connection.pipeline = pipeline
+    return api, client, pipeline
+
+
+def _ok(registers: list[int]) -> MagicMock:
+    rr = MagicMock()
+    rr.isError = MagicMock(return_value=False)
+    rr.registers = registers
+    return rr
+
+
+DEFINITIONS = [
+    RegisterDefinition(5, 2, RegisterType.INPUT),
+    RegisterDefinition(259, 1, RegisterType.HOLDING),
+    RegisterDefinition(261, 1, RegisterType.HOLDING),
+]
+
+
+async def test_pipelined_poll_reads_all_blocks_in_one_exchange():
+    api, client, pipeline = _pipelined_api()
+    pipeline.async_read_blocks.return_value = [[1, 999, 160], [6, 160]]
+
+    result = await api.async_read_registers(DEFINITIONS)
+
+    assert result == {5: 6, 6: 160, 259: 1, 261: 160}
+    pipeline.async_read_blocks.assert_awaited_once_with(
+        1,
+        [
+            RegisterBlock(RegisterType.HOLDING, 259, 3, gaps=(260,)),
+            RegisterBlock(RegisterType.INPUT, 5, 2),
+        ],
+    )
+    client.read_input_registers.assert_not_awaited()
+    client.read_holding_registers.assert_not_awaited()
+
+
+async def test_pipeline_error_falls_back_to_serial_for_good():
+    api, client, pipeline = _pipelined_api()
+    pipeline.async_read_blocks.side_effect = PipelineError("dropped frame")
+    client.read_holding_registers.return_value = _ok([1, 999, 160])
+    client.read_input_registers.return_value = _ok([6, 160])
+
+    result = await api.async_read_registers(DEFINITIONS)
+
+    assert result == {5: 6, 6: 160, 259: 1, 261: 160}
+    assert api.pipelined is False
+    pipeline.close.assert_called_once()
+
+    await api.async_read_registers(DEFINITIONS)
+    pipeline.async_read_blocks.assert_awaited_once()
+
+
+async def test_pipeline_drop_reaches_sibling_apis():
+    api, client, pipeline = _pipelined_api()
+    sibling = HeidelbergEnergyControlAPI(
+        host="x", port=502, device_id=2, pipelined=True
+    )
+    assert sibling.pipelined is True
+    pipeline.async_read_blocks.side_effect = PipelineError("dropped frame")
+    client.read_holding_registers.return_value = _ok([1, 999, 160])
+    client.read_input_registers.return_value = _ok([6, 160])
+
+    await api.async_read_registers(DEFINITIONS)
+
+    assert sibling.pipelined is False
+    await sibling.disconnect()
+
+
+async def test_pipelined_rejected_gap_block_is_split_serially():
+    api, client, pipeline = _pipelined_api()
+    pipeline.async_read_blocks.return_value = [None, [6, 160]]
+    rejected = MagicMock()
+    rejected.isError = MagicMock(return_value=True)
+    rejected.exception_code = 0x02
+    client.read_holding_registers.side_effect = [rejected, _ok([1]), _ok([160])]
+
+    result = await api.async_read_registers(DEFINITIONS)
+
+    assert result == {5: 6, 6: 160, 259: 1, 261: 160}
+    assert (RegisterType.HOLDING, 260) in api.unreadable_addresses
+    assert api.pipelined is True
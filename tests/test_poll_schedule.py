@@ -0,0 +1,45 @@
+"""Tests for the adaptive poll interval.
+
+Pins:
+  - idle (no car) polls at the idle interval, anything else at the scan
+    interval; the idle interval never polls faster than the scan interval
+  - a state change starts a burst of fast polls; the first poll doesn't
+  - no interval exceeds the watchdog window over WATCHDOG_HEADROOM
+"""
+
+from __future__ import annotations
+
+from custom_components.heidelberg_energy_control.core.poll_schedule import (
+    BURST_INTERVAL,
+    BURST_POLLS,
+    WATCHDOG_HEADROOM,
+    AdaptivePollInterval,
+)
+
+
+def test_interval_follows_idle_state():
+    schedule = AdaptivePollInterval(scan_interval=10, idle_interval=60)
+    assert schedule.next_interval("A", idle=True) == 60
+    assert schedule.next_interval(None, idle=False) == 10
+
+    assert AdaptivePollInterval(10, 5).next_interval("A", idle=True) == 10
+
+
+def test_state_change_starts_a_burst():
+    schedule = AdaptivePollInterval(scan_interval=10, idle_interval=60)
+    assert schedule.next_interval("A", idle=True) == 60
+
+    intervals = [schedule.next_interval("B", idle=False) for _ in range(BURST_POLLS)]
+    assert intervals == [BURST_INTERVAL] * BURST_POLLS
+    assert schedule.next_interval("B", idle=False) == 10
+    # An unknown state isn't a transition.
+    assert schedule.next_interval(None, idle=False) == 10
+    assert schedule.next_interval("B", idle=False) == 10
+
+
+def test_watchdog_caps_every_interval():
+    schedule = AdaptivePollInterval(scan_interval=10, idle_interval=60)
+    assert schedule.next_interval("A", idle=True, watchdog_timeout=30) == (
+        30 / WATCHDOG_HEADROOM
+    )
+    assert schedule.next_interval("A", idle=True, watchdog_timeout=0) == 60
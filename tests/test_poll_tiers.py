@@ -0,0 +1,167 @@
+"""Tests for multi-rate polling tiers.
+
+Pins:
+  - definitions inherit their capability's tier unless they set their own
+  - the API reads only the due tiers' blocks, but adds tiers it has never
+    read so every capability can decode
+  - values of tiers that aren't due come from the register image
+  - tiers due together merge into shared block reads
+  - a write shows up on the next poll, even if its tier isn't due
+  - the coordinator runs each tier on its own cadence (with half a scan
+    interval of slack) and passes the due tiers to the API
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.heidelberg_energy_control.const import (
+    COMMAND_REMOTE_LOCK,
+    COMMAND_TARGET_CURRENT,
+    DATA_HW_MAX_CURR,
+    DATA_REG_LAYOUT_VER,
+    DATA_TOTAL_ENERGY,
+)
+from custom_components.heidelberg_energy_control.coordinator import (
+    HeidelbergEnergyControlCoordinator,
+)
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.capabilities import (
+    CoreCapability,
+    WatchdogCapability,
+)
+from custom_components.heidelberg_energy_control.core.registers import PollTier
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+
+def _read_calls(client) -> list[tuple[str, int, int]]:
+    calls = [
+        ("input", c.kwargs["address"], c.kwargs["count"])
+        for c in client.read_input_registers.await_args_list
+    ]
+    calls += [
+        ("holding", c.kwargs["address"], c.kwargs["count"])
+        for c in client.read_holding_registers.await_args_list
+    ]
+    return calls
+
+
+async def _api_after_setup() -> tuple[HeidelbergEnergyControlAPI, MagicMock]:
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1, max_gap=0)
+    client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    api._client = client
+    await api.async_get_static_data()
+    client.read_input_registers.reset_mock()
+    client.read_holding_registers.reset_mock()
+    return api, client
+
+
+def test_definitions_inherit_capability_tier():
+    watchdog = WatchdogCapability()
+    core = CoreCapability()
+
+    assert {watchdog.tier_of(d) for d in watchdog.polled_definitions} == {
+        PollTier.SLOW
+    }
+    assert [core.tier_of(d) for d in core.polled_definitions] == [
+        PollTier.FAST,
+        PollTier.MEDIUM,
+        PollTier.SLOW,
+        PollTier.FAST,
+    ]
+
+
+async def test_first_poll_reads_every_tier_even_if_only_fast_requested():
+    api, client = await _api_after_setup()
+
+    await api.async_get_data(tiers={PollTier.FAST})
+
+    assert sorted(_read_calls(client)) == [
+        ("holding", 259, 1),
+        ("holding", 261, 1),
+        ("input", 5, 14),
+    ]
+
+
+async def test_fast_only_poll_reads_fast_blocks_and_reuses_image():
+    api, client = await _api_after_setup()
+    full = await api.async_get_data()
+    client.read_input_registers.reset_mock()
+    client.read_holding_registers.reset_mock()
+
+    data = await api.async_get_data(tiers={PollTier.FAST})
+
+    assert sorted(_read_calls(client)) == [("holding", 261, 1), ("input", 5, 10)]
+    # Energy and remote lock come from the register image.
+    assert data[DATA_TOTAL_ENERGY] == full[DATA_TOTAL_ENERGY]
+    assert data[COMMAND_REMOTE_LOCK] == full[COMMAND_REMOTE_LOCK]
+    assert data == full
+
+
+async def test_write_to_slow_tier_register_shows_on_next_fast_poll():
+    api, client = await _api_after_setup()
+    full = await api.async_get_data()
+
+    # The fixture's remote lock register holds 1.
+    await api.async_write_command(COMMAND_REMOTE_LOCK, 0)
+    client.read_holding_registers.reset_mock()
+    data = await api.async_get_data(tiers={PollTier.FAST})
+
+    assert ("holding", 259, 1) not in _read_calls(client)
+    assert data[COMMAND_REMOTE_LOCK] != full[COMMAND_REMOTE_LOCK]
+    assert COMMAND_REMOTE_LOCK in api.changed_keys
+
+
+async def test_tiers_due_together_share_one_block_read():
+    api, client = await _api_after_setup()
+    await api.async_get_data()
+    client.read_input_registers.reset_mock()
+
+    await api.async_get_data(tiers={PollTier.FAST, PollTier.MEDIUM})
+
+    assert [c for c in _read_calls(client) if c[0] == "input"] == [("input", 5, 14)]
+
+
+# ---------- coordinator cadence ----------
+
+
+def _make_coordinator(hass, mock_api) -> HeidelbergEnergyControlCoordinator:
+    entry = MagicMock()
+    entry.options = {
+        "scan_interval": 10,
+        "medium_tier_interval": 30,
+        "slow_tier_interval": 300,
+    }
+    return HeidelbergEnergyControlCoordinator(
+        hass=hass,
+        api=mock_api,
+        static_data={DATA_REG_LAYOUT_VER: "1.0.8", DATA_HW_MAX_CURR: 16},
+        entry=entry,
+    )
+
+
+async def test_coordinator_tier_cadence(hass, mock_api):
+    coord = _make_coordinator(hass, mock_api)
+
+    assert coord._due_tiers(1000.0) == set(PollTier)
+    coord._tier_last_poll = {tier: 1000.0 for tier in PollTier}
+
+    assert coord._due_tiers(1010.0) == {PollTier.FAST}
+    assert coord._due_tiers(1020.0) == {PollTier.FAST}
+    # Third poll after the medium read: 30 s minus half a scan interval of slack.
+    assert coord._due_tiers(1030.0) == {PollTier.FAST, PollTier.MEDIUM}
+    assert coord._due_tiers(1300.0) == set(PollTier)
+
+
+async def test_coordinator_passes_due_tiers_to_api(hass, mock_api):
+    coord = _make_coordinator(hass, mock_api)
+    mock_api.async_get_data.return_value = {COMMAND_TARGET_CURRENT: 0}
+
+    await coord._async_update_data()
+    assert mock_api.async_get_data.await_args.kwargs["tiers"] == set(PollTier)
+
+    await coord._async_update_data()
+    assert mock_api.async_get_data.await_args.kwargs["tiers"] == {PollTier.FAST}
@@ -0,0 +1,124 @@
+"""Tests for the precompiled poll read plan.
+
+Pins:
+  - the plan merges every loaded capability's polled definitions
+  - the slice map locates each capability's definitions inside the blocks
+  - the plan is compiled once at setup and reused across polls
+  - learning an unreadable address invalidates and recompiles the plan
+  - `describe()` gives a JSON-friendly view of blocks and slices
+"""
+
+from __future__ import annotations
+
+import json
+
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.capabilities import (
+    CoreCapability,
+    StandbyCapability,
+    WatchdogCapability,
+)
+from custom_components.heidelberg_energy_control.core.read_plan import (
+    BlockSlice,
+    ReadPlan,
+)
+from custom_components.heidelberg_energy_control.core.registers import (
+    RegisterBlock,
+    RegisterType,
+)
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+
+def _all_capabilities():
+    return [CoreCapability(), StandbyCapability(), WatchdogCapability()]
+
+
+def test_compile_merges_holding_registers_across_capabilities():
+    """257, 258, 259, 261, 262 collapse into one holding read with max_gap=1."""
+    plan = ReadPlan.compile(_all_capabilities(), max_gap=1)
+
+    assert plan.blocks == (
+        RegisterBlock(RegisterType.HOLDING, 257, 6, gaps=(260,)),
+        RegisterBlock(RegisterType.INPUT, 5, 14),
+    )
+    assert plan.transaction_count == 2
+
+
+def test_slice_map_locates_each_capability_definition():
+    plan = ReadPlan.compile(_all_capabilities(), max_gap=1)
+
+    assert plan.slices["core"] == (
+        BlockSlice(block=1, offset=0, count=10),
+        BlockSlice(block=1, offset=10, count=4),
+        BlockSlice(block=0, offset=2, count=1),
+        BlockSlice(block=0, offset=4, count=1),
+    )
+    assert plan.slices["standby"] == (BlockSlice(block=0, offset=1, count=1),)
+    assert plan.slices["watchdog"] == (
+        BlockSlice(block=0, offset=0, count=1),
+        BlockSlice(block=0, offset=5, count=1),
+    )
+
+
+def test_unreadable_address_splits_the_plan():
+    plan = ReadPlan.compile(
+        _all_capabilities(), max_gap=1, unreadable={(RegisterType.HOLDING, 260)}
+    )
+
+    holding = [b for b in plan.blocks if b.type == RegisterType.HOLDING]
+    assert holding == [
+        RegisterBlock(RegisterType.HOLDING, 257, 3),
+        RegisterBlock(RegisterType.HOLDING, 261, 2),
+    ]
+
+
+def test_describe_is_json_serializable():
+    plan = ReadPlan.compile(_all_capabilities(), max_gap=1)
+
+    summary = json.loads(json.dumps(plan.describe()))
+
+    assert summary["transactions"] == 2
+    assert summary["blocks"][0] == {
+        "type": "holding",
+        "address": 257,
+        "count": 6,
+        "gaps": [260],
+    }
+    assert summary["capabilities"]["standby"] == [
+        {"block": 0, "offset": 1, "count": 1}
+    ]
+
+
+async def test_plan_is_compiled_once_and_reused_across_polls():
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    api._client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+
+    await api.async_get_static_data()
+    # The first poll may still learn unreadable gap words (260 on this fixture).
+    await api.async_get_data()
+    plan = api.read_plan
+    await api.async_get_data()
+    await api.async_get_data()
+
+    assert api.read_plan is plan
+
+
+async def test_learning_unreadable_address_recompiles_plan():
+    """The v1.0.7 fixture rejects the bridged 259..261 read; the plan adapts."""
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1, max_gap=1)
+    client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    api._client = client
+
+    await api.async_get_static_data()
+    assert RegisterBlock(RegisterType.HOLDING, 259, 3, gaps=(260,)) in (
+        api.read_plan.blocks
+    )
+
+    await api.async_get_data()
+
+    assert (RegisterType.HOLDING, 260) in api.unreadable_addresses
+    assert RegisterBlock(RegisterType.HOLDING, 259, 1) in api.read_plan.blocks
+    assert RegisterBlock(RegisterType.HOLDING, 261, 1) in api.read_plan.blocks
@@ -0,0 +1,161 @@
+"""Tests for the register-word diff fast path in async_get_data.
+
+Pins:
+  - the first poll decodes everything and reports every key as changed
+  - an idle poll (every block word-identical) decodes nothing, reports no
+    changed keys and still returns the full data dict
+  - a changed word only re-decodes the capabilities whose blocks moved,
+    and changed_keys lists exactly the keys whose values differ
+  - alternating tier sets (each with its own block layout) never hide a
+    change behind a decode cached under a different plan
+  - a word stored by a poll that then failed still counts as changed
+  - the returned dict is a fresh object each poll, so callers mutating
+    it can't corrupt the cached decodes
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.heidelberg_energy_control.const import (
+    COMMAND_STANDBY,
+    COMMAND_TARGET_CURRENT,
+    DATA_CHARGING_POWER,
+    DATA_IS_CHARGING,
+    DATA_TOTAL_ENERGY,
+)
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.registers import PollTier
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+
+async def _api() -> tuple[HeidelbergEnergyControlAPI, MagicMock, dict]:
+    fixture = load_fixture("wallbox_v1_0_7")
+    fixture["input_5_18_data"] = list(fixture["input_5_18_data"])
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1, max_gap=0)
+    client = build_mock_modbus_client(fixture)
+    api._client = client
+    await api.async_get_static_data()
+    return api, client, fixture
+
+
+def _caps(api):
+    return {cap.key: cap for cap in api.capabilities}
+
+
+async def test_first_poll_reports_every_key_changed():
+    api, _, _ = await _api()
+
+    data = await api.async_get_data()
+
+    assert api.changed_keys == frozenset(data)
+
+
+async def test_idle_poll_skips_decoding_and_reports_no_changes():
+    api, _, _ = await _api()
+    first = await api.async_get_data()
+    core = _caps(api)["core"]
+
+    with patch.object(core, "decode_polled", wraps=core.decode_polled) as spy:
+        second = await api.async_get_data()
+
+    spy.assert_not_called()
+    assert api.changed_keys == frozenset()
+    assert second == first
+    assert second is not first
+
+
+async def test_changed_word_redecodes_only_affected_capability():
+    api, _, fixture = await _api()
+    await api.async_get_data()
+    # Charging power lives at register 14 (index 9 of the 5..18 block).
+    fixture["input_5_18_data"][9] = 0
+    core = _caps(api)["core"]
+
+    with patch.object(core, "decode_polled", wraps=core.decode_polled) as spy:
+        data = await api.async_get_data()
+
+    spy.assert_called_once()
+    assert data[DATA_CHARGING_POWER] == 0
+    assert api.changed_keys == {DATA_CHARGING_POWER, DATA_IS_CHARGING}
+
+
+async def test_alternating_tier_sets_never_report_stale_values():
+    """Fast-only and fast+medium plan different blocks over the same words."""
+    api, _, fixture = await _api()
+    await api.async_get_data()
+    initial = fixture["input_5_18_data"][9]
+    fast = {PollTier.FAST}
+    await api.async_get_data(fast)
+
+    fixture["input_5_18_data"][9] = 0
+    data = await api.async_get_data({PollTier.FAST, PollTier.MEDIUM})
+    assert data[DATA_CHARGING_POWER] == 0
+    assert DATA_CHARGING_POWER in api.changed_keys
+
+    fixture["input_5_18_data"][9] = initial
+    data = await api.async_get_data(fast)
+    assert data[DATA_CHARGING_POWER] == initial
+    assert DATA_CHARGING_POWER in api.changed_keys
+
+    data = await api.async_get_data({PollTier.FAST, PollTier.MEDIUM})
+    assert data[DATA_CHARGING_POWER] == initial
+    assert api.changed_keys == frozenset()
+
+
+async def test_change_read_by_a_failed_poll_is_decoded_next_time():
+    """Even when the next poll doesn't read the changed words again."""
+    api, _, fixture = await _api()
+    before = await api.async_get_data()
+    # Total energy's low word is register 18 (index 13), a medium-tier word.
+    fixture["input_5_18_data"][13] += 1000
+    core = _caps(api)["core"]
+
+    with (
+        patch.object(core, "decode_polled", side_effect=KeyError(18)),
+        pytest.raises(KeyError),
+    ):
+        await api.async_get_data()
+    data = await api.async_get_data({PollTier.FAST})
+
+    assert data[DATA_TOTAL_ENERGY] == before[DATA_TOTAL_ENERGY] + 1
+    assert DATA_TOTAL_ENERGY in api.changed_keys
+
+
+async def test_unchanged_capability_reuses_decode_when_another_changes():
+    """Standby's holding block is untouched when only the target current moves."""
+    fixture = load_fixture("wallbox_v1_0_7")
+    fixture["input_4_layout"] = [0x108]
+    client = build_mock_modbus_client(fixture)
+    # Layout 1.0.8 without the watchdog registers: only standby loads.
+    holding = {258: 0, 259: 1, 261: 160}
+
+    async def _read_holding(address, count, device_id):
+        rr = MagicMock()
+        words = [holding.get(a) for a in range(address, address + count)]
+        rr.isError = MagicMock(return_value=None in words)
+        rr.registers = words
+        return rr
+
+    client.read_holding_registers.side_effect = _read_holding
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1, max_gap=0)
+    api._client = client
+    await api.async_get_static_data()
+    assert "standby" in _caps(api)
+    await api.async_get_data()
+
+    holding[261] = 100
+    standby = _caps(api)["standby"]
+    with patch.object(
+        standby, "decode_polled", wraps=standby.decode_polled
+    ) as spy:
+        data = await api.async_get_data()
+
+    spy.assert_not_called()
+    assert data[COMMAND_STANDBY] is True
+    assert api.changed_keys == {COMMAND_TARGET_CURRENT}
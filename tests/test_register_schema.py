@@ -0,0 +1,140 @@
+"""Tests for the declarative register schema compiler.
+
+Pins:
+  - each field kind decodes as declared: scale, signedness, 32-bit
+    high-word-first, enum with and without default, boolean tests,
+    several keys from one register
+  - definitions are one per contiguous same-type, same-tier run, in
+    declaration order
+  - compiled schemas are cached per schema
+  - inconsistent schemas are rejected
+  - writable fields encode back to wire words; a schema capability
+    gets supports_write / async_write for free, FC16 for 32-bit values
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.heidelberg_energy_control.core.capabilities import Capability
+from custom_components.heidelberg_energy_control.core.exceptions import (
+    HeidelbergEnergyControlWriteError,
+)
+from custom_components.heidelberg_energy_control.core.registers import (
+    PollTier,
+    RegisterDefinition,
+    RegisterType,
+)
+from custom_components.heidelberg_energy_control.core.schema import (
+    RegisterField,
+    compile_schema,
+)
+
+HOLDING = RegisterType.HOLDING
+
+SCHEMA = (
+    RegisterField("state", 10, enum=((1, "idle"), (2, "busy")), enum_default="?{}"),
+    RegisterField("busy", 10, bool_when=("==", 2)),
+    RegisterField("mode", 11, enum=((0, "off"),)),
+    RegisterField("temperature", 12, scale=10, signed=True),
+    RegisterField("energy", 13, width=2, scale=1000, tier=PollTier.MEDIUM),
+    RegisterField("offset", 15, width=2, signed=True, tier=PollTier.MEDIUM),
+    RegisterField("limit", 40, HOLDING, scale=10, writable=True),
+    RegisterField("delta", 41, HOLDING, signed=True, writable=True),
+    RegisterField("counter", 42, HOLDING, width=2, writable=True),
+)
+
+WORDS = {
+    10: 7,
+    11: 0,
+    12: 0xFF9C,  # -100
+    13: 0x0001,
+    14: 0x86A0,  # 100000
+    15: 0xFFFF,
+    16: 0xFFFE,  # -2
+    40: 160,
+    41: 3,
+    42: 0,
+    43: 9,
+}
+
+
+class _DemoCapability(Capability):
+    key = "demo"
+    schema = SCHEMA
+
+
+def test_fields_decode_as_declared():
+    assert compile_schema(SCHEMA).decode(WORDS) == {
+        "state": "?7",
+        "busy": False,
+        "mode": "off",
+        "temperature": -10.0,
+        "energy": 100.0,
+        "offset": -2,
+        "limit": 16.0,
+        "delta": 3,
+        "counter": 9,
+    }
+
+
+def test_definitions_follow_runs_and_tiers():
+    assert _DemoCapability.polled_definitions == (
+        RegisterDefinition(10, 3, RegisterType.INPUT),
+        RegisterDefinition(13, 4, RegisterType.INPUT, PollTier.MEDIUM),
+        RegisterDefinition(40, 4, HOLDING),
+    )
+    assert _DemoCapability.polled_keys[:3] == ("state", "busy", "mode")
+
+
+def test_compiled_schema_is_cached():
+    assert compile_schema(tuple(SCHEMA)) is _DemoCapability.compiled_schema
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        (RegisterField("a", 1), RegisterField("a", 2)),
+        (RegisterField("a", 1), RegisterField("b", 1, signed=True)),
+        (RegisterField("a", 1, width=2), RegisterField("b", 2)),
+        (RegisterField("a", 1, bool_when=("~", 1)),),
+        (RegisterField("a", 1, width=3),),
+    ],
+    ids=["duplicate-key", "same-register-differently", "overlap", "bad-test", "width"],
+)
+def test_inconsistent_schemas_are_rejected(schema):
+    with pytest.raises(ValueError):
+        compile_schema(schema)
+
+
+def test_writable_fields_encode_to_wire_words():
+    compiled = compile_schema(SCHEMA)
+
+    assert compiled.encode("limit", 16) == (40, [160])
+    assert compiled.encode("delta", -1) == (41, [0xFFFF])
+    assert compiled.encode("counter", 0x12345) == (42, [0x1, 0x2345])
+    assert set(compiled.encoders) == {"limit", "delta", "counter"}
+
+
+async def test_schema_capability_writes():
+    cap = _DemoCapability()
+    client = MagicMock()
+    ok = MagicMock()
+    ok.isError = MagicMock(return_value=False)
+    client.write_register = AsyncMock(return_value=ok)
+    client.write_registers = AsyncMock(return_value=ok)
+
+    assert cap.supports_write("limit") is True
+    assert cap.supports_write("state") is False
+    assert await cap.async_write(client, 1, "limit", 16) is True
+    client.write_register.assert_awaited_once_with(address=40, value=160, device_id=1)
+    await cap.async_write(client, 1, "counter", 70000)
+    client.write_registers.assert_awaited_once_with(
+        address=42, values=[1, 4464], device_id=1
+    )
+
+    ok.isError.return_value = True
+    with pytest.raises(HeidelbergEnergyControlWriteError):
+        await cap.async_write(client, 1, "delta", 1)
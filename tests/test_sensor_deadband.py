@@ -0,0 +1,139 @@
+"""Tests for per-sensor deadband filtering.
+
+Pins:
+  - changes inside the band are not written; the band is measured
+    against the last written value, so drift still gets through
+  - the relative band scales with the written value
+  - the heartbeat forces a write after enough silence
+  - availability changes are always written
+  - device-class defaults apply unless the description overrides them
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.components.sensor import SensorDeviceClass
+
+from custom_components.heidelberg_energy_control.classes import heidelberg_sensor
+from custom_components.heidelberg_energy_control.classes.heidelberg_sensor import (
+    DEFAULT_DEADBANDS,
+    NO_DEADBAND,
+    Deadband,
+    HeidelbergSensor,
+)
+from custom_components.heidelberg_energy_control.const import (
+    COMMAND_TARGET_CURRENT,
+    DATA_HW_VERSION,
+    DATA_REG_LAYOUT_VER,
+    DATA_SW_VERSION,
+    DATA_VOLTAGE_L1,
+)
+from custom_components.heidelberg_energy_control.core.capabilities import CoreCapability
+from custom_components.heidelberg_energy_control.sensor import (
+    SENSOR_TYPES,
+    HeidelbergSensorEntityDescription,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(heidelberg_sensor.time, "monotonic", clock)
+    return clock
+
+
+def _sensor(deadband: Deadband | None = None) -> tuple[HeidelbergSensor, MagicMock]:
+    coordinator = MagicMock()
+    coordinator.data = {}
+    coordinator.last_update_success = True
+    coordinator.static_data = {
+        DATA_REG_LAYOUT_VER: "1.0.7",
+        DATA_HW_VERSION: "1",
+        DATA_SW_VERSION: "1",
+    }
+    entry = MagicMock()
+    entry.entry_id = "abc"
+    description = HeidelbergSensorEntityDescription(
+        key=DATA_VOLTAGE_L1,
+        device_class=SensorDeviceClass.VOLTAGE,
+        capability=CoreCapability,
+        deadband=deadband,
+    )
+    sensor = HeidelbergSensor(coordinator, entry, description)
+    sensor.async_write_ha_state = MagicMock()
+    return sensor, coordinator
+
+
+def _push(sensor: HeidelbergSensor, coordinator: MagicMock, value) -> None:
+    coordinator.data = {DATA_VOLTAGE_L1: value}
+    sensor._handle_coordinator_update()
+
+
+def test_jitter_inside_band_is_not_written(clock):
+    sensor, coordinator = _sensor(Deadband(absolute=2.0))
+
+    for value in (230, 231, 229, 231, 230):
+        _push(sensor, coordinator, value)
+    assert sensor.async_write_ha_state.call_count == 1
+
+    # Drift accumulates against the written value, not the last poll.
+    _push(sensor, coordinator, 232)
+    assert sensor.async_write_ha_state.call_count == 2
+
+
+def test_relative_band_scales_with_value(clock):
+    sensor, coordinator = _sensor(Deadband(relative=0.05))
+
+    _push(sensor, coordinator, 200)
+    _push(sensor, coordinator, 209)  # 4.5 %
+    assert sensor.async_write_ha_state.call_count == 1
+    _push(sensor, coordinator, 211)  # 5.5 %
+    assert sensor.async_write_ha_state.call_count == 2
+
+
+def test_heartbeat_forces_a_write_after_silence(clock):
+    sensor, coordinator = _sensor(
+        Deadband(absolute=2.0, heartbeat=timedelta(minutes=5))
+    )
+
+    _push(sensor, coordinator, 230)
+    clock.now += 299
+    _push(sensor, coordinator, 231)
+    assert sensor.async_write_ha_state.call_count == 1
+
+    clock.now += 1
+    _push(sensor, coordinator, 231)
+    assert sensor.async_write_ha_state.call_count == 2
+
+
+def test_availability_change_is_always_written(clock):
+    sensor, coordinator = _sensor(Deadband(absolute=2.0))
+
+    _push(sensor, coordinator, 230)
+    coordinator.last_update_success = False
+    _push(sensor, coordinator, 230)
+    coordinator.last_update_success = True
+    _push(sensor, coordinator, 230)
+
+    assert sensor.async_write_ha_state.call_count == 3
+
+
+def test_device_class_default_and_override():
+    sensor, _ = _sensor()
+    assert sensor.deadband is DEFAULT_DEADBANDS[SensorDeviceClass.VOLTAGE]
+
+    target = next(d for d in SENSOR_TYPES if d.key == COMMAND_TARGET_CURRENT)
+    assert target.deadband is NO_DEADBAND
+    assert not NO_DEADBAND.suppresses(6.0, 6.1)
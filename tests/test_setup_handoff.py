@@ -0,0 +1,88 @@
+"""Tests for handing the config flow's API over to the entry setup.
+
+Pins:
+  - onboarding a wallbox connects and probes once: the setup right after
+    the flow reuses the flow's API, static data and capabilities
+  - an unclaimed handoff expires and releases its gateway connection
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant import config_entries
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.util import dt as dt_util
+
+from custom_components.heidelberg_energy_control.const import DOMAIN
+from custom_components.heidelberg_energy_control.core.connection import CONNECTION_POOL
+from custom_components.heidelberg_energy_control.setup_handoff import HANDOFF_TIMEOUT
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+# Registers only the setup-time probes read on a v2.0.4 box.
+_PROBED = {257, 258}
+
+_USER_INPUT = {"name": "Wallbox", "host": "handoff", "port": 502, "device_id": 1}
+
+
+def _probes(client) -> int:
+    return sum(
+        call.kwargs["address"] in _PROBED
+        for call in client.read_holding_registers.await_args_list
+    )
+
+
+async def test_setup_reuses_the_flow_connection(hass):
+    client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+
+    with patch(
+        "custom_components.heidelberg_energy_control.core.connection.AsyncModbusTcpClient",
+        return_value=client,
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], _USER_INPUT
+        )
+        await hass.async_block_till_done()
+
+        assert result["type"] is FlowResultType.CREATE_ENTRY
+        entry = result["result"]
+        assert entry.runtime_data.last_update_success
+        assert client.connect.await_count == 1
+        assert _probes(client) == 2
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unclaimed_handoff_expires(hass):
+    client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+
+    with (
+        patch(
+            "custom_components.heidelberg_energy_control.core.connection.AsyncModbusTcpClient",
+            return_value=client,
+        ),
+        patch(
+            "custom_components.heidelberg_energy_control.async_setup_entry",
+            return_value=True,
+        ),
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        await hass.config_entries.flow.async_configure(result["flow_id"], _USER_INPUT)
+        await hass.async_block_till_done()
+        assert ("handoff", 502) in CONNECTION_POOL._connections
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=HANDOFF_TIMEOUT + 1)
+        )
+        await hass.async_block_till_done()
+
+    assert ("handoff", 502) not in CONNECTION_POOL._connections
+    assert not client.connected
@@ -0,0 +1,114 @@
+"""Tests for starting up from cached static data.
+
+Pins:
+  - the first setup reads static data and probes, and caches both
+  - a later setup (restart, options change) trusts the cache: no static
+    reads or probes before the first poll
+  - background revalidation refreshes the cache while the firmware is
+    unchanged, and forgets it and reloads the entry when it changed
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.heidelberg_energy_control.const import (
+    DATA_REG_LAYOUT_VER,
+    DATA_SW_VERSION,
+    DOMAIN,
+)
+from custom_components.heidelberg_energy_control.coordinator import (
+    HeidelbergEnergyControlCoordinator,
+)
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.device_cache import DeviceCache
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+# Registers only the setup-time probes read on a v2.0.4 box.
+_PROBED = {257, 258}
+
+
+async def test_setup_trusts_the_cache(hass):
+    client = build_mock_modbus_client(load_fixture("wallbox_v2_0_4"))
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "static-cache", "port": 502, "device_id": 1},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    def _probes() -> int:
+        return sum(
+            call.kwargs["address"] in _PROBED
+            for call in client.read_holding_registers.await_args_list
+        )
+
+    with patch(
+        "custom_components.heidelberg_energy_control.core.connection.AsyncModbusTcpClient",
+        return_value=client,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert _probes() == 2
+        static = dict(entry.runtime_data.static_data)
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        client.read_input_registers.reset_mock()
+        client.read_holding_registers.reset_mock()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert _probes() == 0
+        assert entry.runtime_data.static_data == static
+        assert [cap.key for cap in entry.runtime_data.api.capabilities] == ["core"]
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+def _api() -> HeidelbergEnergyControlAPI:
+    api = HeidelbergEnergyControlAPI(host="x", port=502, device_id=1)
+    api._client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    return api
+
+
+async def _coordinator(hass, cached_version: str):
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={})
+    entry.add_to_hass(hass)
+    api = _api()
+    cache = DeviceCache(hass, entry.entry_id)
+    static = {DATA_REG_LAYOUT_VER: "1.0.7", DATA_SW_VERSION: cached_version}
+    cache.async_set_static_data(static, ["core"])
+    coord = HeidelbergEnergyControlCoordinator(
+        hass=hass,
+        api=api,
+        static_data=api.restore_static_data(static, cache.capabilities),
+        entry=entry,
+        device_cache=cache,
+    )
+    return coord, cache
+
+
+async def test_revalidation_refreshes_an_unchanged_cache(hass):
+    version = (await _api().async_read_core_static_data())[DATA_SW_VERSION]
+    coord, cache = await _coordinator(hass, version)
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        await coord.async_revalidate_static_data()
+
+    reload.assert_not_called()
+    assert cache.static_data[DATA_SW_VERSION] == version
+    assert len(cache.static_data) > 2  # hardware limits read as well
+
+
+async def test_revalidation_reloads_after_a_firmware_update(hass):
+    coord, cache = await _coordinator(hass, "0.9.9")
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        await coord.async_revalidate_static_data()
+
+    reload.assert_called_once_with(coord.entry.entry_id)
+    assert cache.static_data is None
@@ -0,0 +1,189 @@
+"""Tests for the per-connection priority transaction scheduler.
+
+Pins:
+  - waiters are granted the bus by priority class, FIFO within a class
+  - a full class queue rejects new transactions with BusyError
+  - queue-wait metrics are recorded per class
+  - a waiter cancelled while queued does not stall the scheduler
+  - end-to-end: a control write issued during a multi-block poll runs
+    before the poll's remaining block reads
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.heidelberg_energy_control.const import COMMAND_TARGET_CURRENT
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.exceptions import (
+    HeidelbergEnergyControlBusyError,
+)
+from custom_components.heidelberg_energy_control.core.registers import (
+    RegisterDefinition,
+    RegisterType,
+)
+from custom_components.heidelberg_energy_control.core.scheduler import (
+    TransactionPriority,
+    TransactionScheduler,
+)
+
+
+async def _run(scheduler, priority, label, order, release=None):
+    async with scheduler.slot(priority):
+        order.append(label)
+        if release is not None:
+            await release.wait()
+
+
+async def test_waiters_granted_by_priority_then_fifo():
+    scheduler = TransactionScheduler()
+    order: list[str] = []
+    release = asyncio.Event()
+
+    holder = asyncio.create_task(
+        _run(scheduler, TransactionPriority.SLOW_POLL, "holder", order, release)
+    )
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(_run(scheduler, priority, label, order))
+        for priority, label in (
+            (TransactionPriority.SLOW_POLL, "slow"),
+            (TransactionPriority.FAST_POLL, "fast-1"),
+            (TransactionPriority.CONTROL, "write"),
+            (TransactionPriority.FAST_POLL, "fast-2"),
+            (TransactionPriority.KEEPALIVE, "keepalive"),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == 5
+
+    release.set()
+    await asyncio.gather(holder, *waiters)
+
+    assert order == ["holder", "write", "keepalive", "fast-1", "fast-2", "slow"]
+    assert scheduler.queued == 0
+
+
+async def test_full_queue_rejects_transaction():
+    scheduler = TransactionScheduler(
+        {priority: 1 for priority in TransactionPriority}
+    )
+    release = asyncio.Event()
+    order: list[str] = []
+    holder = asyncio.create_task(
+        _run(scheduler, TransactionPriority.FAST_POLL, "holder", order, release)
+    )
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(
+        _run(scheduler, TransactionPriority.FAST_POLL, "queued", order)
+    )
+    await asyncio.sleep(0)
+
+    with pytest.raises(HeidelbergEnergyControlBusyError):
+        async with scheduler.slot(TransactionPriority.FAST_POLL):
+            pass
+
+    assert scheduler.stats[TransactionPriority.FAST_POLL].rejected == 1
+    release.set()
+    await asyncio.gather(holder, queued)
+
+
+async def test_wait_metrics_are_recorded_per_class():
+    scheduler = TransactionScheduler()
+    release = asyncio.Event()
+    order: list[str] = []
+    holder = asyncio.create_task(
+        _run(scheduler, TransactionPriority.SLOW_POLL, "holder", order, release)
+    )
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(
+        _run(scheduler, TransactionPriority.CONTROL, "write", order)
+    )
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(holder, waiter)
+
+    control = scheduler.stats[TransactionPriority.CONTROL]
+    assert control.transactions == 1
+    assert control.max_wait >= 0.01
+    assert control.as_dict()["average_wait"] == round(control.max_wait, 4)
+    assert scheduler.stats[TransactionPriority.SLOW_POLL].max_wait < 0.01
+
+
+async def test_cancelled_waiter_does_not_stall_the_bus():
+    scheduler = TransactionScheduler()
+    release = asyncio.Event()
+    order: list[str] = []
+    holder = asyncio.create_task(
+        _run(scheduler, TransactionPriority.FAST_POLL, "holder", order, release)
+    )
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(
+        _run(scheduler, TransactionPriority.CONTROL, "cancelled", order)
+    )
+    later = asyncio.create_task(
+        _run(scheduler, TransactionPriority.FAST_POLL, "later", order)
+    )
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+    await asyncio.gather(holder, later)
+
+    assert order == ["holder", "later"]
+
+
+async def test_write_preempts_remaining_poll_blocks():
+    api = HeidelbergEnergyControlAPI(
+        host="gw-priority", port=502, device_id=1, max_gap=0
+    )
+    order: list[str] = []
+    first_read_started = asyncio.Event()
+    finish_first_read = asyncio.Event()
+
+    def _ok(registers):
+        rr = MagicMock()
+        rr.isError = MagicMock(return_value=False)
+        rr.registers = registers
+        return rr
+
+    async def _read(address, count, device_id):
+        order.append(f"read {address}")
+        if address == 5:
+            first_read_started.set()
+            await finish_first_read.wait()
+        return _ok([0] * count)
+
+    async def _write(address, value, device_id):
+        order.append(f"write {address}")
+        return _ok([value])
+
+    client = MagicMock()
+    client.connected = True
+    client.read_input_registers = AsyncMock(side_effect=_read)
+    client.write_register = AsyncMock(side_effect=_write)
+    api._client = client
+
+    poll = asyncio.create_task(
+        api.async_read_registers(
+            [
+                RegisterDefinition(5, 1, RegisterType.INPUT),
+                RegisterDefinition(100, 1, RegisterType.INPUT),
+                RegisterDefinition(200, 1, RegisterType.INPUT),
+            ],
+            TransactionPriority.FAST_POLL,
+        )
+    )
+    await first_read_started.wait()
+    write = asyncio.create_task(api.async_write_command(COMMAND_TARGET_CURRENT, 160))
+    await asyncio.sleep(0)
+    finish_first_read.set()
+    await asyncio.gather(poll, write)
+
+    assert order == ["read 5", "write 261", "read 100", "read 200"]
+    assert api.transaction_stats["control"]["transactions"] == 1
+    await api.disconnect()
@@ -0,0 +1,146 @@
+"""Tests for the watchdog keep-alive.
+
+Pins:
+  - a keep-alive is due once no transaction happened for
+    KEEPALIVE_FRACTION of the watchdog timeout, and right away before
+    the first one
+  - the keep-alive is one single-register holding read at KEEPALIVE
+    priority, and counts as a transaction like poll reads do
+  - a rejected keep-alive raises a read error
+  - failed keep-alives back off exponentially, capped at
+    KEEPALIVE_FRACTION of the timeout
+  - the coordinator keeps sending them at the last known timeout before
+    the first poll and while polls fail
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.heidelberg_energy_control.const import (
+    COMMAND_WATCHDOG_TIMEOUT,
+    DATA_HW_MAX_CURR,
+    DATA_REG_LAYOUT_VER,
+)
+from custom_components.heidelberg_energy_control.coordinator import (
+    HeidelbergEnergyControlCoordinator,
+)
+from custom_components.heidelberg_energy_control.core.api import (
+    HeidelbergEnergyControlAPI,
+)
+from custom_components.heidelberg_energy_control.core.exceptions import (
+    HeidelbergEnergyControlConnectionError,
+    HeidelbergEnergyControlReadError,
+)
+from custom_components.heidelberg_energy_control.core.keepalive import (
+    KEEPALIVE_FRACTION,
+    KEEPALIVE_MIN_RETRY,
+    KeepaliveStats,
+    keepalive_due_in,
+    keepalive_retry_in,
+)
+
+from .conftest import build_mock_modbus_client, load_fixture
+
+
+def test_keepalive_due_in():
+    assert keepalive_due_in(10.0, None) == 0.0
+    assert keepalive_due_in(10.0, 1.0) == pytest.approx(10.0 * KEEPALIVE_FRACTION - 1)
+    assert keepalive_due_in(10.0, 10.0) == 0.0
+
+
+def test_keepalive_retry_backs_off_up_to_the_due_share():
+    assert keepalive_retry_in(30.0, 1) == 3.0
+    assert keepalive_retry_in(30.0, 2) == 6.0
+    assert keepalive_retry_in(30.0, 3) == 12.0
+    assert keepalive_retry_in(30.0, 10) == 30.0 * KEEPALIVE_FRACTION
+    assert keepalive_retry_in(1.0, 1) == KEEPALIVE_MIN_RETRY
+    assert keepalive_retry_in(1.0, 5) == KEEPALIVE_MIN_RETRY
+
+
+def test_stats_track_duration_and_silence():
+    stats = KeepaliveStats()
+    stats.record_sent(0.2, 4.0)
+    stats.record_sent(0.1, None)
+    stats.record_failure("timeout")
+
+    assert stats.as_dict() == {
+        "sent": 2,
+        "failed": 1,
+        "last_duration": 0.1,
+        "max_duration": 0.2,
+        "max_silence": 4.0,
+        "last_error": "timeout",
+    }
+
+
+async def test_keepalive_reads_one_holding_register():
+    api = HeidelbergEnergyControlAPI(host="keepalive", port=502, device_id=1)
+    client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    api._client = client
+    assert api.seconds_since_transaction is None
+
+    await api.async_keepalive()
+
+    client.read_holding_registers.assert_awaited_once_with(
+        address=261, count=1, device_id=1
+    )
+    client.read_input_registers.assert_not_awaited()
+    assert api.seconds_since_transaction is not None
+    assert api.transaction_stats["keepalive"]["transactions"] == 1
+    await api.disconnect()
+
+
+async def test_rejected_keepalive_raises():
+    api = HeidelbergEnergyControlAPI(host="keepalive-rejected", port=502, device_id=1)
+    client = build_mock_modbus_client(load_fixture("wallbox_v1_0_7"))
+    rejected = MagicMock()
+    rejected.isError = MagicMock(return_value=True)
+    client.read_holding_registers = AsyncMock(return_value=rejected)
+    api._client = client
+
+    with pytest.raises(HeidelbergEnergyControlReadError):
+        await api.async_keepalive()
+    assert api.seconds_since_transaction is None
+    await api.disconnect()
+
+
+async def test_keepalive_loop_runs_while_polls_fail(hass, mock_api):
+    """No successful poll yet: keep-alives still go out, backing off on failure."""
+    entry = MagicMock()
+    entry.options = {}
+    coord = HeidelbergEnergyControlCoordinator(
+        hass=hass,
+        api=mock_api,
+        static_data={DATA_REG_LAYOUT_VER: "1.0.8", DATA_HW_MAX_CURR: 16},
+        entry=entry,
+    )
+    # Restored from the last run; the wallbox hasn't answered since.
+    coord.data[COMMAND_WATCHDOG_TIMEOUT] = 30000
+    coord.last_update_success = False
+    mock_api.seconds_since_transaction = None
+    mock_api.async_keepalive = AsyncMock(
+        side_effect=HeidelbergEnergyControlConnectionError("offline")
+    )
+    waits: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        waits.append(seconds)
+        if len(waits) == 3:
+            raise asyncio.CancelledError
+
+    with (
+        patch(
+            "custom_components.heidelberg_energy_control.coordinator.asyncio.sleep",
+            _sleep,
+        ),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await coord._async_keepalive_loop()
+
+    assert mock_api.async_keepalive.await_count == 3
+    assert waits == [3.0, 6.0, 12.0]
+    assert coord.keepalive_stats.failed == 3